@@ -124,6 +124,24 @@ def get_basepools_for_coin(_coin: address) -> DynArray[address, 1000]:
     return self._get_basepools_for_coin(_coin)
 
 
+@external
+@view
+def get_pools(_offset: uint256, _limit: uint256) -> DynArray[address, 100]:
+    """
+    @notice Gets a page of `base_pool_list`
+    @dev Fewer base pools than `_limit` means the end of the list was reached
+    @param _offset Index of the first base pool in `base_pool_list`
+    @param _limit Maximum number of base pools to return
+    @return basepool addresses
+    """
+    _base_pools: DynArray[address, 100] = empty(DynArray[address, 100])
+    for i in range(100):
+        if i == _limit or _offset + i >= self.base_pool_count:
+            break
+        _base_pools.append(self.base_pool_list[_offset + i])
+    return _base_pools
+
+
 @external
 @view
 def get_decimals(_pool: address) -> uint256[MAX_COINS]:
@@ -7,6 +7,14 @@
 
 MAX_COINS: constant(int128) = 8
 CALC_INPUT_SIZE: constant(int128) = 100
+MAX_CHANGES: constant(uint256) = 1024  # length of the change ring buffer
+MAX_CHANGES_PAGE: constant(uint256) = 100
+MAX_PAGE_SIZE: constant(uint256) = 1000
+
+# change kinds
+CHANGE_POOL_ADDED: constant(uint256) = 1
+CHANGE_POOL_REMOVED: constant(uint256) = 2
+CHANGE_GAUGES: constant(uint256) = 3
 
 
 struct CoinInfo:
@@ -24,6 +32,12 @@ struct PoolArray:
     has_positive_rebasing_tokens: bool
 
 
+struct Change:
+    seq: uint256
+    pool: address
+    kind: uint256
+
+
 interface AddressProvider:
     def admin() -> address: view
     def get_address(_id: uint256) -> address: view
@@ -78,6 +92,24 @@ event BasePoolAdded:
 event PoolRemoved:
     pool: indexed(address)
 
+event PoolRegistered:
+    pool: indexed(address)
+    lp_token: indexed(address)
+    base_pool: address
+    zap: address
+    coins: address[MAX_COINS]
+    underlying_coins: address[MAX_COINS]
+    # decimals are tightly packed as uint8 in a little-endian uint256
+    decimals: uint256
+    underlying_decimals: uint256
+    # [n_coins: uint8, has_positive_rebasing_tokens: bit]
+    flags: uint256
+    name: String[64]
+
+event LiquidityGaugesUpdated:
+    pool: indexed(address)
+    gauges: address[10]
+
 
 GAUGE_CONTROLLER: constant(address) = 0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB
 
@@ -112,6 +144,11 @@ get_zap: public(HashMap[address, address])
 
 last_updated: public(uint256)
 
+# sequence number of the last change
+change_count: public(uint256)
+# seq % MAX_CHANGES -> pool + shift(kind, 160)
+changes: HashMap[uint256, uint256]
+
 
 @external
 def __init__(_address_provider: address, _base_pool_registry: address):
@@ -152,6 +189,16 @@ def _get_decimals(_coins: address[MAX_COINS]) -> uint256[MAX_COINS]:
     return decimals
 
 
+@view
+@internal
+def _pack_decimals(_coins: address[MAX_COINS]) -> uint256:
+    decimals: uint256[MAX_COINS] = self._get_decimals(_coins)
+    packed: uint256 = 0
+    for i in range(MAX_COINS):
+        packed += shift(decimals[i], i * 8)
+    return packed
+
+
 @view
 @internal
 def _get_underlying_coins_for_metapool(_pool: address) -> address[MAX_COINS]:
@@ -612,6 +659,75 @@ def get_pool_name(_pool: address) -> String[64]:
     return self.pool_data[_pool].name
 
 
+@view
+@external
+def get_changes_since(_seq: uint256) -> DynArray[Change, MAX_CHANGES_PAGE]:
+    """
+    @notice Get the changes made after a sequence number
+    @dev Returns at most `MAX_CHANGES_PAGE` changes; call again with the `seq`
+         of the last one to continue. Only the last `MAX_CHANGES` changes are
+         kept, so a poller that falls further behind must re-read `pool_list`.
+    @param _seq Sequence number of the last change already seen
+    @return Changes in the order they were made
+    """
+    changes: DynArray[Change, MAX_CHANGES_PAGE] = []
+    count: uint256 = self.change_count
+    if _seq >= count:
+        return changes
+    assert _seq + MAX_CHANGES >= count  # dev: changes overwritten
+
+    for seq in range(_seq + 1, _seq + 1 + MAX_CHANGES_PAGE):
+        if seq > count:
+            break
+        packed: uint256 = self.changes[seq % MAX_CHANGES]
+        changes.append(
+            Change({seq: seq, pool: convert(packed % 2**160, address), kind: shift(packed, -160)})
+        )
+    return changes
+
+
+@view
+@external
+def get_pools(_offset: uint256, _limit: uint256) -> DynArray[address, MAX_PAGE_SIZE]:
+    """
+    @notice Get a page of `pool_list`
+    @dev At most `MAX_PAGE_SIZE` pools are returned, regardless of `_limit`.
+         Fewer pools than this means the end of the list was reached.
+    @param _offset Index of the first pool in `pool_list`
+    @param _limit Maximum number of pools to return
+    @return Pool addresses, in `pool_list` order
+    """
+    pool_count: uint256 = self.pool_count
+
+    pools: DynArray[address, MAX_PAGE_SIZE] = []
+    for i in range(MAX_PAGE_SIZE):
+        if i == _limit or _offset + i >= pool_count:
+            break
+        pools.append(self.pool_list[_offset + i])
+    return pools
+
+
+@view
+@external
+def get_coins_page(_offset: uint256, _limit: uint256) -> DynArray[address, MAX_PAGE_SIZE]:
+    """
+    @notice Get a page of the unique coins given by `get_coin`
+    @dev At most `MAX_PAGE_SIZE` coins are returned, regardless of `_limit`.
+         Fewer coins than this means the end of the list was reached.
+    @param _offset Index of the first coin
+    @param _limit Maximum number of coins to return
+    @return Coin addresses, in `get_coin` order
+    """
+    coin_count: uint256 = self.coin_count
+
+    coins: DynArray[address, MAX_PAGE_SIZE] = []
+    for i in range(MAX_PAGE_SIZE):
+        if i == _limit or _offset + i >= coin_count:
+            break
+        coins.append(self.get_coin[_offset + i])
+    return coins
+
+
 # internal functionality used in admin setters
 
 @internal
@@ -765,6 +881,13 @@ def _remove_market(_pool: address, _coina: address, _coinb: address):
             break
 
 
+@internal
+def _log_change(_pool: address, _kind: uint256):
+    seq: uint256 = self.change_count + 1
+    self.changes[seq % MAX_CHANGES] = convert(_pool, uint256) + shift(_kind, 160)
+    self.change_count = seq
+
+
 @internal
 def _remove_liquidity_gauges(_pool: address):
     for i in range(10):
@@ -832,21 +955,39 @@ def add_pool(
 
     # the following does not add basepool_lp_token <> underlying_coin mapping
     # since that is redundant:
+    _underlying_coins: address[MAX_COINS] = _coins
     if _base_pool != empty(address):
         assert self.base_pool_registry.get_lp_token(_base_pool) != empty(address)
         self.pool_data[_pool].base_pool = _base_pool
 
-        _underlying_coins: address[MAX_COINS] = self._get_underlying_coins_for_metapool(_pool)
+        _underlying_coins = self._get_underlying_coins_for_metapool(_pool)
         assert _underlying_coins[0] != empty(address)
 
         self._add_coins_to_market(_pool, _underlying_coins, True)
 
+    flags: uint256 = _n_coins
     if _has_positive_rebasing_tokens:
         self.pool_data[_pool].has_positive_rebasing_tokens = True
+        flags += shift(1, 8)
 
     # log pool added:
     self.last_updated = block.timestamp
+    self._log_change(_pool, CHANGE_POOL_ADDED)
     log PoolAdded(_pool)
+    log PoolRegistered(
+        _pool,
+        _lp_token,
+        _base_pool,
+        _zap,
+        _coins,
+        _underlying_coins,
+        self._pack_decimals(_coins),
+        self._pack_decimals(_underlying_coins),
+        flags,
+        _name,
+    )
+    if _gauge != empty(address):
+        log LiquidityGaugesUpdated(_pool, self.liquidity_gauges[_pool])
 
 
 @external
@@ -918,6 +1059,7 @@ def remove_pool(_pool: address):
     self._remove_liquidity_gauges(_pool)
 
     self.last_updated = block.timestamp
+    self._log_change(_pool, CHANGE_POOL_REMOVED)
     log PoolRemoved(_pool)
 
 
@@ -941,6 +1083,8 @@ def set_liquidity_gauges(_pool: address, _liquidity_gauges: address[10]):
         else:
             break
     self.last_updated = block.timestamp
+    self._log_change(_pool, CHANGE_GAUGES)
+    log LiquidityGaugesUpdated(_pool, self.liquidity_gauges[_pool])
 
 
 @external
@@ -959,5 +1103,7 @@ def batch_set_liquidity_gauges(_pools: address[10], _liquidity_gauges: address[1
         _gauge: address = _liquidity_gauges[i]
         assert LiquidityGauge(_gauge).lp_token() == self.get_lp_token[_pool]  # dev: wrong token
         self.liquidity_gauges[_pool][0] = _gauge
+        self._log_change(_pool, CHANGE_GAUGES)
+        log LiquidityGaugesUpdated(_pool, self.liquidity_gauges[_pool])
 
     self.last_updated = block.timestamp
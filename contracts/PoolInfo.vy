@@ -1,4 +1,4 @@
-# @version 0.2.7
+# @version 0.3.7
 """
 @title Curve Registry PoolInfo
 @license MIT
@@ -7,6 +7,10 @@
 """
 
 MAX_COINS: constant(int128) = 8
+MAX_POOLS: constant(uint256) = 50
+MAX_EDGES: constant(uint256) = 100
+MAX_EDGE_STEPS: constant(uint256) = 400
+MAX_PAGE_SIZE: constant(uint256) = 1000
 
 
 interface AddressProvider:
@@ -18,13 +22,21 @@ interface Registry:
     def get_underlying_coins(_pool: address) -> address[MAX_COINS]: view
     def get_decimals(_pool: address) -> uint256[MAX_COINS]: view
     def get_underlying_decimals(_pool: address) -> uint256[MAX_COINS]: view
-    def get_balances(_pool: address) -> uint256[MAX_COINS]: view
-    def get_underlying_balances(_pool: address) -> uint256[MAX_COINS]: view
-    def get_rates(_pool: address) -> uint256[MAX_COINS]: view
+    def get_balances_and_rates(_pool: address) -> (
+        uint256[MAX_COINS], uint256[MAX_COINS], uint256[MAX_COINS]
+    ): view
     def get_lp_token(_pool: address) -> address: view
     def get_parameters(_pool: address) -> PoolParams: view
     def is_meta(_pool: address) -> bool: view
     def get_pool_name(_pool: address) -> String[64]: view
+    def pool_count() -> uint256: view
+    def pool_list(_index: uint256) -> address: view
+    def coin_count() -> uint256: view
+    def get_coin(_index: uint256) -> address: view
+    def get_coin_swap_count(_coin: address) -> uint256: view
+    def get_coin_swap_complement(_coin: address, _index: uint256) -> address: view
+    def find_pool_for_coins(_from: address, _to: address, i: uint256) -> address: view
+    def get_coin_indices(_pool: address, _from: address, _to: address) -> (int128, int128, bool): view
 
 
 struct PoolParams:
@@ -56,6 +68,14 @@ struct PoolCoins:
     decimals: uint256[MAX_COINS]
     underlying_decimals: uint256[MAX_COINS]
 
+struct SwapEdge:
+    coin: address
+    complement: address
+    pool: address
+    i: int128
+    j: int128
+    is_underlying: bool
+
 
 address_provider: public(AddressProvider)
 
@@ -84,6 +104,27 @@ def get_pool_coins(_pool: address) -> PoolCoins:
     })
 
 
+@view
+@internal
+def _get_pool_info(_registry: address, _pool: address) -> PoolInfo:
+    balances: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+    underlying_balances: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+    rates: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+    balances, underlying_balances, rates = Registry(_registry).get_balances_and_rates(_pool)
+
+    return PoolInfo({
+        balances: balances,
+        underlying_balances: underlying_balances,
+        decimals: Registry(_registry).get_decimals(_pool),
+        underlying_decimals: Registry(_registry).get_underlying_decimals(_pool),
+        rates: rates,
+        lp_token: Registry(_registry).get_lp_token(_pool),
+        params: Registry(_registry).get_parameters(_pool),
+        is_meta: Registry(_registry).is_meta(_pool),
+        name: Registry(_registry).get_pool_name(_pool),
+    })
+
+
 @view
 @external
 def get_pool_info(_pool: address) -> PoolInfo:
@@ -94,16 +135,163 @@ def get_pool_info(_pool: address) -> PoolInfo:
     @return balances, underlying balances, decimals, underlying decimals,
             lp token, amplification coefficient, fees
     """
+    return self._get_pool_info(self.address_provider.get_registry(), _pool)
+
+
+@view
+@external
+def get_pool_infos(_pools: DynArray[address, MAX_POOLS]) -> DynArray[PoolInfo, MAX_POOLS]:
+    """
+    @notice Get information on many pools
+    @dev Reverts if any pool address is unknown
+    @param _pools Pool addresses
+    @return Information on each pool, in the same order as `_pools`
+    """
     registry: address = self.address_provider.get_registry()
 
-    return PoolInfo({
-        balances: Registry(registry).get_balances(_pool),
-        underlying_balances: Registry(registry).get_underlying_balances(_pool),
-        decimals: Registry(registry).get_decimals(_pool),
-        underlying_decimals: Registry(registry).get_underlying_decimals(_pool),
-        rates: Registry(registry).get_rates(_pool),
-        lp_token: Registry(registry).get_lp_token(_pool),
-        params: Registry(registry).get_parameters(_pool),
-        is_meta: Registry(registry).is_meta(_pool),
-        name: Registry(registry).get_pool_name(_pool),
-    })
+    pool_infos: DynArray[PoolInfo, MAX_POOLS] = []
+    for pool in _pools:
+        pool_infos.append(self._get_pool_info(registry, pool))
+    return pool_infos
+
+
+@view
+@external
+def get_all_pool_infos(_offset: uint256, _limit: uint256) -> DynArray[PoolInfo, MAX_POOLS]:
+    """
+    @notice Get information on a page of pools from the registry's `pool_list`
+    @dev At most `MAX_POOLS` pools are returned, regardless of `_limit`.
+         Fewer pools than this means the end of the list was reached.
+    @param _offset Index of the first pool in `pool_list`
+    @param _limit Maximum number of pools to return
+    @return Information on each pool, in `pool_list` order
+    """
+    registry: address = self.address_provider.get_registry()
+    pool_count: uint256 = Registry(registry).pool_count()
+
+    pool_infos: DynArray[PoolInfo, MAX_POOLS] = []
+    for i in range(MAX_POOLS):
+        if i == _limit or _offset + i >= pool_count:
+            break
+        pool: address = Registry(registry).pool_list(_offset + i)
+        pool_infos.append(self._get_pool_info(registry, pool))
+    return pool_infos
+
+
+@view
+@external
+def get_pools(_offset: uint256, _limit: uint256) -> DynArray[address, MAX_PAGE_SIZE]:
+    """
+    @notice Get a page of the registry's `pool_list`
+    @dev At most `MAX_PAGE_SIZE` pools are returned, regardless of `_limit`.
+         Fewer pools than this means the end of the list was reached.
+    @param _offset Index of the first pool in `pool_list`
+    @param _limit Maximum number of pools to return
+    @return Pool addresses, in `pool_list` order
+    """
+    registry: address = self.address_provider.get_registry()
+    pool_count: uint256 = Registry(registry).pool_count()
+
+    pools: DynArray[address, MAX_PAGE_SIZE] = []
+    for i in range(MAX_PAGE_SIZE):
+        if i == _limit or _offset + i >= pool_count:
+            break
+        pools.append(Registry(registry).pool_list(_offset + i))
+    return pools
+
+
+@view
+@external
+def get_coins_page(_offset: uint256, _limit: uint256) -> DynArray[address, MAX_PAGE_SIZE]:
+    """
+    @notice Get a page of the registry's unique coins, as given by `get_coin`
+    @dev At most `MAX_PAGE_SIZE` coins are returned, regardless of `_limit`.
+         Fewer coins than this means the end of the list was reached.
+    @param _offset Index of the first coin
+    @param _limit Maximum number of coins to return
+    @return Coin addresses, in `get_coin` order
+    """
+    registry: address = self.address_provider.get_registry()
+    coin_count: uint256 = Registry(registry).coin_count()
+
+    coins: DynArray[address, MAX_PAGE_SIZE] = []
+    for i in range(MAX_PAGE_SIZE):
+        if i == _limit or _offset + i >= coin_count:
+            break
+        coins.append(Registry(registry).get_coin(_offset + i))
+    return coins
+
+
+@view
+@external
+def get_swap_edges(_cursor: uint256[3]) -> (DynArray[SwapEdge, MAX_EDGES], uint256[3]):
+    """
+    @notice Get a page of the registry's swap graph
+    @dev Returns one edge for every pool in every market, in place of separate
+         `get_coin`, `get_coin_swap_complement`, `find_pool_for_coins` and
+         `get_coin_indices` calls. Each market is returned once, from the coin
+         with the lower address. Start from a cursor of [0, 0, 0] and pass the
+         returned cursor to get the next page. The graph is complete once the
+         first value of the returned cursor is the registry's `coin_count`.
+         A page may hold fewer than `MAX_EDGES` edges before then.
+    @param _cursor [`get_coin` index, `get_coin_swap_complement` index,
+                   `find_pool_for_coins` index] of the first edge
+    @return Edges, cursor for the next page
+    """
+    registry: address = self.address_provider.get_registry()
+    coin_count: uint256 = Registry(registry).coin_count()
+
+    coin_idx: uint256 = _cursor[0]
+    swap_idx: uint256 = _cursor[1]
+    pool_idx: uint256 = _cursor[2]
+    coin: address = ZERO_ADDRESS
+    swap_count: uint256 = 0
+    complement: address = ZERO_ADDRESS
+
+    edges: DynArray[SwapEdge, MAX_EDGES] = []
+    for step in range(MAX_EDGE_STEPS):
+        if coin_idx >= coin_count or len(edges) == MAX_EDGES:
+            break
+
+        if coin == ZERO_ADDRESS:
+            coin = Registry(registry).get_coin(coin_idx)
+            swap_count = Registry(registry).get_coin_swap_count(coin)
+        if swap_idx >= swap_count:
+            coin_idx += 1
+            swap_idx = 0
+            pool_idx = 0
+            coin = ZERO_ADDRESS
+            continue
+
+        if complement == ZERO_ADDRESS:
+            complement = Registry(registry).get_coin_swap_complement(coin, swap_idx)
+            if convert(complement, uint256) < convert(coin, uint256):
+                # the market is returned from `complement`
+                swap_idx += 1
+                complement = ZERO_ADDRESS
+                continue
+
+        pool: address = Registry(registry).find_pool_for_coins(coin, complement, pool_idx)
+        if pool == ZERO_ADDRESS:
+            swap_idx += 1
+            pool_idx = 0
+            complement = ZERO_ADDRESS
+            continue
+
+        i: int128 = 0
+        j: int128 = 0
+        is_underlying: bool = False
+        i, j, is_underlying = Registry(registry).get_coin_indices(pool, coin, complement)
+        edges.append(
+            SwapEdge({
+                coin: coin,
+                complement: complement,
+                pool: pool,
+                i: i,
+                j: j,
+                is_underlying: is_underlying,
+            })
+        )
+        pool_idx += 1
+
+    return edges, [coin_idx, swap_idx, pool_idx]
@@ -1,4 +1,4 @@
-# @version 0.2.11
+# @version 0.3.7
 """
 @title Curve Registry
 @license MIT
@@ -7,6 +7,15 @@
 
 MAX_COINS: constant(int128) = 8
 CALC_INPUT_SIZE: constant(int128) = 100
+MAX_CHANGES: constant(uint256) = 1024  # length of the change ring buffer
+MAX_CHANGES_PAGE: constant(uint256) = 100
+
+# change kinds
+CHANGE_POOL_ADDED: constant(uint256) = 1
+CHANGE_POOL_REMOVED: constant(uint256) = 2
+CHANGE_GAUGES: constant(uint256) = 3
+CHANGE_ASSET_TYPE: constant(uint256) = 4
+CHANGE_GAS_ESTIMATE: constant(uint256) = 5
 
 
 struct CoinInfo:
@@ -16,18 +25,22 @@ struct CoinInfo:
     swap_for: address[MAX_INT128]
 
 struct PoolArray:
-    location: uint256
+    # tightly packed as [n_coins: uint8, n_underlying_coins: uint8, has_initial_A: bit,
+    # is_v1: bit, 6 unused bits, location: uint64, asset_type: uint168]
+    info: uint256
     decimals: uint256
     underlying_decimals: uint256
+    # [wrapped coin bitmask: uint8, 7 unused bytes, rate calculator: address, method id: bytes4]
     rate_info: bytes32
     base_pool: address
     coins: address[MAX_COINS]
     ul_coins: address[MAX_COINS]
-    n_coins: uint256  # [coins, underlying coins] tightly packed as uint128[2]
-    has_initial_A: bool
-    is_v1: bool
     name: String[64]
-    asset_type: uint256
+
+struct Change:
+    seq: uint256
+    pool: address  # for coin gas estimates, the coin
+    kind: uint256
 
 struct PoolParams:
     A: uint256
@@ -95,6 +108,39 @@ event PoolAdded:
 event PoolRemoved:
     pool: indexed(address)
 
+event PoolRegistered:
+    pool: indexed(address)
+    lp_token: indexed(address)
+    base_pool: address
+    coins: address[MAX_COINS]
+    underlying_coins: address[MAX_COINS]
+    decimals: uint256
+    underlying_decimals: uint256
+    rate_info: bytes32
+    # [n_coins: uint8, n_underlying_coins: uint8, has_initial_A: bit, is_v1: bit]
+    flags: uint256
+    name: String[64]
+
+event LiquidityGaugesUpdated:
+    pool: indexed(address)
+    gauges: address[10]
+
+event PoolAssetTypeUpdated:
+    pool: indexed(address)
+    asset_type: uint256
+
+event PoolGasEstimatesUpdated:
+    pool: indexed(address)
+    amounts: uint256[2]
+
+event CoinGasEstimateUpdated:
+    coin: indexed(address)
+    amount: uint256
+
+event GasEstimateContractUpdated:
+    pool: indexed(address)
+    estimator: address
+
 
 address_provider: public(AddressProvider)
 gauge_controller: public(address)
@@ -103,6 +149,10 @@ pool_count: public(uint256)         # actual length of pool_list
 
 pool_data: HashMap[address, PoolArray]
 
+# pool -> coin -> positions, as uint8[2] tightly packed in a uint256
+# [index in coins + 1, index in underlying coins + 1], zero if not present
+coin_positions: HashMap[address, HashMap[address, uint256]]
+
 coin_count: public(uint256)  # total unique coins registered
 coins: HashMap[address, CoinInfo]
 get_coin: public(address[65536])  # unique list of registered coins
@@ -136,6 +186,11 @@ liquidity_gauges: HashMap[address, address[10]]
 
 last_updated: public(uint256)
 
+# sequence number of the last change
+change_count: public(uint256)
+# seq % MAX_CHANGES -> pool + shift(kind, 160)
+changes: HashMap[uint256, uint256]
+
 
 @external
 def __init__(_address_provider: address, _gauge_controller: address):
@@ -169,17 +224,23 @@ def _get_rates(_pool: address) -> uint256[MAX_COINS]:
     rates: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
     base_pool: address = self.pool_data[_pool].base_pool
     if base_pool == ZERO_ADDRESS:
-        rate_info: bytes32 = self.pool_data[_pool].rate_info
-        rate_calc_addr: uint256 = convert(slice(rate_info, 8, 20), uint256)
-        rate_method_id: Bytes[4] = slice(rate_info, 28, 4)
+        rate_info: uint256 = convert(self.pool_data[_pool].rate_info, uint256)
+        rate_calc_addr: uint256 = shift(rate_info, -32) % 2**160
+        rate_method_id: Bytes[4] = slice(convert(rate_info, bytes32), 28, 4)
+        # only coins flagged in the wrapped coin bitmask are queried for rates
+        wrapped: uint256 = 0
+        if rate_info % 2**248 != 0:
+            wrapped = shift(rate_info, -248)
+        n_coins: int128 = convert(self.pool_data[_pool].info % 256, int128)
 
         for i in range(MAX_COINS):
-            coin: address = self.pool_data[_pool].coins[i]
-            if coin == ZERO_ADDRESS:
+            if i == n_coins:
                 break
-            if rate_info == EMPTY_BYTES32 or coin == self.pool_data[_pool].ul_coins[i]:
+            if shift(wrapped, -i) % 2 == 0:
                 rates[i] = 10 ** 18
-            elif rate_calc_addr != 0:
+                continue
+            coin: address = self.pool_data[_pool].coins[i]
+            if rate_calc_addr != 0:
                 rates[i] = RateCalc(convert(rate_calc_addr, address)).get_rate(coin)
             else:
                 rates[i] = convert(
@@ -187,10 +248,10 @@ def _get_rates(_pool: address) -> uint256[MAX_COINS]:
                     uint256
                 )
     else:
-        base_coin_idx: uint256 = shift(self.pool_data[_pool].n_coins, -128) - 1
+        base_coin_idx: uint256 = self.pool_data[_pool].info % 256 - 1
         rates[base_coin_idx] = CurvePool(base_pool).get_virtual_price()
         for i in range(MAX_COINS):
-            if i == base_coin_idx:
+            if i == convert(base_coin_idx, int128):
                 break
             rates[i] = 10 ** 18
 
@@ -199,17 +260,20 @@ def _get_rates(_pool: address) -> uint256[MAX_COINS]:
 @view
 @internal
 def _get_balances(_pool: address) -> uint256[MAX_COINS]:
-    is_v1: bool = self.pool_data[_pool].is_v1
+    info: uint256 = self.pool_data[_pool].info
+    n_coins: int128 = convert(info % 256, int128)
+    assert n_coins != 0
 
     balances: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
-    for i in range(MAX_COINS):
-        if self.pool_data[_pool].coins[i] == ZERO_ADDRESS:
-            assert i != 0
-            break
-
-        if is_v1:
+    if shift(info, -17) % 2 == 1:
+        for i in range(MAX_COINS):
+            if i == n_coins:
+                break
             balances[i] = CurvePoolV1(_pool).balances(i)
-        else:
+    else:
+        for i in range(MAX_COINS):
+            if i == n_coins:
+                break
             balances[i] = CurvePool(_pool).balances(convert(i, uint256))
 
     return balances
@@ -217,49 +281,59 @@ def _get_balances(_pool: address) -> uint256[MAX_COINS]:
 
 @view
 @internal
-def _get_underlying_balances(_pool: address) -> uint256[MAX_COINS]:
-    balances: uint256[MAX_COINS] = self._get_balances(_pool)
-    rates: uint256[MAX_COINS] = self._get_rates(_pool)
+def _get_underlying_balances(
+    _pool: address,
+    _balances: uint256[MAX_COINS],
+    _rates: uint256[MAX_COINS]
+) -> uint256[MAX_COINS]:
     decimals: uint256 = self.pool_data[_pool].underlying_decimals
-    underlying_balances: uint256[MAX_COINS] = balances
+    n_coins: int128 = convert(self.pool_data[_pool].info % 256, int128)
+    wrapped: uint256 = shift(convert(self.pool_data[_pool].rate_info, uint256), -248)
+    underlying_balances: uint256[MAX_COINS] = _balances
     for i in range(MAX_COINS):
-        coin: address = self.pool_data[_pool].coins[i]
-        if coin == ZERO_ADDRESS:
+        if i == n_coins:
             break
-        ucoin: address = self.pool_data[_pool].ul_coins[i]
-        if ucoin == ZERO_ADDRESS:
+        if shift(wrapped, -i) % 2 == 0:
             continue
-        if ucoin != coin:
-            underlying_balances[i] = balances[i] * rates[i] / 10**(shift(decimals, -8 * i) % 256)
+        if self.pool_data[_pool].ul_coins[i] != ZERO_ADDRESS:
+            underlying_balances[i] = _balances[i] * _rates[i] / 10**(shift(decimals, -8 * i) % 256)
 
     return underlying_balances
 
 
 @view
 @internal
-def _get_meta_underlying_balances(_pool: address, _base_pool: address) -> uint256[MAX_COINS]:
-    base_coin_idx: uint256 = shift(self.pool_data[_pool].n_coins, -128) - 1
-    is_v1: bool = self.pool_data[_base_pool].is_v1
+def _get_meta_underlying_balances(
+    _pool: address,
+    _base_pool: address,
+    _balances: uint256[MAX_COINS]
+) -> uint256[MAX_COINS]:
+    info: uint256 = self.pool_data[_pool].info
+    base_coin_idx: int128 = convert(info % 256 - 1, int128)
+    base_n_coins: int128 = convert(shift(info, -8) % 256, int128) - base_coin_idx
+    base_info: uint256 = self.pool_data[_base_pool].info
     base_total_supply: uint256 = ERC20(self.get_lp_token[_base_pool]).totalSupply()
 
-    underlying_balances: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
-    ul_balance: uint256 = 0
+    underlying_balances: uint256[MAX_COINS] = _balances
     underlying_pct: uint256 = 0
     if base_total_supply > 0:
-        underlying_pct = CurvePool(_pool).balances(base_coin_idx) * 10**36 / base_total_supply
+        underlying_pct = _balances[base_coin_idx] * 10**36 / base_total_supply
 
-    for i in range(MAX_COINS):
-        if self.pool_data[_pool].ul_coins[i] == ZERO_ADDRESS:
-            break
-        if i < base_coin_idx:
-            ul_balance = CurvePool(_pool).balances(i)
-        else:
-            if is_v1:
-                ul_balance = CurvePoolV1(_base_pool).balances(convert(i - base_coin_idx, int128))
-            else:
-                ul_balance = CurvePool(_base_pool).balances(i-base_coin_idx)
-            ul_balance = ul_balance * underlying_pct / 10**36
-        underlying_balances[i] = ul_balance
+    # base pool balances follow the metapool coins, scaled by the metapool's share
+    if shift(base_info, -17) % 2 == 1:
+        for i in range(MAX_COINS):
+            if i == base_n_coins:
+                break
+            underlying_balances[base_coin_idx + i] = (
+                CurvePoolV1(_base_pool).balances(i) * underlying_pct / 10**36
+            )
+    else:
+        for i in range(MAX_COINS):
+            if i == base_n_coins:
+                break
+            underlying_balances[base_coin_idx + i] = (
+                CurvePool(_base_pool).balances(convert(i, uint256)) * underlying_pct / 10**36
+            )
 
     return underlying_balances
 
@@ -276,50 +350,21 @@ def _get_coin_indices(
     """
     # the return value is stored as `uint256[3]` to reduce gas costs
     # from index, to index, is the market underlying?
-    result: uint256[3] = empty(uint256[3])
+    if _from != _to:
+        from_pos: uint256 = self.coin_positions[_pool][_from]
+        to_pos: uint256 = self.coin_positions[_pool][_to]
 
-    found_market: bool = False
+        # check coin markets
+        if from_pos % 256 != 0 and to_pos % 256 != 0:
+            return [from_pos % 256 - 1, to_pos % 256 - 1, 0]
 
-    # check coin markets
-    for x in range(MAX_COINS):
-        coin: address = self.pool_data[_pool].coins[x]
-        if coin == ZERO_ADDRESS:
-            # if we reach the end of the coins, reset `found_market` and try again
-            # with the underlying coins
-            found_market = False
-            break
-        if coin == _from:
-            result[0] = x
-        elif coin == _to:
-            result[1] = x
-        else:
-            continue
-
-        if found_market:
-            # the second time we find a match, break out of the loop
-            break
-        # the first time we find a match, set `found_market` to True
-        found_market = True
-
-    if not found_market:
         # check underlying coin markets
-        for x in range(MAX_COINS):
-            coin: address = self.pool_data[_pool].ul_coins[x]
-            if coin == ZERO_ADDRESS:
-                raise "No available market"
-            if coin == _from:
-                result[0] = x
-            elif coin == _to:
-                result[1] = x
-            else:
-                continue
-
-            if found_market:
-                result[2] = 1
-                break
-            found_market = True
+        from_pos = shift(from_pos, -8)
+        to_pos = shift(to_pos, -8)
+        if from_pos != 0 and to_pos != 0:
+            return [from_pos - 1, to_pos - 1, 1]
 
-    return result
+    raise "No available market"
 
 
 # targetted external getters, optimized for on-chain calls
@@ -349,8 +394,8 @@ def get_n_coins(_pool: address) -> uint256[2]:
     @param _pool Pool address
     @return Number of wrapped coins, number of underlying coins
     """
-    n_coins: uint256 = self.pool_data[_pool].n_coins
-    return [shift(n_coins, -128), n_coins % 2**128]
+    info: uint256 = self.pool_data[_pool].info
+    return [info % 256, shift(info, -8) % 256]
 
 
 @view
@@ -363,9 +408,9 @@ def get_coins(_pool: address) -> address[MAX_COINS]:
     @return List of coin addresses
     """
     coins: address[MAX_COINS] = empty(address[MAX_COINS])
-    n_coins: uint256 = shift(self.pool_data[_pool].n_coins, -128)
+    n_coins: uint256 = self.pool_data[_pool].info % 256
     for i in range(MAX_COINS):
-        if i == n_coins:
+        if i == convert(n_coins, int128):
             break
         coins[i] = self.pool_data[_pool].coins[i]
 
@@ -382,9 +427,9 @@ def get_underlying_coins(_pool: address) -> address[MAX_COINS]:
     @return List of coin addresses
     """
     coins: address[MAX_COINS] = empty(address[MAX_COINS])
-    n_coins: uint256 = self.pool_data[_pool].n_coins % 2**128
+    n_coins: uint256 = shift(self.pool_data[_pool].info, -8) % 256
     for i in range(MAX_COINS):
-        if i == n_coins:
+        if i == convert(n_coins, int128):
             break
         coins[i] = self.pool_data[_pool].ul_coins[i]
 
@@ -400,7 +445,7 @@ def get_decimals(_pool: address) -> uint256[MAX_COINS]:
     @param _pool Pool address
     @return uint256 list of decimals
     """
-    n_coins: uint256 = shift(self.pool_data[_pool].n_coins, -128)
+    n_coins: uint256 = self.pool_data[_pool].info % 256
     return self._unpack_decimals(self.pool_data[_pool].decimals, n_coins)
 
 
@@ -413,7 +458,7 @@ def get_underlying_decimals(_pool: address) -> uint256[MAX_COINS]:
     @param _pool Pool address
     @return uint256 list of decimals
     """
-    n_coins: uint256 = self.pool_data[_pool].n_coins % 2**128
+    n_coins: uint256 = shift(self.pool_data[_pool].info, -8) % 256
     return self._unpack_decimals(self.pool_data[_pool].underlying_decimals, n_coins)
 
 
@@ -473,10 +518,31 @@ def get_underlying_balances(_pool: address) -> uint256[MAX_COINS]:
     @param _pool Pool address
     @return uint256 list of underlyingbalances
     """
+    balances: uint256[MAX_COINS] = self._get_balances(_pool)
+    base_pool: address = self.pool_data[_pool].base_pool
+    if base_pool == ZERO_ADDRESS:
+        return self._get_underlying_balances(_pool, balances, self._get_rates(_pool))
+    return self._get_meta_underlying_balances(_pool, base_pool, balances)
+
+
+@view
+@external
+def get_balances_and_rates(_pool: address) -> (
+    uint256[MAX_COINS], uint256[MAX_COINS], uint256[MAX_COINS]
+):
+    """
+    @notice Get balances, underlying balances and rates for a pool
+    @dev Returns the same values as `get_balances`, `get_underlying_balances`
+         and `get_rates`, reading the pool balances and rates only once
+    @param _pool Pool address
+    @return uint256 list of balances, underlying balances, rates
+    """
+    balances: uint256[MAX_COINS] = self._get_balances(_pool)
+    rates: uint256[MAX_COINS] = self._get_rates(_pool)
     base_pool: address = self.pool_data[_pool].base_pool
     if base_pool == ZERO_ADDRESS:
-        return self._get_underlying_balances(_pool)
-    return self._get_meta_underlying_balances(_pool, base_pool)
+        return balances, self._get_underlying_balances(_pool, balances, rates), rates
+    return balances, self._get_meta_underlying_balances(_pool, base_pool, balances), rates
 
 
 @view
@@ -515,7 +581,7 @@ def get_parameters(_pool: address) -> PoolParams:
     pool_params.future_admin_fee = CurvePool(_pool).future_admin_fee()
     pool_params.future_owner = CurvePool(_pool).future_owner()
 
-    if self.pool_data[_pool].has_initial_A:
+    if shift(self.pool_data[_pool].info, -16) % 2 == 1:
         pool_params.initial_A = CurvePool(_pool).initial_A()
         pool_params.initial_A_time = CurvePool(_pool).initial_A_time()
         pool_params.future_A_time = CurvePool(_pool).future_A_time()
@@ -544,11 +610,11 @@ def get_admin_balances(_pool: address) -> uint256[MAX_COINS]:
     @return List of uint256 admin balances
     """
     balances: uint256[MAX_COINS] = self._get_balances(_pool)
-    n_coins: uint256 = shift(self.pool_data[_pool].n_coins, -128)
+    n_coins: uint256 = self.pool_data[_pool].info % 256
     for i in range(MAX_COINS):
-        coin: address = self.pool_data[_pool].coins[i]
-        if i == n_coins:
+        if i == convert(n_coins, int128):
             break
+        coin: address = self.pool_data[_pool].coins[i]
         if coin == 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE:
             balances[i] = _pool.balance - balances[i]
         else:
@@ -657,7 +723,34 @@ def get_pool_asset_type(_pool: address) -> uint256:
     @param _pool Pool Address
     @return The asset type as an unstripped string
     """
-    return self.pool_data[_pool].asset_type
+    return shift(self.pool_data[_pool].info, -88)
+
+
+@view
+@external
+def get_changes_since(_seq: uint256) -> DynArray[Change, MAX_CHANGES_PAGE]:
+    """
+    @notice Get the changes made after a sequence number
+    @dev Returns at most `MAX_CHANGES_PAGE` changes; call again with the `seq`
+         of the last one to continue. Only the last `MAX_CHANGES` changes are
+         kept, so a poller that falls further behind must re-read `pool_list`.
+    @param _seq Sequence number of the last change already seen
+    @return Changes in the order they were made
+    """
+    changes: DynArray[Change, MAX_CHANGES_PAGE] = []
+    count: uint256 = self.change_count
+    if _seq >= count:
+        return changes
+    assert _seq + MAX_CHANGES >= count  # dev: changes overwritten
+
+    for seq in range(_seq + 1, _seq + 1 + MAX_CHANGES_PAGE):
+        if seq > count:
+            break
+        packed: uint256 = self.changes[seq % MAX_CHANGES]
+        changes.append(
+            Change({seq: seq, pool: convert(packed % 2**160, address), kind: shift(packed, -160)})
+        )
+    return changes
 
 
 # internal functionality used in admin setters
@@ -673,26 +766,35 @@ def _add_pool(
     _is_v1: bool,
     _name: String[64],
 ):
+    # `_n_coins` is [coins, underlying coins] tightly packed as uint8[2]
     assert _sender == self.address_provider.admin()  # dev: admin-only function
     assert _lp_token != ZERO_ADDRESS
     assert self.pool_data[_pool].coins[0] == ZERO_ADDRESS  # dev: pool exists
     assert self.get_pool_from_lp_token[_lp_token] == ZERO_ADDRESS
+    assert _n_coins < 2**16  # dev: too many coins
 
     # add pool to pool_list
     length: uint256 = self.pool_count
     self.pool_list[length] = _pool
     self.pool_count = length + 1
-    self.pool_data[_pool].location = length
+
+    # an asset type may be set before the pool is added
+    info: uint256 = shift(shift(self.pool_data[_pool].info, -88), 88)
+    info += _n_coins + shift(length, 24)
+    if _has_initial_A:
+        info += shift(1, 16)
+    if _is_v1:
+        info += shift(1, 17)
+
+    self.pool_data[_pool].info = info
     self.pool_data[_pool].rate_info = _rate_info
-    self.pool_data[_pool].has_initial_A = _has_initial_A
-    self.pool_data[_pool].is_v1 = _is_v1
-    self.pool_data[_pool].n_coins = _n_coins
     self.pool_data[_pool].name = _name
 
     # update public mappings
     self.get_pool_from_lp_token[_lp_token] = _pool
     self.get_lp_token[_pool] = _lp_token
     self.last_updated = block.timestamp
+    self._log_change(_pool, CHANGE_POOL_ADDED)
 
     log PoolAdded(_pool, slice(_rate_info, 28, 4))
 
@@ -774,6 +876,17 @@ def _unregister_coin_pair(_coina: address, _coinb: address, _coinb_idx: uint256)
     self.coins[_coina].swap_for[coina_arr_last_idx] = ZERO_ADDRESS
 
 
+@internal
+def _set_coin_position(_pool: address, _coin: address, _index: int128, _is_underlying: bool):
+    # only the first position is kept if a coin appears more than once
+    position: uint256 = self.coin_positions[_pool][_coin]
+    if _is_underlying:
+        if shift(position, -8) == 0:
+            self.coin_positions[_pool][_coin] = position + shift(convert(_index, uint256) + 1, 8)
+    elif position % 256 == 0:
+        self.coin_positions[_pool][_coin] = position + convert(_index, uint256) + 1
+
+
 @internal
 def _get_new_pool_coins(
     _pool: address,
@@ -784,31 +897,32 @@ def _get_new_pool_coins(
     coin_list: address[MAX_COINS] = empty(address[MAX_COINS])
     coin: address = ZERO_ADDRESS
     for i in range(MAX_COINS):
-        if i == _n_coins:
+        if i == convert(_n_coins, int128):
             break
         if _is_underlying:
             if _is_v1:
-                coin = CurvePoolV1(_pool).underlying_coins(convert(i, int128))
+                coin = CurvePoolV1(_pool).underlying_coins(i)
             else:
-                coin = CurvePool(_pool).underlying_coins(i)
+                coin = CurvePool(_pool).underlying_coins(convert(i, uint256))
             self.pool_data[_pool].ul_coins[i] = coin
         else:
             if _is_v1:
-                coin = CurvePoolV1(_pool).coins(convert(i, int128))
+                coin = CurvePoolV1(_pool).coins(i)
             else:
-                coin = CurvePool(_pool).coins(i)
+                coin = CurvePool(_pool).coins(convert(i, uint256))
             self.pool_data[_pool].coins[i] = coin
+        self._set_coin_position(_pool, coin, i, _is_underlying)
         coin_list[i] = coin
 
     for i in range(MAX_COINS):
-        if i == _n_coins:
+        if i == convert(_n_coins, int128):
             break
 
         self._register_coin(coin_list[i])
         # add pool to markets
-        i2: uint256 = i + 1
+        i2: int128 = i + 1
         for x in range(i2, i2 + MAX_COINS):
-            if x == _n_coins:
+            if x == convert(_n_coins, int128):
                 break
 
             key: uint256 = bitwise_xor(convert(coin_list[i], uint256), convert(coin_list[x], uint256))
@@ -869,6 +983,55 @@ def _remove_market(_pool: address, _coina: address, _coinb: address):
             break
 
 
+@internal
+def _set_wrapped_coins(_pool: address, _rate_info: bytes32, _wrapped: uint256):
+    # store the positions of coins that differ from their underlying coin in the
+    # first (otherwise unused) byte of `rate_info`, so getters can skip the others
+    rate_info: uint256 = convert(_rate_info, uint256) % 2**248 + shift(_wrapped, 248)
+    self.pool_data[_pool].rate_info = convert(rate_info, bytes32)
+
+
+@internal
+def _set_pool_asset_type(_pool: address, _asset_type: uint256):
+    assert _asset_type < 2**168  # dev: asset type overflow
+    self.pool_data[_pool].info = self.pool_data[_pool].info % 2**88 + shift(_asset_type, 88)
+    self._log_change(_pool, CHANGE_ASSET_TYPE)
+    log PoolAssetTypeUpdated(_pool, _asset_type)
+
+
+@internal
+def _log_change(_pool: address, _kind: uint256):
+    seq: uint256 = self.change_count + 1
+    self.changes[seq % MAX_CHANGES] = convert(_pool, uint256) + shift(_kind, 160)
+    self.change_count = seq
+
+
+@internal
+def _log_pool_registered(_pool: address):
+    info: uint256 = self.pool_data[_pool].info
+    n_coins: uint256 = max(info % 256, shift(info, -8) % 256)
+    coins: address[MAX_COINS] = empty(address[MAX_COINS])
+    ucoins: address[MAX_COINS] = empty(address[MAX_COINS])
+    for i in range(MAX_COINS):
+        if i == convert(n_coins, int128):
+            break
+        coins[i] = self.pool_data[_pool].coins[i]
+        ucoins[i] = self.pool_data[_pool].ul_coins[i]
+
+    log PoolRegistered(
+        _pool,
+        self.get_lp_token[_pool],
+        self.pool_data[_pool].base_pool,
+        coins,
+        ucoins,
+        self.pool_data[_pool].decimals,
+        self.pool_data[_pool].underlying_decimals,
+        self.pool_data[_pool].rate_info,
+        info % 2**24,
+        self.pool_data[_pool].name,
+    )
+
+
 # admin functions
 
 @external
@@ -899,7 +1062,7 @@ def add_pool(
     self._add_pool(
         msg.sender,
         _pool,
-        _n_coins + shift(_n_coins, 128),
+        _n_coins + shift(_n_coins, 8),
         _lp_token,
         _rate_info,
         _has_initial_A,
@@ -913,12 +1076,21 @@ def add_pool(
         decimals = self._get_new_pool_decimals(coins, _n_coins)
     self.pool_data[_pool].decimals = decimals
 
-    coins = self._get_new_pool_coins(_pool, _n_coins, True, _is_v1)
+    ucoins: address[MAX_COINS] = self._get_new_pool_coins(_pool, _n_coins, True, _is_v1)
     decimals = _underlying_decimals
     if decimals == 0:
-        decimals = self._get_new_pool_decimals(coins, _n_coins)
+        decimals = self._get_new_pool_decimals(ucoins, _n_coins)
     self.pool_data[_pool].underlying_decimals = decimals
 
+    wrapped: uint256 = 0
+    for i in range(MAX_COINS):
+        if i == convert(_n_coins, int128):
+            break
+        if coins[i] != ucoins[i]:
+            wrapped += shift(1, i)
+    self._set_wrapped_coins(_pool, _rate_info, wrapped)
+    self._log_pool_registered(_pool)
+
 
 @external
 def add_pool_without_underlying(
@@ -948,7 +1120,7 @@ def add_pool_without_underlying(
     self._add_pool(
         msg.sender,
         _pool,
-        _n_coins + shift(_n_coins, 128),
+        _n_coins + shift(_n_coins, 8),
         _lp_token,
         _rate_info,
         _has_initial_A,
@@ -964,15 +1136,25 @@ def add_pool_without_underlying(
     self.pool_data[_pool].decimals = decimals
 
     udecimals: uint256 = 0
+    wrapped: uint256 = 0
+    # underlying coins after the first coin using rates are unreachable in `_get_coin_indices`
+    is_reachable: bool = True
     for i in range(MAX_COINS):
-        if i == _n_coins:
+        if i == convert(_n_coins, int128):
             break
-        offset: int128 = -8 * convert(i, int128)
+        offset: int128 = -8 * i
         if shift(_use_rates, offset) % 256 == 0:
             self.pool_data[_pool].ul_coins[i] = coins[i]
             udecimals += shift(shift(decimals, offset) % 256, -offset)
+            if is_reachable:
+                self._set_coin_position(_pool, coins[i], i, True)
+        else:
+            wrapped += shift(1, i)
+            is_reachable = False
 
     self.pool_data[_pool].underlying_decimals = udecimals
+    self._set_wrapped_coins(_pool, _rate_info, wrapped)
+    self._log_pool_registered(_pool)
 
 
 @external
@@ -999,13 +1181,13 @@ def add_metapool(
     base_pool: address = _base_pool
     if base_pool == ZERO_ADDRESS:
         base_pool = CurveMetapool(_pool).base_pool()
-    base_n_coins: uint256 = shift(self.pool_data[base_pool].n_coins, -128)
+    base_n_coins: uint256 = self.pool_data[base_pool].info % 256
     assert base_n_coins > 0  # dev: base pool unknown
 
     self._add_pool(
         msg.sender,
         _pool,
-        base_n_coins + base_coin_offset + shift(_n_coins, 128),
+        _n_coins + shift(base_n_coins + base_coin_offset, 8),
         _lp_token,
         EMPTY_BYTES32,
         True,
@@ -1025,16 +1207,17 @@ def add_metapool(
     base_coins: address[MAX_COINS] = empty(address[MAX_COINS])
     coin: address = ZERO_ADDRESS
     for i in range(MAX_COINS):
-        if i == base_n_coins + base_coin_offset:
+        if i == convert(base_n_coins + base_coin_offset, int128):
             break
-        if i < base_coin_offset:
+        if i < convert(base_coin_offset, int128):
             coin = coins[i]
         else:
-            x: uint256 = i - base_coin_offset
+            x: uint256 = convert(i, uint256) - base_coin_offset
             coin = self.pool_data[base_pool].coins[x]
             base_coins[x] = coin
             self._register_coin(base_coins[x])
         self.pool_data[_pool].ul_coins[i] = coin
+        self._set_coin_position(_pool, coin, i, True)
 
     underlying_decimals: uint256 = shift(
         self.pool_data[base_pool].decimals, 8 * convert(base_coin_offset, int128)
@@ -1044,10 +1227,10 @@ def add_metapool(
     self.pool_data[_pool].underlying_decimals = underlying_decimals
 
     for i in range(MAX_COINS):
-        if i == base_coin_offset:
+        if i == convert(base_coin_offset, int128):
             break
         for x in range(MAX_COINS):
-            if x == base_n_coins:
+            if x == convert(base_n_coins, int128):
                 break
             key: uint256 = bitwise_xor(convert(coins[i], uint256), convert(base_coins[x], uint256))
             length: uint256 = self.market_counts[key]
@@ -1058,6 +1241,8 @@ def add_metapool(
             if length == 0:
                 self._register_coin_pair(coins[i], base_coins[x], key)
 
+    self._log_pool_registered(_pool)
+
 
 @external
 def remove_pool(_pool: address):
@@ -1074,14 +1259,16 @@ def remove_pool(_pool: address):
     self.get_lp_token[_pool] = ZERO_ADDRESS
 
     # remove _pool from pool_list
-    location: uint256 = self.pool_data[_pool].location
+    info: uint256 = self.pool_data[_pool].info
+    location: uint256 = shift(info, -24) % 2**64
     length: uint256 = self.pool_count - 1
 
     if location < length:
         # replace _pool with final value in pool_list
         addr: address = self.pool_list[length]
         self.pool_list[location] = addr
-        self.pool_data[addr].location = location
+        addr_info: uint256 = self.pool_data[addr].info
+        self.pool_data[addr].info = addr_info - shift(shift(addr_info, -24) % 2**64, 24) + shift(location, 24)
 
     # delete final pool_list value
     self.pool_list[length] = ZERO_ADDRESS
@@ -1089,25 +1276,28 @@ def remove_pool(_pool: address):
 
     self.pool_data[_pool].underlying_decimals = 0
     self.pool_data[_pool].decimals = 0
-    self.pool_data[_pool].n_coins = 0
+    # clear the coin counts and asset type, leaving the flags and location
+    self.pool_data[_pool].info = info % 2**88 - info % 2**16
     self.pool_data[_pool].name = ""
-    self.pool_data[_pool].asset_type = 0
 
     coins: address[MAX_COINS] = empty(address[MAX_COINS])
     ucoins: address[MAX_COINS] = empty(address[MAX_COINS])
+    n_coins: uint256 = max(info % 256, shift(info, -8) % 256)
 
     for i in range(MAX_COINS):
+        if i == convert(n_coins, int128):
+            break
         coins[i] = self.pool_data[_pool].coins[i]
         ucoins[i] = self.pool_data[_pool].ul_coins[i]
-        if ucoins[i] == ZERO_ADDRESS and coins[i] == ZERO_ADDRESS:
-            break
         if coins[i] != ZERO_ADDRESS:
             # delete coin address from pool_data
             self.pool_data[_pool].coins[i] = ZERO_ADDRESS
+            self.coin_positions[_pool][coins[i]] = 0
             self._unregister_coin(coins[i])
         if ucoins[i] != ZERO_ADDRESS:
             # delete underlying_coin from pool_data
             self.pool_data[_pool].ul_coins[i] = ZERO_ADDRESS
+            self.coin_positions[_pool][ucoins[i]] = 0
             if self.coins[ucoins[i]].register_count != 0:
                 self._unregister_coin(ucoins[i])
 
@@ -1119,7 +1309,7 @@ def remove_pool(_pool: address):
             break
 
         # remove pool from markets
-        i2: uint256 = i + 1
+        i2: int128 = i + 1
         for x in range(i2, i2 + MAX_COINS):
             ucoinx: address = ucoins[x]
             if ucoinx == ZERO_ADDRESS:
@@ -1138,6 +1328,7 @@ def remove_pool(_pool: address):
 
     self.pool_data[_pool].base_pool = ZERO_ADDRESS
     self.last_updated = block.timestamp
+    self._log_change(_pool, CHANGE_POOL_REMOVED)
     log PoolRemoved(_pool)
 
 
@@ -1155,6 +1346,8 @@ def set_pool_gas_estimates(_addr: address[5], _amount: uint256[2][5]):
         if _pool == ZERO_ADDRESS:
             break
         self.gas_estimate_values[_pool] = _amount[i]
+        self._log_change(_pool, CHANGE_GAS_ESTIMATE)
+        log PoolGasEstimatesUpdated(_pool, _amount[i])
     self.last_updated = block.timestamp
 
 
@@ -1172,6 +1365,8 @@ def set_coin_gas_estimates(_addr: address[10], _amount: uint256[10]):
         if _coin == ZERO_ADDRESS:
             break
         self.gas_estimate_values[_coin][0] = _amount[i]
+        self._log_change(_coin, CHANGE_GAS_ESTIMATE)
+        log CoinGasEstimateUpdated(_coin, _amount[i])
     self.last_updated = block.timestamp
 
 
@@ -1186,6 +1381,8 @@ def set_gas_estimate_contract(_pool: address, _estimator: address):
 
     self.gas_estimate_contracts[_pool] = _estimator
     self.last_updated = block.timestamp
+    self._log_change(_pool, CHANGE_GAS_ESTIMATE)
+    log GasEstimateContractUpdated(_pool, _estimator)
 
 
 @external
@@ -1210,6 +1407,8 @@ def set_liquidity_gauges(_pool: address, _liquidity_gauges: address[10]):
         else:
             break
     self.last_updated = block.timestamp
+    self._log_change(_pool, CHANGE_GAUGES)
+    log LiquidityGaugesUpdated(_pool, self.liquidity_gauges[_pool])
 
 
 @external
@@ -1224,7 +1423,7 @@ def set_pool_asset_type(_pool: address, _asset_type: uint256):
     """
     assert msg.sender == self.address_provider.admin()  # dev: admin-only function
 
-    self.pool_data[_pool].asset_type = _asset_type
+    self._set_pool_asset_type(_pool, _asset_type)
     self.last_updated = block.timestamp
 
 
@@ -1241,5 +1440,5 @@ def batch_set_pool_asset_type(_pools: address[32], _asset_types: uint256[32]):
     for i in range(32):
         if _pools[i] == ZERO_ADDRESS:
             break
-        self.pool_data[_pools[i]].asset_type = _asset_types[i]
+        self._set_pool_asset_type(_pools[i], _asset_types[i])
     self.last_updated = block.timestamp
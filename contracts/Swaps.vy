@@ -102,6 +102,9 @@ interface Calculator:
     def get_dy(n_coins: uint256, balances: uint256[MAX_COINS], amp: uint256, fee: uint256,
                rates: uint256[MAX_COINS], precisions: uint256[MAX_COINS],
                i: int128, j: int128, dx: uint256[CALC_INPUT_SIZE]) -> uint256[CALC_INPUT_SIZE]: view
+    def get_dy_bulk(n_coins: uint256, balances: uint256[MAX_COINS], amp: uint256, fee: uint256,
+                    rates: uint256[MAX_COINS], precisions: uint256[MAX_COINS], i: int128, j: int128,
+                    dx: DynArray[uint256, CALC_INPUT_SIZE]) -> DynArray[uint256, CALC_INPUT_SIZE]: view
 
 
 event TokenExchange:
@@ -122,10 +125,21 @@ event ExchangeMultiple:
     amount_sold: uint256
     amount_bought: uint256
 
+
+struct Market:
+    pool: address
+    i: int128
+    j: int128
+    is_crypto: bool
+    is_underlying: bool
+
+
 ETH_ADDRESS: constant(address) = 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE
 WETH_ADDRESS: immutable(address)
 MAX_COINS: constant(uint256) = 8
 CALC_INPUT_SIZE: constant(uint256) = 100
+MAX_MARKETS: constant(uint256) = 32
+MAX_QUOTES: constant(uint256) = 100
 EMPTY_POOL_LIST: constant(address[8]) = [
     ZERO_ADDRESS,
     ZERO_ADDRESS,
@@ -225,6 +239,108 @@ def _get_crypto_exchange_amount(
     return CryptoPool(_pool).get_dy(i, j, _amount)
 
 
+@view
+@internal
+def _get_markets(_from: address, _to: address, _exclude_pools: address[8]) -> DynArray[Market, MAX_MARKETS]:
+    """
+    @notice Find the pools which may be used to swap between two coins
+    @dev Follows the same search order as `get_best_rate`, resolving the
+         coin indices of each pool once. At most `MAX_MARKETS` are returned.
+    @param _from Address of coin to be sent
+    @param _to Address of coin to be received
+    @param _exclude_pools A list of up to 8 addresses which shouldn't be returned
+    @return Pools with coin indices and the method used to quote them
+    """
+    markets: DynArray[Market, MAX_MARKETS] = []
+
+    initial: address = _from
+    target: address = _to
+    if _from == ETH_ADDRESS:
+        initial = WETH_ADDRESS
+    if _to == ETH_ADDRESS:
+        target = WETH_ADDRESS
+
+    registry: address = self.crypto_registry
+    for k in range(65536):
+        pool: address = Registry(registry).find_pool_for_coins(initial, target, k)
+        if pool == ZERO_ADDRESS:
+            if k == 0:
+                # we only check for stableswap pools if we did not find any crypto pools
+                break
+            return markets
+        elif pool in _exclude_pools:
+            continue
+        i: uint256 = 0
+        j: uint256 = 0
+        i, j = CryptoRegistry(registry).get_coin_indices(pool, initial, target) # dev: no market
+        markets.append(
+            Market({
+                pool: pool,
+                i: convert(i, int128),
+                j: convert(j, int128),
+                is_crypto: True,
+                is_underlying: False,
+            })
+        )
+        if len(markets) == MAX_MARKETS:
+            return markets
+
+    for registry_id in range(2):
+        if registry_id == 0:
+            registry = self.registry
+        else:
+            registry = self.factory_registry
+        for k in range(65536):
+            pool: address = Registry(registry).find_pool_for_coins(_from, _to, k)
+            if pool == ZERO_ADDRESS:
+                break
+            elif pool in _exclude_pools:
+                continue
+            if registry_id == 1 and ERC20(pool).totalSupply() == 0:
+                # ignore pools without TVL as the call to `get_dy` will revert
+                continue
+            i: int128 = 0
+            j: int128 = 0
+            is_underlying: bool = False
+            i, j, is_underlying = Registry(registry).get_coin_indices(pool, _from, _to) # dev: no market
+            if is_underlying and registry_id == 1:
+                is_underlying = Registry(registry).is_meta(pool)
+            markets.append(
+                Market({pool: pool, i: i, j: j, is_crypto: False, is_underlying: is_underlying})
+            )
+            if len(markets) == MAX_MARKETS:
+                return markets
+
+    return markets
+
+
+@view
+@internal
+def _get_best_market_rate(_markets: DynArray[Market, MAX_MARKETS], _amount: uint256) -> (address, uint256):
+    """
+    @notice Find the market offering the best rate for a given amount
+    @param _markets Markets returned by `_get_markets`
+    @param _amount Quantity of the coin being sent
+    @return Pool address, amount received
+    """
+    best_pool: address = ZERO_ADDRESS
+    max_dy: uint256 = 0
+
+    for market in _markets:
+        dy: uint256 = 0
+        if market.is_crypto:
+            dy = CryptoPool(market.pool).get_dy(convert(market.i, uint256), convert(market.j, uint256), _amount)
+        elif market.is_underlying:
+            dy = CurvePool(market.pool).get_dy_underlying(market.i, market.j, _amount)
+        else:
+            dy = CurvePool(market.pool).get_dy(market.i, market.j, _amount)
+        if dy > max_dy:
+            best_pool = market.pool
+            max_dy = dy
+
+    return best_pool, max_dy
+
+
 @internal
 def _exchange(
     _registry: address,
@@ -738,6 +854,78 @@ def get_best_rate(
     return best_pool, max_dy
 
 
+@view
+@external
+def get_best_rates(
+    _pairs: DynArray[address[2], MAX_QUOTES],
+    _amounts: DynArray[uint256, MAX_QUOTES],
+    _exclude_pools: address[8] = EMPTY_POOL_LIST
+) -> (DynArray[address, MAX_QUOTES], DynArray[uint256, MAX_QUOTES]):
+    """
+    @notice Find the pools offering the best rate for many swaps
+    @dev Candidate pools and their coin indices are resolved once for each
+         run of consecutive quotes on the same pair, so quotes should be
+         grouped by pair. At most `MAX_MARKETS` pools are checked per pair.
+    @param _pairs List of [coin being sent, coin being received]
+    @param _amounts Quantity being sent, for each pair in `_pairs`
+    @param _exclude_pools A list of up to 8 addresses which shouldn't be returned
+    @return Pool addresses, amounts received
+    """
+    assert len(_pairs) == len(_amounts)
+
+    best_pools: DynArray[address, MAX_QUOTES] = []
+    max_dys: DynArray[uint256, MAX_QUOTES] = []
+
+    pair: address[2] = empty(address[2])
+    markets: DynArray[Market, MAX_MARKETS] = []
+    for k in range(MAX_QUOTES):
+        if k == len(_pairs):
+            break
+        if k == 0 or _pairs[k][0] != pair[0] or _pairs[k][1] != pair[1]:
+            pair = _pairs[k]
+            markets = self._get_markets(pair[0], pair[1], _exclude_pools)
+
+        best_pool: address = ZERO_ADDRESS
+        max_dy: uint256 = 0
+        best_pool, max_dy = self._get_best_market_rate(markets, _amounts[k])
+        best_pools.append(best_pool)
+        max_dys.append(max_dy)
+
+    return best_pools, max_dys
+
+
+@view
+@external
+def get_best_rate_curve(
+    _from: address,
+    _to: address,
+    _amounts: DynArray[uint256, MAX_QUOTES],
+    _exclude_pools: address[8] = EMPTY_POOL_LIST
+) -> (DynArray[address, MAX_QUOTES], DynArray[uint256, MAX_QUOTES]):
+    """
+    @notice Find the pool offering the best rate for each of several amounts
+    @dev Candidate pools are found once and quoted at every amount.
+         At most `MAX_MARKETS` pools are checked.
+    @param _from Address of coin being sent
+    @param _to Address of coin being received
+    @param _amounts Quantities of `_from` being sent
+    @param _exclude_pools A list of up to 8 addresses which shouldn't be returned
+    @return Pool addresses, amounts received
+    """
+    markets: DynArray[Market, MAX_MARKETS] = self._get_markets(_from, _to, _exclude_pools)
+
+    best_pools: DynArray[address, MAX_QUOTES] = []
+    max_dys: DynArray[uint256, MAX_QUOTES] = []
+    for amount in _amounts:
+        best_pool: address = ZERO_ADDRESS
+        max_dy: uint256 = 0
+        best_pool, max_dy = self._get_best_market_rate(markets, amount)
+        best_pools.append(best_pool)
+        max_dys.append(max_dy)
+
+    return best_pools, max_dys
+
+
 @view
 @external
 def get_exchange_amount(_pool: address, _from: address, _to: address, _amount: uint256) -> uint256:
@@ -768,29 +956,34 @@ def get_exchange_amount(_pool: address, _from: address, _to: address, _amount: u
 
 
 @view
-@external
-def get_input_amount(_pool: address, _from: address, _to: address, _amount: uint256) -> uint256:
-    """
-    @notice Get the current number of coins required to receive the given amount in an exchange
-    @param _pool Pool address
-    @param _from Address of coin to be sent
-    @param _to Address of coin to be received
-    @param _amount Quantity of `_to` to be received
-    @return Quantity of `_from` to be sent
-    """
+@internal
+def _get_calculator(_pool: address) -> address:
+    calculator: address = self.pool_calculator[_pool]
+    if calculator == ZERO_ADDRESS:
+        return self.default_calculator
+    return calculator
+
+
+@view
+@internal
+def _get_calculator_params(_pool: address, _from: address, _to: address) -> (
+    uint256, uint256[MAX_COINS], uint256, uint256, uint256[MAX_COINS], uint256[MAX_COINS], int128, int128
+):
+    # arguments for the calculator's `get_dy`, excluding the amounts
     registry: address = self.registry
 
     i: int128 = 0
     j: int128 = 0
     is_underlying: bool = False
-    i, j, is_underlying = Registry(registry).get_coin_indices(_pool, _from, _to)
-    amp: uint256 = Registry(registry).get_A(_pool)
-    fee: uint256 = Registry(registry).get_fees(_pool)[0]
-
     balances: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
     rates: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
     decimals: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+
+    amp: uint256 = Registry(registry).get_A(_pool)
+    fee: uint256 = Registry(registry).get_fees(_pool)[0]
+    i, j, is_underlying = Registry(registry).get_coin_indices(_pool, _from, _to)
     n_coins: uint256 = Registry(registry).get_n_coins(_pool)[convert(is_underlying, uint256)]
+
     if is_underlying:
         balances = Registry(registry).get_underlying_balances(_pool)
         decimals = Registry(registry).get_underlying_decimals(_pool)
@@ -808,10 +1001,33 @@ def get_input_amount(_pool: address, _from: address, _to: address, _amount: uint
             break
         decimals[x] = 10 ** (18 - decimals[x])
 
-    calculator: address = self.pool_calculator[_pool]
-    if calculator == ZERO_ADDRESS:
-        calculator = self.default_calculator
-    return Calculator(calculator).get_dx(n_coins, balances, amp, fee, rates, decimals, i, j, _amount)
+    return n_coins, balances, amp, fee, rates, decimals, i, j
+
+
+@view
+@external
+def get_input_amount(_pool: address, _from: address, _to: address, _amount: uint256) -> uint256:
+    """
+    @notice Get the current number of coins required to receive the given amount in an exchange
+    @param _pool Pool address
+    @param _from Address of coin to be sent
+    @param _to Address of coin to be received
+    @param _amount Quantity of `_to` to be received
+    @return Quantity of `_from` to be sent
+    """
+    n_coins: uint256 = 0
+    balances: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+    amp: uint256 = 0
+    fee: uint256 = 0
+    rates: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+    decimals: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+    i: int128 = 0
+    j: int128 = 0
+    n_coins, balances, amp, fee, rates, decimals, i, j = self._get_calculator_params(_pool, _from, _to)
+
+    return Calculator(self._get_calculator(_pool)).get_dx(
+        n_coins, balances, amp, fee, rates, decimals, i, j, _amount
+    )
 
 
 @view
@@ -830,41 +1046,52 @@ def get_exchange_amounts(
     @param _amounts Quantity of `_to` to be received
     @return Quantity of `_from` to be sent
     """
-    registry: address = self.registry
-
-    i: int128 = 0
-    j: int128 = 0
-    is_underlying: bool = False
+    n_coins: uint256 = 0
     balances: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+    amp: uint256 = 0
+    fee: uint256 = 0
     rates: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
     decimals: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+    i: int128 = 0
+    j: int128 = 0
+    n_coins, balances, amp, fee, rates, decimals, i, j = self._get_calculator_params(_pool, _from, _to)
 
-    amp: uint256 = Registry(registry).get_A(_pool)
-    fee: uint256 = Registry(registry).get_fees(_pool)[0]
-    i, j, is_underlying = Registry(registry).get_coin_indices(_pool, _from, _to)
-    n_coins: uint256 = Registry(registry).get_n_coins(_pool)[convert(is_underlying, uint256)]
+    return Calculator(self._get_calculator(_pool)).get_dy(
+        n_coins, balances, amp, fee, rates, decimals, i, j, _amounts
+    )
 
-    if is_underlying:
-        balances = Registry(registry).get_underlying_balances(_pool)
-        decimals = Registry(registry).get_underlying_decimals(_pool)
-        for x in range(MAX_COINS):
-            if x == n_coins:
-                break
-            rates[x] = 10**18
-    else:
-        balances = Registry(registry).get_balances(_pool)
-        decimals = Registry(registry).get_decimals(_pool)
-        rates = Registry(registry).get_rates(_pool)
 
-    for x in range(MAX_COINS):
-        if x == n_coins:
-            break
-        decimals[x] = 10 ** (18 - decimals[x])
+@view
+@external
+def get_exchange_amounts_bulk(
+    _pool: address,
+    _from: address,
+    _to: address,
+    _amounts: DynArray[uint256, CALC_INPUT_SIZE]
+) -> DynArray[uint256, CALC_INPUT_SIZE]:
+    """
+    @notice Get the current number of coins received for each of the given amounts in an exchange
+    @dev Variable-length version of `get_exchange_amounts`. Requires the calculator
+         for `_pool` to implement `get_dy_bulk` (`CurveCalcV2`).
+    @param _pool Pool address
+    @param _from Address of coin to be sent
+    @param _to Address of coin to be received
+    @param _amounts Quantities of `_from` to be sent
+    @return Quantities of `_to` to be received
+    """
+    n_coins: uint256 = 0
+    balances: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+    amp: uint256 = 0
+    fee: uint256 = 0
+    rates: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+    decimals: uint256[MAX_COINS] = empty(uint256[MAX_COINS])
+    i: int128 = 0
+    j: int128 = 0
+    n_coins, balances, amp, fee, rates, decimals, i, j = self._get_calculator_params(_pool, _from, _to)
 
-    calculator: address = self.pool_calculator[_pool]
-    if calculator == ZERO_ADDRESS:
-        calculator = self.default_calculator
-    return Calculator(calculator).get_dy(n_coins, balances, amp, fee, rates, decimals, i, j, _amounts)
+    return Calculator(self._get_calculator(_pool)).get_dy_bulk(
+        n_coins, balances, amp, fee, rates, decimals, i, j, _amounts
+    )
 
 
 @view
@@ -963,11 +1190,7 @@ def get_calculator(_pool: address) -> address:
     @param _pool Pool address
     @return `CurveCalc` address
     """
-    calculator: address = self.pool_calculator[_pool]
-    if calculator == ZERO_ADDRESS:
-        return self.default_calculator
-    else:
-        return calculator
+    return self._get_calculator(_pool)
 
 
 @external
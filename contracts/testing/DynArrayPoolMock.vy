@@ -0,0 +1,45 @@
+# @version 0.3.7
+"""
+@notice Mock Curve pool whose `get_balances` returns a dynamic array
+"""
+
+n_coins: uint256
+coin_list: address[4]
+
+_balances: uint256[4]
+
+
+@external
+def __init__(_n_coins: uint256, _coin_list: address[4]):
+    self.n_coins = _n_coins
+    self.coin_list = _coin_list
+
+
+@external
+@view
+def coins(i: uint256) -> address:
+    assert i < self.n_coins  # dev: exceeds n_coins
+    return self.coin_list[i]
+
+
+@external
+@view
+def balances(i: uint256) -> uint256:
+    assert i < self.n_coins
+    return self._balances[i]
+
+
+@external
+@view
+def get_balances() -> DynArray[uint256, 4]:
+    balances: DynArray[uint256, 4] = []
+    for i in range(4):
+        if i == self.n_coins:
+            break
+        balances.append(self._balances[i])
+    return balances
+
+
+@external
+def _set_balances(_balances: uint256[4]):
+    self._balances = _balances
@@ -75,6 +75,12 @@ def balances(i: uint256) -> uint256:
     return self._balances[i]
 
 
+@external
+@view
+def get_balances() -> uint256[4]:
+    return self._balances
+
+
 @internal
 @view
 def _get_dy(_from: address, _to: address, _dx: uint256) -> uint256:
@@ -109,11 +115,11 @@ def get_dy_underlying(i: int128, j: int128, dx: uint256) -> uint256:
     _to: address = ZERO_ADDRESS
 
     max_base_coin: int128 = convert(self.n_coins - 1, int128)
-    if i <= max_base_coin:
+    if i < max_base_coin:
         _from = self.coin_list[i]
     else:
         _from = self.base_coin_list[i-max_base_coin]
-    if j <= max_base_coin:
+    if j < max_base_coin:
         _to = self.coin_list[j]
     else:
         _to = self.base_coin_list[j-max_base_coin]
@@ -0,0 +1,175 @@
+"""
+Vectorised batch quoting of StableSwap exchanges with NumPy.
+
+Quotes every combination of pools x coin pairs x trade amounts in a single
+pass. The invariant of each pool is calculated exactly using
+`scripts.stableswap_math`. `get_y` is then solved for every trade at once with
+float64 Newton iterations, on balances normalised to the pool size so the
+values stay close to 1.
+
+Float64 results are approximate. A trade is recalculated with the
+integer-exact port when its Newton iteration does not converge, or when the
+amount received is small enough that integer rounding in the contract could
+exceed `rtol`.
+"""
+
+from typing import NamedTuple, Sequence
+
+import numpy as np
+
+from scripts import stableswap_math
+from scripts.stableswap_math import FEE_DENOMINATOR, MAX_COINS
+
+# relative tolerance for convergence of the Newton iteration
+_FLOAT_ERROR = 4 * np.finfo(np.float64).eps
+# bound on the difference from the integer calculation caused by rounding
+_ROUNDING_WEI = 4
+
+
+class BatchQuote(NamedTuple):
+    # amounts received, with shape (pools, pairs, amounts)
+    dy: np.ndarray
+    # True where `dy` was recalculated with the integer-exact port
+    exact: np.ndarray
+
+
+def get_dy_batch(
+    n_coins: Sequence[int],
+    balances: Sequence[Sequence[int]],
+    amp: Sequence[int],
+    fee: Sequence[int],
+    rates: Sequence[Sequence[int]],
+    precisions: Sequence[Sequence[int]],
+    i: Sequence,
+    j: Sequence,
+    dx: Sequence,
+    rtol: float = 1e-9,
+    max_iter: int = 255,
+) -> BatchQuote:
+    """
+    Calculate the amount of coin `j` given in exchange for coin `i`, for many
+    pools, coin pairs and trade amounts at once.
+
+    Pool arguments are the same as `stableswap_math.get_dy`, with an additional
+    leading axis for the pool.
+
+    Arguments
+    ---------
+    n_coins : Sequence[int]
+        Number of coins in each pool, shape (P,)
+    balances : Sequence[Sequence[int]]
+        Coin balances of each pool, shape (P, 8)
+    amp : Sequence[int]
+        Amplification coefficient of each pool, shape (P,)
+    fee : Sequence[int]
+        Fee of each pool at 1e10 basis, shape (P,)
+    rates : Sequence[Sequence[int]]
+        Rates for "lent out" tokens, shape (P, 8)
+    precisions : Sequence[Sequence[int]]
+        Precision multipliers to get the coin to 1e18 basis, shape (P, 8)
+    i : Sequence
+        Index of the coin sold, shape (Q,) or (P, Q)
+    j : Sequence
+        Index of the coin bought, shape (Q,) or (P, Q)
+    dx : Sequence
+        Amounts of coin `i` sold, shape (A,) or (P, Q, A). Amounts larger than
+        2**53 are rounded for the float64 calculation, the exact values are kept
+        for any recalculation.
+    rtol : float
+        Maximum relative error accepted from the float64 calculation
+    max_iter : int
+        Maximum number of Newton iterations
+
+    Returns
+    -------
+    BatchQuote
+        `dy` as a float64 array of shape (P, Q, A), and a boolean array of the
+        same shape showing which values were calculated exactly
+    """
+    n_pools = len(n_coins)
+    n = np.asarray(n_coins, dtype=np.float64)
+    i = np.broadcast_to(np.asarray(i, dtype=np.int64), (n_pools, np.shape(i)[-1]))
+    j = np.broadcast_to(np.asarray(j, dtype=np.int64), i.shape)
+    n_ = n[:, None]
+    if ((i == j) | (i < 0) | (j < 0) | (i >= n_) | (j >= n_)).any():
+        raise ValueError("Invalid coin index")
+    dx_int = np.asarray(dx, dtype=object)
+    if dx_int.ndim == 1:
+        dx_int = np.broadcast_to(dx_int, i.shape + dx_int.shape)
+    dx_float = dx_int.astype(np.float64)
+
+    # exact, per-pool precalculation
+    xp = np.zeros((n_pools, MAX_COINS))
+    ratesp = np.zeros((n_pools, MAX_COINS))
+    scale = np.zeros(n_pools)
+    D = np.zeros(n_pools)
+    for p in range(n_pools):
+        xp_int, ratesp_int = stableswap_math.get_xp(balances[p], rates[p], precisions[p])
+        scale[p] = sum(xp_int)
+        D[p] = stableswap_math.get_D(n_coins[p], xp_int, amp[p]) / scale[p]
+        xp[p] = np.array(xp_int, dtype=np.float64) / scale[p]
+        ratesp[p] = np.array(ratesp_int, dtype=np.float64)
+
+    pool_idx = np.arange(n_pools)[:, None]
+    Ann = np.asarray(amp, dtype=np.float64)[:, None] * n_
+    D_ = D[:, None]
+    x_i = xp[pool_idx, i]
+    x_j = xp[pool_idx, j]
+
+    # sum and product terms of `get_y` before the trade, with coin j excluded
+    k = np.arange(MAX_COINS)
+    included = (k < n[:, None, None]) & (k != j[..., None])
+    x = np.broadcast_to(xp[:, None, :], included.shape)
+    S_ = np.where(included, x, 0).sum(axis=-1)
+    with np.errstate(divide="ignore"):
+        c = D_ * np.prod(np.where(included, D_[..., None] / (x * n[:, None, None]), 1), axis=-1)
+    c = c * D_ / (Ann * n_)
+
+    # `get_y` solves y**2 + (b - D) * y = c. Substituting y = x_j - dy_norm and
+    # subtracting the pre-trade equation (which holds at y = x_j) leaves
+    # dy_norm**2 - B * dy_norm + f = 0, where every term scales with the trade size.
+    # Solving for dy_norm directly avoids cancellation for trades that are small
+    # relative to the pool.
+    dx_norm = dx_float * (ratesp[pool_idx, i] / 10**18 / scale[:, None])[..., None]
+    f = dx_norm * (x_j + c / x_i)[..., None] - (c / x_i)[..., None] * (
+        dx_norm**2 / (x_i[..., None] + dx_norm)
+    )
+    B = (2 * x_j + S_ + D_ / Ann - D_)[..., None] + dx_norm
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dy_norm = f / B
+        converged = np.zeros(dx_norm.shape, dtype=bool)
+        for _ in range(max_iter):
+            step = (dy_norm * dy_norm - B * dy_norm + f) / (2 * dy_norm - B)
+            dy_norm = np.where(converged, dy_norm, dy_norm - step)
+            converged |= np.abs(step) <= _FLOAT_ERROR * dy_norm
+            if converged.all():
+                break
+
+        dy_wei = dy_norm * scale[:, None, None]
+        dy = (dy_wei - 1) * 10**18 / ratesp[pool_idx, j][..., None]
+        dy -= dy * (np.asarray(fee, dtype=np.float64) / FEE_DENOMINATOR)[:, None, None]
+
+        # the integer calculation differs by a few wei due to rounding, both in the
+        # normalised balances and in the amount of coin j
+        accurate = _ROUNDING_WEI <= rtol * np.minimum(dy_wei, dy)
+
+    dy = np.where(dx_float == 0, 0, dy)
+    exact = (dx_float != 0) & ~(converged & np.isfinite(dy) & accurate & (dy >= 0))
+
+    for p, q in zip(*np.nonzero(exact.any(axis=-1))):
+        mask = exact[p, q]
+        exact_dy = stableswap_math.get_dy(
+            n_coins[p],
+            balances[p],
+            amp[p],
+            fee[p],
+            rates[p],
+            precisions[p],
+            int(i[p, q]),
+            int(j[p, q]),
+            list(dx_int[p, q][mask]),
+        )
+        dy[p, q][mask] = exact_dy
+
+    return BatchQuote(dy, exact)
@@ -0,0 +1,465 @@
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from scripts import stableswap_math
+from scripts.pool_index import PoolDataIndex
+from scripts.pool_snapshot import is_available, read_snapshot, write_snapshot
+
+# ladders of trade sizes for bulk quotes, in 1e18 units
+LADDERS = {
+    "linear": [10**20 * (k + 1) for k in range(100)],
+    "geometric": [int(10**18 * 1.15**k) for k in range(100)],
+    "log": [int(10 ** (18 + k * 6 / 99)) for k in range(100)],
+}
+# 3 coin pool with 4M in balances, arguments for `get_dy` excluding indices and amounts
+CALC_POOL = (
+    3,
+    [10**24, 2 * 10**24, 10**24] + [0] * 5,
+    200,
+    4000000,
+    [10**18] * 3 + [0] * 5,
+    [1, 1, 1] + [0] * 5,
+)
+
+
+def _synthetic_pooldata(n_pools: int) -> dict:
+    # one base pool for every nine metapools
+    pool_data = {}
+    for idx in range(n_pools):
+        coins = [
+            {"name": f"TST{idx}", "decimals": 18, "underlying_address": f"0x{idx + 2**32:040x}"},
+            {"name": f"TST{idx + 1}", "decimals": 6, "underlying_address": f"0x{idx + 2**33:040x}"},
+        ]
+        data = {
+            "swap_address": f"0x{idx + 1:040x}",
+            "lp_token_address": f"0x{idx + 2**31:040x}",
+            "lp_contract": "CurveTokenV3",
+            "coins": coins,
+        }
+        if idx % 10:
+            base_idx = idx - idx % 10
+            data["base_pool"] = f"pool{base_idx}"
+            coins[1] = {
+                "name": f"LP{base_idx}",
+                "decimals": 18,
+                "base_pool_token": True,
+                "underlying_address": f"0x{base_idx + 2**31:040x}",
+            }
+        pool_data[f"pool{idx}"] = data
+    return pool_data
+
+
+def _synthetic_pools(n_pools: int, seed: int = 0) -> list:
+    # arguments for `stableswap_math.get_dy`, excluding the coin indices and amounts
+    rng = random.Random(seed)
+    pools = []
+    for _ in range(n_pools):
+        n_coins = rng.randint(2, 8)
+        zeros = [0] * (8 - n_coins)
+        precisions = [10 ** (18 - rng.choice([6, 8, 18])) for _ in range(n_coins)] + zeros
+        balances = [rng.randint(10**22, 10**27) // precisions[k] for k in range(n_coins)]
+        rates = [rng.randint(10**18, 2 * 10**18) for _ in range(n_coins)] + zeros
+        amp = rng.choice([10, 100, 200, 2000, 5000])
+        fee = rng.randint(0, 10**8)
+        pools.append((n_coins, balances + zeros, amp, fee, rates, precisions))
+    return pools
+
+
+class _SyntheticRegistry:
+    # the `Registry` views used to read the swap graph, for pools of 2 to 4 coins
+    # with a few widely held coins, counting the calls made
+
+    def __init__(self, n_pools: int, seed: int = 0):
+        rng = random.Random(seed)
+        n_coins = n_pools // 2
+        weights = [1 / (k + 1) for k in range(n_coins)]
+        self.calls = 0
+        self._coins = []
+        self._swap_for = {}
+        self._markets = {}
+        self._indices = {}
+        for idx in range(n_pools):
+            pool = f"0x{idx + 1:040x}"
+            coins = set()
+            while len(coins) < rng.randint(2, 4):
+                coins.add(f"0x{rng.choices(range(n_coins), weights)[0] + 2**32:040x}")
+            coins = sorted(coins)
+            for i, coin in enumerate(coins):
+                if coin not in self._swap_for:
+                    self._coins.append(coin)
+                    self._swap_for[coin] = []
+                self._indices[(pool, coin)] = i
+                for other in coins[:i]:
+                    key = (other, coin)
+                    if key not in self._markets:
+                        self._markets[key] = []
+                        self._swap_for[coin].append(other)
+                        self._swap_for[other].append(coin)
+                    self._markets[key].append(pool)
+
+    def coin_count(self):
+        self.calls += 1
+        return len(self._coins)
+
+    def get_coin(self, i):
+        self.calls += 1
+        return self._coins[i]
+
+    def get_coin_swap_count(self, coin):
+        self.calls += 1
+        return len(self._swap_for[coin])
+
+    def get_coin_swap_complement(self, coin, i):
+        self.calls += 1
+        return self._swap_for[coin][i]
+
+    def find_pool_for_coins(self, coin_a, coin_b, i):
+        self.calls += 1
+        pools = self._markets[tuple(sorted((coin_a, coin_b)))]
+        return pools[i] if i < len(pools) else "0x" + "0" * 40
+
+    def get_coin_indices(self, pool, coin_a, coin_b):
+        self.calls += 1
+        return self._indices[(pool, coin_a)], self._indices[(pool, coin_b)], False
+
+
+class _SyntheticPoolInfo:
+    # `PoolInfo.get_swap_edges` over a `_SyntheticRegistry`, paged as in the contract
+
+    def __init__(self, registry, max_edges: int = 100, max_steps: int = 400):
+        self.registry = registry
+        self.max_edges = max_edges
+        self.max_steps = max_steps
+        self.calls = 0
+
+    def get_swap_edges(self, cursor):
+        self.calls += 1
+        registry = self.registry
+        coin_count = len(registry._coins)
+        coin_idx, swap_idx, pool_idx = cursor
+        coin = complement = None
+        edges = []
+        for _ in range(self.max_steps):
+            if coin_idx >= coin_count or len(edges) == self.max_edges:
+                break
+            if coin is None:
+                coin = registry._coins[coin_idx]
+            if swap_idx >= len(registry._swap_for[coin]):
+                coin_idx, swap_idx, pool_idx, coin = coin_idx + 1, 0, 0, None
+                continue
+            if complement is None:
+                complement = registry._swap_for[coin][swap_idx]
+                if int(complement, 16) < int(coin, 16):
+                    swap_idx, complement = swap_idx + 1, None
+                    continue
+            pools = registry._markets[(coin, complement)]
+            if pool_idx >= len(pools):
+                swap_idx, pool_idx, complement = swap_idx + 1, 0, None
+                continue
+            pool = pools[pool_idx]
+            i, j = registry._indices[(pool, coin)], registry._indices[(pool, complement)]
+            edges.append((coin, complement, pool, i, j, False))
+            pool_idx += 1
+        return edges, [coin_idx, swap_idx, pool_idx]
+
+
+def _time(fn, repeat: int = 3) -> float:
+    result = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        result = min(result, time.perf_counter() - start)
+    return result
+
+
+def pool_index(sizes=(100, 1000, 5000)):
+    """
+    Compare forked test collection against the number of pools, with the data
+    held as a plain dict (linear scan per base pool lookup) vs a `PoolDataIndex`.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'pools':>8} {'dict + scan (ms)':>18} {'PoolDataIndex (ms)':>20}")
+        for n_pools in sizes:
+            path = Path(tmp).joinpath(f"pooldata{n_pools}.json")
+            with path.open("w") as fp:
+                json.dump(_synthetic_pooldata(n_pools), fp, sort_keys=True, indent=2)
+
+            def _load(pools=None):
+                with path.open() as fp:
+                    return json.load(fp)
+
+            def _collect_dict():
+                pooldata = _load()
+                for data in pooldata.values():
+                    for coin in data["coins"]:
+                        if "base_pool_token" in coin:
+                            next(
+                                i
+                                for i in pooldata.values()
+                                if i.get("lp_token_address") == coin["underlying_address"]
+                            )
+
+            def _collect_index():
+                pooldata = PoolDataIndex(loader=_load)
+                for data in pooldata.values():
+                    for coin in data["coins"]:
+                        if "base_pool_token" in coin:
+                            pooldata[pooldata.get_by_lp_token(coin["underlying_address"])]
+
+            print(
+                f"{n_pools:>8} {_time(_collect_dict) * 1000:>18.1f} "
+                f"{_time(_collect_index) * 1000:>20.1f}"
+            )
+
+
+def pool_snapshot(sizes=(100, 1000, 5000)):
+    """
+    Compare the time to load pool data from `pooldata.json` and from the binary snapshot.
+    """
+    if not is_available():
+        print("msgpack is not installed, snapshots are disabled")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(
+            f"{'pools':>8} {'JSON (ms)':>12} {'snapshot (ms)':>15} "
+            f"{'JSON (kB)':>12} {'snapshot (kB)':>15}"
+        )
+        for n_pools in sizes:
+            pool_data = _synthetic_pooldata(n_pools)
+            path = Path(tmp).joinpath(f"pooldata{n_pools}.json")
+            snapshot_path = path.with_suffix(".msgpack")
+            with path.open("w") as fp:
+                json.dump(pool_data, fp, sort_keys=True, indent=2)
+            write_snapshot(pool_data, snapshot_path, path)
+
+            def _load_json():
+                with path.open() as fp:
+                    return json.load(fp)
+
+            print(
+                f"{n_pools:>8} {_time(_load_json) * 1000:>12.1f} "
+                f"{_time(lambda: read_snapshot(snapshot_path, path)) * 1000:>15.1f} "
+                f"{path.stat().st_size / 1024:>12.0f} {snapshot_path.stat().st_size / 1024:>15.0f}"
+            )
+
+
+def batch_quote(n_pools=100, n_amounts=100):
+    """
+    Compare quoting every pool x pair x amount with `batch_quote.get_dy_batch`
+    against looping the scalar `stableswap_math.get_dy`.
+    """
+    try:
+        from scripts.batch_quote import get_dy_batch
+    except ImportError:
+        print("numpy is not installed, batch quoting is disabled")
+        return
+
+    pools = _synthetic_pools(n_pools)
+    args = [list(i) for i in zip(*pools)]
+    pairs = [(0, 1), (1, 0)]
+    rng = random.Random(0)
+    dx = sorted(int(10 ** rng.uniform(18, 25)) for _ in range(n_amounts))
+
+    def _scalar():
+        return [[stableswap_math.get_dy(*pool, i, j, dx) for i, j in pairs] for pool in pools]
+
+    scalar = _time(_scalar, repeat=1)
+    print(f"{n_pools} pools x {len(pairs)} pairs x {n_amounts} amounts")
+    print(f"scalar loop: {scalar * 1000:.1f}ms")
+    for rtol in (1e-6, 1e-9):
+        result = get_dy_batch(*args, [i for i, _ in pairs], [j for _, j in pairs], dx, rtol=rtol)
+        batch = _time(
+            lambda: get_dy_batch(*args, [i for i, _ in pairs], [j for _, j in pairs], dx, rtol=rtol)
+        )
+        print(
+            f"batch, rtol={rtol:.0e}: {batch * 1000:.1f}ms ({scalar / batch:.1f}x), "
+            f"{result.exact.mean():.1%} recalculated exactly"
+        )
+
+
+def newton_iterations():
+    """
+    Count `get_y` Newton iterations in a bulk quote, starting each trade from `D`
+    (`CurveCalc`) vs from the solution of the previous trade (`CurveCalcV2`).
+    """
+    n_coins, balances, amp, _, rates, precisions = CALC_POOL
+    xp, ratesp = stableswap_math.get_xp(balances, rates, precisions)
+    D = stableswap_math.get_D(n_coins, xp, amp)
+
+    print(f"{'ladder':>10} {'cold start':>12} {'warm start':>12}")
+    for name, dx in LADDERS.items():
+        cold = warm = 0
+        y = D
+        for amount in dx:
+            x = amount * ratesp[0] // 10**18 + xp[0]
+            cold += stableswap_math._get_y(D, n_coins, xp, amp, 0, 1, x, None)[1]
+            y, iterations = stableswap_math._get_y(D, n_coins, xp, amp, 0, 1, x, y)
+            warm += iterations
+        print(f"{name:>10} {cold:>12} {warm:>12}")
+
+
+def route_graph(n_pools=5000, n_searches=100):
+    """
+    Compare the calls needed to read the swap graph of a synthetic registry with
+    `router.load_hops` and `router.fetch_hops`, and time route searches over
+    a list of hops (building the `SwapGraph` on each search) and a prebuilt graph.
+    """
+    from scripts import router
+
+    registry = _SyntheticRegistry(n_pools)
+    pool_info = _SyntheticPoolInfo(registry)
+    hops = router.load_hops(registry)
+    calls = registry.calls
+    registry.calls = 0
+    router.fetch_hops(registry, pool_info)
+    print(f"{n_pools} pools, {len(registry._coins)} coins, {len(hops)} hops")
+    print(f"load_hops: {calls} calls")
+    print(f"fetch_hops: {registry.calls + pool_info.calls} calls ({pool_info.calls} pages)")
+
+    def _quote(hop, amount):
+        return amount * (9990 - int(hop.pool, 16) % 7) // 10000
+
+    rng = random.Random(0)
+    pairs = [rng.sample(registry._coins[:200], 2) for _ in range(n_searches)]
+    graph = router.SwapGraph(hops)
+
+    def _search(hops):
+        for coin_in, coin_out in pairs:
+            router.find_routes(hops, _quote, coin_in, coin_out, 10**18)
+
+    print(f"SwapGraph: {_time(lambda: router.SwapGraph(hops)) * 1000:.1f}ms")
+    print(f"{n_searches} searches, hops: {_time(lambda: _search(hops), repeat=1) * 1000:.1f}ms")
+    print(
+        f"{n_searches} searches, SwapGraph: {_time(lambda: _search(graph), repeat=1) * 1000:.1f}ms"
+    )
+
+
+def calculator_gas():
+    """
+    Compare the gas used by `CurveCalc.get_dy` and `CurveCalcV2.get_dy` for each ladder.
+    """
+    from brownie import CurveCalc, CurveCalcV2, accounts
+
+    calculator = CurveCalc.deploy({"from": accounts[0]})
+    calculator_v2 = CurveCalcV2.deploy({"from": accounts[0]})
+
+    print(f"{'ladder':>10} {'CurveCalc':>12} {'CurveCalcV2':>12}")
+    for name, dx in LADDERS.items():
+        gas = calculator.get_dy.estimate_gas(*CALC_POOL, 0, 1, dx)
+        gas_v2 = calculator_v2.get_dy.estimate_gas(*CALC_POOL, 0, 1, dx)
+        print(f"{name:>10} {gas:>12} {gas_v2:>12} ({1 - gas_v2 / gas:.0%} saved)")
+
+
+def bulk_quote_gas(sizes=(1, 10, 100)):
+    """
+    Compare the gas used by the fixed-size `CurveCalc.get_dy` and the
+    variable-length `CurveCalcV2.get_dy_bulk` for each number of amounts.
+    """
+    from brownie import CurveCalc, CurveCalcV2, accounts
+
+    calculator = CurveCalc.deploy({"from": accounts[0]})
+    calculator_v2 = CurveCalcV2.deploy({"from": accounts[0]})
+
+    print(f"{'amounts':>8} {'get_dy':>10} {'get_dy_bulk':>12}")
+    for size in sizes:
+        dx = LADDERS["geometric"][:size]
+        gas = calculator.get_dy.estimate_gas(*CALC_POOL, 0, 1, dx + [0] * (100 - size))
+        gas_bulk = calculator_v2.get_dy_bulk.estimate_gas(*CALC_POOL, 0, 1, dx)
+        print(f"{size:>8} {gas:>10} {gas_bulk:>12} ({1 - gas_bulk / gas:.0%} saved)")
+
+
+def _deploy_swaps(n_pools, n_coins):
+    # `Swaps` with `n_pools` mock pools sharing `n_coins` coins in the main registry,
+    # the factory and crypto registries are left empty
+    from brownie import (
+        ERC20,
+        AddressProvider,
+        CurveCalc,
+        GaugeControllerMock,
+        PoolMockV2,
+        Registry,
+        Swaps,
+        accounts,
+    )
+
+    alice = accounts[0]
+    zero = "0x0000000000000000000000000000000000000000"
+    provider = AddressProvider.deploy(alice, {"from": alice})
+    gauge_controller = GaugeControllerMock.deploy({"from": alice})
+    registry = Registry.deploy(provider, gauge_controller, {"from": alice})
+    provider.set_address(0, registry, {"from": alice})
+    for description in ("Pool Info", "Swaps", "Factory", "Metapool Factory", "Crypto"):
+        empty = Registry.deploy(provider, gauge_controller, {"from": alice})
+        provider.add_new_id(empty, description, {"from": alice})
+
+    coins = [
+        ERC20.deploy(f"Test Token {i}", f"TST{i}", 18, {"from": alice}) for i in range(n_coins)
+    ]
+    coins_padded = coins + [zero] * (4 - n_coins)
+    pools = []
+    for i in range(n_pools):
+        fee = 4000000 * (i + 1)
+        swap = PoolMockV2.deploy(n_coins, coins_padded, [zero] * 4, 70, fee, {"from": alice})
+        token = ERC20.deploy("", "", 18, {"from": alice})
+        registry.add_pool_without_underlying(
+            swap, n_coins, token, "0x00", 0, 0, True, False, "", {"from": alice}
+        )
+        pools.append(swap)
+
+    calculator = CurveCalc.deploy({"from": alice})
+    swaps = Swaps.deploy(provider, calculator, zero, {"from": alice})
+    return swaps, pools, coins
+
+
+def best_rate_gas(n_pools=3, sizes=(1, 10, 100)):
+    """
+    Compare the gas used by one `Swaps.get_best_rate_curve` call against one
+    `Swaps.get_best_rate` call per amount, on mock pools sharing two coins.
+    """
+    swaps, _, coins = _deploy_swaps(n_pools, 2)
+    # both methods are overloaded with an optional `_exclude_pools`
+    get_best_rate = swaps.get_best_rate["address,address,uint256"]
+    get_best_rate_curve = swaps.get_best_rate_curve["address,address,uint256[]"]
+
+    print(f"{n_pools} pools")
+    print(f"{'amounts':>8} {'get_best_rate x N':>18} {'get_best_rate_curve':>20}")
+    for size in sizes:
+        dx = LADDERS["geometric"][:size]
+        gas = sum(get_best_rate.estimate_gas(*coins, amount) for amount in dx)
+        gas_curve = get_best_rate_curve.estimate_gas(*coins, dx)
+        print(f"{size:>8} {gas:>18} {gas_curve:>20} ({1 - gas_curve / gas:.0%} saved)")
+
+
+def exchange_gas(n_swaps=3):
+    """
+    Gas used by repeated `Swaps.exchange` calls on a 4 coin mock pool, for the
+    first and last pair of coins. Run on an earlier commit to compare.
+    """
+    from brownie import accounts, chain
+
+    alice = accounts[0]
+    swaps, (swap,), coins = _deploy_swaps(1, 4)
+    for coin in coins:
+        coin._mint_for_testing(alice, 10**24, {"from": alice})
+        coin.approve(swaps, 2**256 - 1, {"from": alice})
+
+    print(f"{'pair':>6} {'swap gas':>40}")
+    for send, recv in ((0, 1), (3, 2)):
+        gas = []
+        for _ in range(n_swaps):
+            chain.mine(timedelta=15)
+            tx = swaps.exchange(swap, coins[send], coins[recv], 10**18, 0, {"from": alice})
+            gas.append(tx.gas_used)
+        print(f"{send} -> {recv} {' '.join(f'{i:>12}' for i in gas)}")
+
+
+def main():
+    pool_index()
+    pool_snapshot()
+    batch_quote()
+    newton_iterations()
+    route_graph()
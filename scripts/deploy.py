@@ -32,6 +32,9 @@ def deploy_registry():
 def deploy_pool_info():
     """
     Deploy `PoolInfo` and set the address in `AddressProvider`.
+
+    `PoolInfo` relies on `Registry.get_balances_and_rates`, so the registry in
+    `AddressProvider` must be updated with `deploy_registry` first.
     """
     balance = deployer.balance()
 
@@ -1,13 +1,81 @@
 import json
 from pathlib import Path
+from typing import Iterable, List, Optional
 
-import requests
+from scripts.pool_cache import PoolDataCache
+from scripts.pool_fetcher import PoolDataFetcher
+from scripts.pool_snapshot import read_snapshot, write_snapshot
 
-GITHUB_POOLS = "https://api.github.com/repos/curvefi/curve-contract/contents/contracts/pools"
-GITHUB_POOLDATA = "https://raw.githubusercontent.com/curvefi/curve-contract/master/contracts/pools/{}/pooldata.json"  # noqa: E501
+POOLDATA_PATH = Path(__file__).parent.parent.joinpath("pooldata.json")
+CACHE_DIRNAME = ".pooldata"
 
 
-def get_pool_data(force_fetch: bool = False) -> dict:
+def _load_json(path: Path):
+    try:
+        with path.open() as fp:
+            return json.load(fp)
+    except (json.JSONDecodeError, FileNotFoundError):
+        return None
+
+
+def _refresh_cache(
+    cache: PoolDataCache,
+    fetcher: Optional[PoolDataFetcher],
+    names: Optional[List[str]] = None,
+    max_age: float = 0,
+) -> List[str]:
+    # re-fetch stale cache entries, returns the names of the pools that were checked
+    pool_fetcher = fetcher or PoolDataFetcher()
+    try:
+        if names is None:
+            result = pool_fetcher.get_pool_names(cache.get_listing_validators())
+            if result.data is not None:
+                names = result.data
+                cache.set_listing(names, result.validators)
+            else:
+                # not modified, or not found - either way the cached listing is kept
+                names = cache.get_listing()
+                if names is None:
+                    raise ValueError(f"Unable to fetch the pool listing (HTTP {result.status})")
+                if result.not_modified:
+                    cache.set_listing(names, result.validators)
+
+        stale = [i for i in names if cache.is_stale(i, max_age)]
+        results = pool_fetcher.get_pools(stale, {i: cache.get_validators(i) for i in stale})
+    finally:
+        if fetcher is None:
+            pool_fetcher.close()
+
+    for name, result in results.items():
+        if result.not_modified:
+            cache.touch(name, result.validators)
+        elif result.data is None:
+            cache.remove(name)
+        else:
+            cache.put(name, result.data, result.validators)
+
+    if cache.get_listing() is not None:
+        for name in set(cache.names()).difference(cache.get_listing()):
+            cache.remove(name)
+    cache.prune()
+    cache.save()
+
+    modified = sum(not i.not_modified for i in results.values())
+    print(f"{modified} of {len(names)} pools modified since the last fetch")
+    return names
+
+
+def _deployed(pool_data: dict) -> dict:
+    return {k: v for k, v in pool_data.items() if "swap_address" in v}
+
+
+def get_pool_data(
+    force_fetch: bool = False,
+    fetcher: PoolDataFetcher = None,
+    path: Path = POOLDATA_PATH,
+    pools: Optional[Iterable[str]] = None,
+    max_age: float = 0,
+) -> dict:
     """
     Fetch data about existing Curve pools from Github.
 
@@ -15,30 +83,72 @@ def get_pool_data(force_fetch: bool = False) -> dict:
     and stored at `./pooldata.json`. This JSON is then used for adding new pools to the registry
     and for forked-mainnet testing.
 
-    To update the pools, delete `pooldata.json` or use `brownie run get_pool_data`
+    Each pool is also kept in a per-pool cache at `./.pooldata`, along with the `ETag` /
+    `Last-Modified` validators from the last fetch. A refresh only downloads pools that
+    changed, and a corrupt `pooldata.json` is rebuilt from the cache without a download.
+
+    If `msgpack` is installed, a binary snapshot of the same data is written at
+    `./pooldata.msgpack` and is preferred over the JSON while it is up to date.
+
+    To update the pools, use `brownie run get_pool_data`
+
+    Arguments
+    ---------
+    force_fetch : bool
+        If True, revalidate the cached data against Github
+    pools : Iterable[str], optional
+        Only load these pools. Data is read from the per-pool cache, and only pools
+        missing from the cache are fetched.
+    max_age : float
+        When fetching, pools revalidated within the last `max_age` seconds are not requested
     """
-    path = Path(__file__).parent.parent.joinpath("pooldata.json")
-
-    if not force_fetch and path.exists():
-        try:
-            with path.open() as fp:
-                return json.load(fp)
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
-
-    print("Querying Github for pool deployments...")
-    pool_data = {}
-    pool_names = [i["name"] for i in requests.get(GITHUB_POOLS).json() if i["type"] == "dir"]
-
-    for name in pool_names:
-        data = requests.get(GITHUB_POOLDATA.format(name)).json()
-        if "swap_address" not in data:
+    cache = PoolDataCache(path.with_name(CACHE_DIRNAME))
+
+    if pools is not None:
+        pools = list(pools)
+        pool_data = {} if force_fetch else cache.load(pools)
+        missing = [i for i in pools if i not in pool_data]
+        if missing:
+            print(f"Querying Github for {len(missing)} pool deployments...")
+            _refresh_cache(cache, fetcher, missing, max_age)
+            pool_data.update(cache.load(missing))
+        return _deployed(pool_data)
+
+    snapshot_path = path.with_suffix(".msgpack")
+    if not force_fetch:
+        pool_data = read_snapshot(snapshot_path, path)
+        if pool_data is not None:
+            return pool_data
+
+        pool_data = _load_json(path)
+        if pool_data is not None:
+            write_snapshot(pool_data, snapshot_path, path)
+            return pool_data
+
+        listing = cache.get_listing()
+        if listing is not None:
+            pool_data = cache.load(listing)
+            if len(pool_data) < len(listing):
+                # refetch only the entries that are missing or corrupt
+                _refresh_cache(cache, fetcher, listing, max_age=float("inf"))
+                pool_data = cache.load(listing)
+            names = listing
+        else:
+            force_fetch = True
+
+    if force_fetch:
+        print("Querying Github for pool deployments...")
+        names = _refresh_cache(cache, fetcher, max_age=max_age)
+        pool_data = cache.load(names)
+
+    for name in names:
+        if "swap_address" not in pool_data.get(name, {}):
             print(f"Cannot add {name} - no deployment address!")
-            continue
-        pool_data[name] = data
+    pool_data = _deployed(pool_data)
 
     with path.open("w") as fp:
         json.dump(pool_data, fp, sort_keys=True, indent=2)
+    write_snapshot(pool_data, snapshot_path, path)
 
     print(f"Pool deployment data saved at {path.as_posix()}")
     return pool_data
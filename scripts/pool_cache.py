@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+MANIFEST_VERSION = 1
+VALIDATOR_KEYS = ("etag", "last_modified")
+
+
+def _encode(data) -> bytes:
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+
+
+def write_atomic(path: Path, content: bytes):
+    """Write a file via a temporary file and a rename, so it is never left half-written."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as fp:
+        fp.write(content)
+    os.replace(tmp_path, path)
+
+
+class PoolDataCache:
+    """
+    Per-pool, content-addressed cache of `pooldata.json` files.
+
+    The data for each pool is stored at `objects/[SHA256].json`, keyed by the hash
+    of its canonical JSON encoding. `manifest.json` maps each pool name to the hash
+    of its current data, the time it was last fetched or revalidated, and the
+    `ETag` / `Last-Modified` validators returned by the source.
+
+    Arguments
+    ---------
+    path : Path
+        Cache directory. Created on the first write.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.objects_path = self.path.joinpath("objects")
+        self.manifest_path = self.path.joinpath("manifest.json")
+        self._manifest = None
+
+    @property
+    def manifest(self) -> dict:
+        if self._manifest is None:
+            try:
+                with self.manifest_path.open() as fp:
+                    manifest = json.load(fp)
+                assert manifest["version"] == MANIFEST_VERSION
+            except (json.JSONDecodeError, FileNotFoundError, AssertionError, KeyError):
+                manifest = {"version": MANIFEST_VERSION, "listing": {}, "pools": {}}
+            self._manifest = manifest
+        return self._manifest
+
+    def _object_path(self, data_hash: str) -> Path:
+        return self.objects_path.joinpath(f"{data_hash}.json")
+
+    def names(self) -> List[str]:
+        """Names of all pools with an entry in the cache."""
+        return sorted(self.manifest["pools"])
+
+    def get_listing(self) -> Optional[List[str]]:
+        """Pool names from the last directory listing, or `None` if never fetched."""
+        return self.manifest["listing"].get("names")
+
+    def get_listing_validators(self) -> Dict[str, str]:
+        listing = self.manifest["listing"]
+        return {k: listing[k] for k in VALIDATOR_KEYS if k in listing}
+
+    def set_listing(self, names: List[str], validators: Dict[str, str]):
+        self.manifest["listing"] = dict(validators, names=names, fetched_at=time.time())
+
+    def get(self, name: str) -> Optional[dict]:
+        """
+        Read the cached data for a single pool.
+
+        Returns `None` if the pool is not cached, or if the stored object is
+        missing. A stored object that does not match its hash is deleted, so
+        that the pool is treated as stale on the next refresh.
+        """
+        entry = self.manifest["pools"].get(name)
+        if entry is None:
+            return None
+        object_path = self._object_path(entry["hash"])
+        try:
+            with object_path.open("rb") as fp:
+                content = fp.read()
+        except FileNotFoundError:
+            return None
+        if hashlib.sha256(content).hexdigest() != entry["hash"]:
+            object_path.unlink()
+            return None
+        return json.loads(content)
+
+    def load(self, names: Optional[Iterable[str]] = None) -> Dict[str, dict]:
+        """
+        Read the cached data for many pools.
+
+        Only the objects for the requested pools are read. Pools that are not
+        cached, or whose object is corrupt, are omitted from the result.
+
+        Arguments
+        ---------
+        names : Iterable[str], optional
+            Pools to load. If not given, every cached pool is loaded.
+
+        Returns
+        -------
+        dict
+            Mapping of pool name -> pool data
+        """
+        if names is None:
+            names = self.names()
+        pool_data = {}
+        for name in names:
+            data = self.get(name)
+            if data is not None:
+                pool_data[name] = data
+        return pool_data
+
+    def get_validators(self, name: str) -> Dict[str, str]:
+        """
+        Validators for a conditional request for `name`.
+
+        Empty if the pool is not cached or its object cannot be read, as a
+        `304 Not Modified` response would then leave us without data.
+        """
+        entry = self.manifest["pools"].get(name)
+        if entry is None or not self._object_path(entry["hash"]).exists():
+            return {}
+        return {k: entry[k] for k in VALIDATOR_KEYS if k in entry}
+
+    def is_stale(self, name: str, max_age: float = 0) -> bool:
+        """Check if `name` was fetched or revalidated more than `max_age` seconds ago."""
+        entry = self.manifest["pools"].get(name)
+        if entry is None or not self._object_path(entry["hash"]).exists():
+            return True
+        return time.time() - entry["fetched_at"] >= max_age
+
+    def put(self, name: str, data: dict, validators: Dict[str, str]) -> str:
+        """
+        Store the data for a pool.
+
+        Returns
+        -------
+        str
+            SHA256 hash of the stored object
+        """
+        content = _encode(data)
+        data_hash = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(data_hash)
+        if not object_path.exists():
+            self.objects_path.mkdir(parents=True, exist_ok=True)
+            write_atomic(object_path, content)
+
+        self.manifest["pools"][name] = dict(validators, hash=data_hash, fetched_at=time.time())
+        return data_hash
+
+    def touch(self, name: str, validators: Dict[str, str]):
+        """Mark the data for a pool as revalidated without modifying it."""
+        entry = self.manifest["pools"][name]
+        for key in VALIDATOR_KEYS:
+            entry.pop(key, None)
+        entry.update(validators, fetched_at=time.time())
+
+    def remove(self, name: str):
+        self.manifest["pools"].pop(name, None)
+
+    def prune(self):
+        """Delete objects that are no longer referenced by the manifest."""
+        if not self.objects_path.exists():
+            return
+        referenced = set(i["hash"] for i in self.manifest["pools"].values())
+        for object_path in self.objects_path.glob("*.json"):
+            if object_path.stem not in referenced:
+                object_path.unlink()
+
+    def save(self):
+        """Write the manifest to disk."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        write_atomic(
+            self.manifest_path, json.dumps(self.manifest, sort_keys=True, indent=2).encode()
+        )
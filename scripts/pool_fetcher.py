@@ -0,0 +1,148 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+GITHUB_POOLS = "https://api.github.com/repos/curvefi/curve-contract/contents/contracts/pools"
+GITHUB_POOLDATA = "https://raw.githubusercontent.com/curvefi/curve-contract/master/contracts/pools/{}/pooldata.json"  # noqa: E501
+
+MAX_WORKERS = 16
+
+
+class FetchResult(NamedTuple):
+    status: int
+    data: Optional[object]
+    validators: Dict[str, str]
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+class PoolDataFetcher:
+    """
+    Fetch `pooldata.json` files for many pools over a shared connection pool.
+
+    Requests are sent concurrently from a bounded pool of worker threads. When
+    validators (`ETag` / `Last-Modified`) from a previous fetch are given, the
+    request is made conditional so an unchanged file is answered with
+    `304 Not Modified` and no body.
+
+    Arguments
+    ---------
+    pools_url : str
+        URL of the Github directory listing for `curve-contract/contracts/pools`
+    pooldata_url : str
+        URL template for a single `pooldata.json`, formatted with the pool name
+    max_workers : int
+        Maximum number of concurrent requests (and pooled connections)
+    timeout : float
+        Timeout in seconds for each request
+    """
+
+    def __init__(
+        self,
+        pools_url: str = GITHUB_POOLS,
+        pooldata_url: str = GITHUB_POOLDATA,
+        max_workers: int = MAX_WORKERS,
+        timeout: float = 30,
+    ):
+        self.pools_url = pools_url
+        self.pooldata_url = pooldata_url
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url: str, validators: Optional[Dict[str, str]] = None) -> FetchResult:
+        """
+        Fetch and decode a single JSON document.
+
+        Arguments
+        ---------
+        url : str
+            URL to fetch
+        validators : dict, optional
+            `etag` and/or `last_modified` values returned by a previous fetch
+
+        Returns
+        -------
+        FetchResult
+            Status code, decoded JSON (`None` if not modified or not found),
+            and the validators to use for the next request
+        """
+        validators = validators or {}
+        headers = {}
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last_modified" in validators:
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            return FetchResult(304, None, validators)
+        if response.status_code == 404:
+            return FetchResult(404, None, {})
+        response.raise_for_status()
+
+        new_validators = {}
+        if "ETag" in response.headers:
+            new_validators["etag"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            new_validators["last_modified"] = response.headers["Last-Modified"]
+
+        return FetchResult(response.status_code, response.json(), new_validators)
+
+    def get_pool_names(self, validators: Optional[Dict[str, str]] = None) -> FetchResult:
+        """
+        Fetch the names of all pool directories within `curve-contract`.
+
+        The `data` field of the result is a list of names, or `None` when
+        the listing has not been modified.
+        """
+        result = self.get(self.pools_url, validators)
+        if result.data is None:
+            return result
+        names = [i["name"] for i in result.data if i["type"] == "dir"]
+        return FetchResult(result.status, names, result.validators)
+
+    def get_pools(
+        self, names: Iterable[str], validators: Optional[Dict[str, Dict[str, str]]] = None
+    ) -> Dict[str, FetchResult]:
+        """
+        Concurrently fetch `pooldata.json` for each pool in `names`.
+
+        Arguments
+        ---------
+        names : Iterable[str]
+            Pool names to fetch
+        validators : dict, optional
+            Mapping of pool name -> validators from a previous fetch. Pools
+            included here are requested conditionally.
+
+        Returns
+        -------
+        dict
+            Mapping of pool name -> FetchResult
+        """
+        names: List[str] = list(names)
+        validators = validators or {}
+
+        def _fetch(name):
+            return self.get(self.pooldata_url.format(name), validators.get(name))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(names, executor.map(_fetch, names)))
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,100 @@
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, List, Optional
+
+from scripts.get_pool_data import get_pool_data
+
+
+def _load_pools(pools: Optional[List[str]]) -> dict:
+    return get_pool_data(pools=pools)
+
+
+class PoolDataIndex(Mapping):
+    """
+    Lazily loaded, indexed view of the pool data from `get_pool_data`.
+
+    Behaves as a read-only mapping of pool name -> pool data. Nothing is loaded
+    until the first access, at which point lookups by swap address, LP token,
+    base pool and coin address are built so each lookup is a single dict access.
+    Addresses are matched case-insensitively.
+
+    Arguments
+    ---------
+    pools : List[str], optional
+        Only load these pools, plus the base pool of any metapool among them.
+        If not given, all pools are loaded.
+    loader : Callable
+        Called with `pools` to load the data. Defaults to `get_pool_data`.
+    """
+
+    def __init__(
+        self,
+        pools: Optional[List[str]] = None,
+        loader: Callable[[Optional[List[str]]], dict] = _load_pools,
+    ):
+        self._pools = list(pools) if pools is not None else None
+        self._loader = loader
+        self._data = None
+
+    def _load(self) -> Dict[str, dict]:
+        if self._data is not None:
+            return self._data
+
+        data = dict(self._loader(self._pools))
+        if self._pools is not None:
+            base_pools = set(i["base_pool"] for i in data.values() if "base_pool" in i)
+            missing = sorted(base_pools.difference(data))
+            if missing:
+                data.update(self._loader(missing))
+
+        self._by_swap = {}
+        self._by_lp_token = {}
+        self._by_base_pool = {}
+        self._by_coin = {}
+        for name, pool in data.items():
+            self._by_swap[pool["swap_address"].lower()] = name
+            if "lp_token_address" in pool:
+                self._by_lp_token[pool["lp_token_address"].lower()] = name
+            if "base_pool" in pool:
+                self._by_base_pool.setdefault(pool["base_pool"], []).append(name)
+            for coin in pool["coins"]:
+                for key in ("underlying_address", "wrapped_address"):
+                    if key in coin:
+                        coin_pools = self._by_coin.setdefault(coin[key].lower(), [])
+                        if name not in coin_pools:
+                            coin_pools.append(name)
+
+        self._data = data
+        return data
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._data is not None
+
+    def __getitem__(self, name: str) -> dict:
+        return self._load()[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def get_by_swap(self, address: str) -> Optional[str]:
+        """Name of the pool deployed at `address`, or `None`."""
+        self._load()
+        return self._by_swap.get(address.lower())
+
+    def get_by_lp_token(self, address: str) -> Optional[str]:
+        """Name of the pool with the LP token `address`, or `None`."""
+        self._load()
+        return self._by_lp_token.get(address.lower())
+
+    def get_metapools(self, base_pool: str) -> List[str]:
+        """Names of all metapools using `base_pool`."""
+        self._load()
+        return list(self._by_base_pool.get(base_pool, []))
+
+    def get_pools_for_coin(self, address: str) -> List[str]:
+        """Names of all pools holding `address` as a wrapped or underlying coin."""
+        self._load()
+        return list(self._by_coin.get(address.lower(), []))
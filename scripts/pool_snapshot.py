@@ -0,0 +1,95 @@
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Optional
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+SNAPSHOT_MAGIC = b"CPDS"
+SNAPSHOT_VERSION = 1
+
+# magic, format version, crc32 of the payload, mtime (ns) and size of the source JSON
+_HEADER = struct.Struct("<4sHIQQ")
+
+
+def is_available() -> bool:
+    """Check if `msgpack` is installed, snapshots are skipped without it."""
+    return msgpack is not None
+
+
+def _source_stat(source: Path):
+    stat = os.stat(source)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def write_snapshot(pool_data: dict, path: Path, source: Path) -> bool:
+    """
+    Write a compact binary snapshot of `pool_data`.
+
+    The snapshot is a fixed header followed by the msgpack-encoded data. The
+    header records a checksum of the payload and the modification time and
+    size of `source`, the JSON file the snapshot was written alongside.
+
+    Arguments
+    ---------
+    pool_data : dict
+        Pool data, as written to `source`
+    path : Path
+        Path to write the snapshot at
+    source : Path
+        Path of the JSON file holding the same data
+
+    Returns
+    -------
+    bool
+        False if `msgpack` is not installed and no snapshot was written
+    """
+    if msgpack is None:
+        return False
+
+    payload = msgpack.packb(pool_data, use_bin_type=True)
+    mtime, size = _source_stat(source)
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, zlib.crc32(payload), mtime, size)
+
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as fp:
+        fp.write(header + payload)
+    os.replace(tmp_path, path)
+    return True
+
+
+def read_snapshot(path: Path, source: Path) -> Optional[dict]:
+    """
+    Read a snapshot written by `write_snapshot`.
+
+    Returns `None` if `msgpack` is not installed, or if the snapshot is missing,
+    from another format version, corrupt, or older than `source`.
+    """
+    if msgpack is None:
+        return None
+    try:
+        with path.open("rb") as fp:
+            content = fp.read()
+        source_stat = _source_stat(source)
+    except FileNotFoundError:
+        return None
+
+    if len(content) < _HEADER.size:
+        return None
+    magic, version, checksum, mtime, size = _HEADER.unpack_from(content)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        return None
+    if (mtime, size) != source_stat:
+        return None
+
+    payload = memoryview(content)[_HEADER.size :]
+    if zlib.crc32(payload) != checksum:
+        return None
+    try:
+        return msgpack.unpackb(payload, raw=False)
+    except (ValueError, msgpack.UnpackException):
+        return None
@@ -0,0 +1,223 @@
+"""
+Event-sourced local mirror of the pools and markets in a `Registry`.
+
+`RegistryMirror` replays the registry's `PoolAdded` and `PoolRemoved` events
+and re-reads the getters only for the pools named in them, and for the markets
+between those pools' coins. `find_pool_for_coins`, `get_coins`,
+`get_underlying_coins` and `get_n_coins` are then answered from local
+dictionaries, with the same results as the contract at the last synced block.
+
+Chain reorganisations are not handled: sync only to blocks that are final.
+"""
+
+import json
+from itertools import combinations
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from scripts.pool_cache import write_atomic
+
+MAX_COINS = 8
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+STATE_VERSION = 1
+
+
+class RegistryEvent(NamedTuple):
+    block_number: int
+    log_index: int
+    name: str
+    pool: str
+
+
+class PoolState(NamedTuple):
+    n_coins: Tuple[int, int]
+    coins: Tuple[str, ...]
+    underlying_coins: Tuple[str, ...]
+
+    def get_market_coins(self) -> Set[str]:
+        return {i for i in self.coins + self.underlying_coins if i != ZERO_ADDRESS}
+
+
+def _key(address) -> str:
+    return str(address).lower()
+
+
+def _pair_key(coin_a, coin_b) -> Tuple[str, str]:
+    return tuple(sorted((_key(coin_a), _key(coin_b))))  # type: ignore
+
+
+def get_registry_events(registry, from_block: int, to_block: int) -> List[RegistryEvent]:
+    """
+    Read the `PoolAdded` and `PoolRemoved` events emitted by a registry, in the
+    order they were emitted.
+
+    Arguments
+    ---------
+    registry : Contract
+        Brownie `Registry` contract
+    from_block : int
+        First block to read events from
+    to_block : int
+        Last block to read events from
+
+    Returns
+    -------
+    List[RegistryEvent]
+        Events, sorted by block number and log index
+    """
+    events = []
+    for name in ("PoolAdded", "PoolRemoved"):
+        for log in registry.events.get_sequence(from_block, to_block, name):
+            events.append(RegistryEvent(log.blockNumber, log.logIndex, name, log.args.pool))
+    return sorted(events)
+
+
+class RegistryMirror:
+    """
+    Local copy of the pools and markets in a `Registry`.
+
+    Arguments
+    ---------
+    registry : Contract
+        Brownie `Registry` contract. Getters are called with `block_identifier`
+        set to the block being synced to.
+    log_source : Callable[[int, int], Iterable[RegistryEvent]], optional
+        Events emitted between two blocks, inclusive. `get_registry_events` is
+        used if not given.
+    start_block : int
+        First block to replay events from, such as the registry's deployment
+    """
+
+    def __init__(
+        self,
+        registry,
+        log_source: Optional[Callable[[int, int], Iterable[RegistryEvent]]] = None,
+        start_block: int = 0,
+    ):
+        if log_source is None:
+
+            def log_source(from_block, to_block):
+                return get_registry_events(registry, from_block, to_block)
+
+        self.registry = registry
+        self.log_source = log_source
+        self.block_number = start_block - 1
+        self.pools: Dict[str, PoolState] = {}
+        self.markets: Dict[Tuple[str, str], List[str]] = {}
+
+    def sync(self, to_block: Optional[int] = None) -> Set[str]:
+        """
+        Replay the events up to a block, and update the pools they name.
+
+        Arguments
+        ---------
+        to_block : int, optional
+            Last block to replay. Defaults to the latest block.
+
+        Returns
+        -------
+        Set[str]
+            Pools that were added or removed
+        """
+        if to_block is None:
+            from brownie import chain
+
+            to_block = chain.height
+        if to_block <= self.block_number:
+            return set()
+
+        changed = {event.pool for event in self.log_source(self.block_number + 1, to_block)}
+        # a pool is only added to or removed from the markets between its own coins
+        pairs: Set[Tuple[str, str]] = set()
+        for pool in changed:
+            state = self.pools.pop(_key(pool), None)
+            if state is not None:
+                pairs |= {_pair_key(*i) for i in combinations(state.get_market_coins(), 2)}
+            state = self._read_pool(pool, to_block)
+            if state is not None:
+                self.pools[_key(pool)] = state
+                pairs |= {_pair_key(*i) for i in combinations(state.get_market_coins(), 2)}
+
+        for coin_a, coin_b in pairs:
+            self._read_market(coin_a, coin_b, to_block)
+
+        self.block_number = to_block
+        return changed
+
+    def _read_pool(self, pool: str, block: int) -> Optional[PoolState]:
+        registry = self.registry
+        n_coins = registry.get_n_coins(pool, block_identifier=block)
+        if n_coins[0] == 0:
+            return None
+        return PoolState(
+            tuple(n_coins),
+            tuple(registry.get_coins(pool, block_identifier=block)),
+            tuple(registry.get_underlying_coins(pool, block_identifier=block)),
+        )
+
+    def _read_market(self, coin_a: str, coin_b: str, block: int):
+        pools = []
+        while True:
+            pool = self.registry.find_pool_for_coins(
+                coin_a, coin_b, len(pools), block_identifier=block
+            )
+            if pool == ZERO_ADDRESS:
+                break
+            pools.append(pool)
+        if pools:
+            self.markets[(coin_a, coin_b)] = pools
+        else:
+            self.markets.pop((coin_a, coin_b), None)
+
+    def find_pool_for_coins(self, _from: str, _to: str, i: int = 0) -> str:
+        pools = self.markets.get(_pair_key(_from, _to), ())
+        return pools[i] if i < len(pools) else ZERO_ADDRESS
+
+    def get_n_coins(self, _pool: str) -> List[int]:
+        state = self.pools.get(_key(_pool))
+        return list(state.n_coins) if state else [0, 0]
+
+    def get_coins(self, _pool: str) -> List[str]:
+        state = self.pools.get(_key(_pool))
+        return list(state.coins) if state else [ZERO_ADDRESS] * MAX_COINS
+
+    def get_underlying_coins(self, _pool: str) -> List[str]:
+        state = self.pools.get(_key(_pool))
+        return list(state.underlying_coins) if state else [ZERO_ADDRESS] * MAX_COINS
+
+    def save(self, path: Path):
+        """
+        Write the mirrored state to a JSON file.
+        """
+        data = {
+            "version": STATE_VERSION,
+            "block_number": self.block_number,
+            "pools": {k: v._asdict() for k, v in self.pools.items()},
+            "markets": [[*k, v] for k, v in self.markets.items()],
+        }
+        write_atomic(Path(path), json.dumps(data, sort_keys=True).encode())
+
+    def load(self, path: Path) -> bool:
+        """
+        Read state written by `save`, replacing the current state.
+
+        Returns
+        -------
+        bool
+            False if the file is missing or was written by another version, in
+            which case the current state is left unchanged
+        """
+        try:
+            with Path(path).open() as fp:
+                data = json.load(fp)
+            assert data["version"] == STATE_VERSION
+        except (json.JSONDecodeError, FileNotFoundError, AssertionError, KeyError):
+            return False
+
+        self.block_number = data["block_number"]
+        self.pools = {
+            k: PoolState(tuple(v["n_coins"]), tuple(v["coins"]), tuple(v["underlying_coins"]))
+            for k, v in data["pools"].items()
+        }
+        self.markets = {(coin_a, coin_b): pools for coin_a, coin_b, pools in data["markets"]}
+        return True
@@ -0,0 +1,122 @@
+"""
+Read the full pool and coin lists of a registry with the paged `get_pools`
+and `get_coins_page` views.
+
+The list length is read first, then every page is requested at once from a
+pool of worker threads, so a registry with thousands of pools is read in a
+handful of calls. All calls are made at the same block so the pages agree.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
+
+PAGE_SIZE = 1000
+MAX_WORKERS = 8
+
+
+def fetch_pages(
+    get_page: Callable[[int, int], Sequence],
+    count: int,
+    page_size: int = PAGE_SIZE,
+    max_workers: int = MAX_WORKERS,
+) -> list:
+    """
+    Concurrently fetch every page of a list of known length.
+
+    Arguments
+    ---------
+    get_page : Callable[[int, int], Sequence]
+        Called with an offset and a limit, returns that page of the list
+    count : int
+        Length of the list
+    page_size : int
+        Number of items requested in each call
+    max_workers : int
+        Maximum number of concurrent calls
+
+    Returns
+    -------
+    list
+        Every item, in list order
+    """
+    offsets = range(0, count, page_size)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pages = executor.map(lambda offset: get_page(offset, page_size), offsets)
+        return [i for page in pages for i in page]
+
+
+def _get_block(block_identifier: Optional[int]) -> int:
+    if block_identifier is None:
+        from brownie import chain
+
+        block_identifier = chain.height
+    return block_identifier
+
+
+def get_all_pools(
+    registry, pool_info=None, block_identifier: Optional[int] = None, **kwargs
+) -> List[str]:
+    """
+    Read every pool in a registry.
+
+    Arguments
+    ---------
+    registry : Contract
+        `Registry`, `CryptoRegistry` or `BasePoolRegistry`
+    pool_info : Contract, optional
+        `PoolInfo` for the same address provider. Required for a `Registry`,
+        whose pages are served by `PoolInfo`.
+    block_identifier : int, optional
+        Block to read at. Defaults to the latest block.
+    **kwargs
+        Passed to `fetch_pages`
+
+    Returns
+    -------
+    List[str]
+        Pool addresses, in `pool_list` order
+    """
+    block = _get_block(block_identifier)
+    source = registry if pool_info is None else pool_info
+    if hasattr(registry, "pool_count"):
+        count = registry.pool_count(block_identifier=block)
+    else:
+        count = registry.base_pool_count(block_identifier=block)
+
+    def get_page(offset, limit):
+        return source.get_pools(offset, limit, block_identifier=block)
+
+    return fetch_pages(get_page, count, **kwargs)
+
+
+def get_all_coins(
+    registry, pool_info=None, block_identifier: Optional[int] = None, **kwargs
+) -> List[str]:
+    """
+    Read every unique coin in a registry.
+
+    Arguments
+    ---------
+    registry : Contract
+        `Registry` or `CryptoRegistry`
+    pool_info : Contract, optional
+        `PoolInfo` for the same address provider. Required for a `Registry`,
+        whose pages are served by `PoolInfo`.
+    block_identifier : int, optional
+        Block to read at. Defaults to the latest block.
+    **kwargs
+        Passed to `fetch_pages`
+
+    Returns
+    -------
+    List[str]
+        Coin addresses, in `get_coin` order
+    """
+    block = _get_block(block_identifier)
+    source = registry if pool_info is None else pool_info
+    count = registry.coin_count(block_identifier=block)
+
+    def get_page(offset, limit):
+        return source.get_coins_page(offset, limit, block_identifier=block)
+
+    return fetch_pages(get_page, count, **kwargs)
@@ -0,0 +1,427 @@
+"""
+Off-chain route finder for `Swaps.exchange_multiple`.
+
+Builds a token graph from the markets of one or more registries, held as a
+compressed sparse row (CSR) adjacency structure, then runs a k-best search
+for routes of up to four hops. Each hop is quoted by a callable,
+by default `RegistryQuoter`, which uses the integer-exact port in
+`scripts.stableswap_math` with the same pool parameters as the `Swaps`
+calculator. The routes found carry the `_route`, `_swap_params` and `_pools`
+arrays expected by `exchange_multiple` and `get_exchange_multiple_amount`.
+
+Registries are duck-typed: anything with the contract's view methods works,
+such as a brownie `Contract`.
+"""
+
+from collections import defaultdict
+from itertools import combinations, count
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple, Union
+
+from scripts import stableswap_math
+
+MAX_HOPS = 4
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# swap types used by `exchange_multiple`
+STABLESWAP = 1
+STABLESWAP_UNDERLYING = 2
+CRYPTOSWAP = 3
+CRYPTOSWAP_UNDERLYING = 4
+
+
+class Hop(NamedTuple):
+    pool: str
+    coin_in: str
+    coin_out: str
+    i: int
+    j: int
+    swap_type: int
+
+
+class Route(NamedTuple):
+    hops: Tuple[Hop, ...]
+    amount_in: int
+    amount_out: int
+
+    @property
+    def coins(self) -> List[str]:
+        return [self.hops[0].coin_in] + [hop.coin_out for hop in self.hops]
+
+    def exchange_multiple_args(self) -> Tuple[List[str], List[List[int]], List[str]]:
+        """
+        Get the route arrays for `Swaps.exchange_multiple`.
+
+        Returns
+        -------
+        List[str]
+            `_route`: [initial token, pool, token, pool, token, ...], padded
+            to 9 items with the zero address
+        List[List[int]]
+            `_swap_params`: [i, j, swap type] for each hop, padded to 4 items
+        List[str]
+            `_pools`: only needed for swaps via zap contracts, which are not
+            routed, so always 4 zero addresses
+        """
+        route = [self.hops[0].coin_in]
+        for hop in self.hops:
+            route += [hop.pool, hop.coin_out]
+        route += [ZERO_ADDRESS] * (2 * MAX_HOPS + 1 - len(route))
+
+        swap_params = [[hop.i, hop.j, hop.swap_type] for hop in self.hops]
+        swap_params += [[0, 0, 0]] * (MAX_HOPS - len(swap_params))
+
+        return route, swap_params, [ZERO_ADDRESS] * MAX_HOPS
+
+
+def load_hops(registry, is_crypto: bool = False) -> List[Hop]:
+    """
+    Read every market in a registry as two hops, one in each direction.
+
+    Coin pairs are read from `get_coin_swap_complement` where the registry
+    has it, and otherwise from the coins of each pool in `pool_list`. The
+    pools for each pair are then read from `find_pool_for_coins`.
+
+    Arguments
+    ---------
+    registry : Contract
+        `Registry` or `CryptoRegistry`
+    is_crypto : bool
+        If True, hops use the cryptoswap swap types
+
+    Returns
+    -------
+    List[Hop]
+        Hops for every market in the registry
+    """
+    pairs = set()
+    if hasattr(registry, "get_coin_swap_complement"):
+        for k in range(registry.coin_count()):
+            coin = registry.get_coin(k)
+            for x in range(registry.get_coin_swap_count(coin)):
+                pairs.add(tuple(sorted((coin, registry.get_coin_swap_complement(coin, x)))))
+    else:
+        for k in range(registry.pool_count()):
+            pool = registry.pool_list(k)
+            for coins in (registry.get_coins(pool), registry.get_underlying_coins(pool)):
+                coins = sorted(i for i in coins if i != ZERO_ADDRESS)
+                pairs.update(combinations(coins, 2))
+
+    swap_types = (
+        (CRYPTOSWAP, CRYPTOSWAP_UNDERLYING) if is_crypto else (STABLESWAP, STABLESWAP_UNDERLYING)
+    )
+    hops = []
+    for coin_a, coin_b in sorted(pairs):
+        for x in count():
+            pool = registry.find_pool_for_coins(coin_a, coin_b, x)
+            if pool == ZERO_ADDRESS:
+                break
+            i, j, is_underlying = registry.get_coin_indices(pool, coin_a, coin_b)
+            swap_type = swap_types[bool(is_underlying)]
+            hops.append(Hop(pool, coin_a, coin_b, i, j, swap_type))
+            hops.append(Hop(pool, coin_b, coin_a, j, i, swap_type))
+
+    return hops
+
+
+def fetch_hops(registry, pool_info) -> List[Hop]:
+    """
+    Read every market in a registry as two hops, one in each direction, using
+    the paged `PoolInfo.get_swap_edges` view.
+
+    This gives the same hops as `load_hops`, in a different order, in one call
+    per page instead of several calls per market.
+
+    Arguments
+    ---------
+    registry : Contract
+        `Registry`
+    pool_info : Contract
+        `PoolInfo` deployed for the same address provider
+
+    Returns
+    -------
+    List[Hop]
+        Hops for every market in the registry
+    """
+    coin_count = registry.coin_count()
+    cursor = [0, 0, 0]
+    hops = []
+    while cursor[0] < coin_count:
+        edges, cursor = pool_info.get_swap_edges(cursor)
+        for coin_a, coin_b, pool, i, j, is_underlying in edges:
+            swap_type = STABLESWAP_UNDERLYING if is_underlying else STABLESWAP
+            hops.append(Hop(pool, coin_a, coin_b, i, j, swap_type))
+            hops.append(Hop(pool, coin_b, coin_a, j, i, swap_type))
+
+    return hops
+
+
+class SwapGraph:
+    """
+    Hops held as a compressed sparse row (CSR) adjacency structure.
+
+    Coins and pools are numbered in order of first appearance. The hops out of
+    coin number `c` are at positions `offsets[c]` to `offsets[c + 1]` of
+    `hops`, and the same positions of `targets` and `pools` hold the numbers
+    of each hop's `coin_out` and pool. Searches index these flat lists rather
+    than looking up coins and pools by address.
+    """
+
+    def __init__(self, hops: Iterable[Hop]):
+        hops = list(hops)
+        coin_ids: Dict[str, int] = {}
+        pool_ids: Dict[str, int] = {}
+        for hop in hops:
+            coin_ids.setdefault(hop.coin_in, len(coin_ids))
+            coin_ids.setdefault(hop.coin_out, len(coin_ids))
+            pool_ids.setdefault(hop.pool, len(pool_ids))
+
+        offsets = [0] * (len(coin_ids) + 1)
+        for hop in hops:
+            offsets[coin_ids[hop.coin_in] + 1] += 1
+        for c in range(len(coin_ids)):
+            offsets[c + 1] += offsets[c]
+
+        # counting sort by `coin_in`, keeping the given order of each coin's hops
+        position = offsets[:-1]
+        self.hops: List[Hop] = [None] * len(hops)  # type: ignore
+        self.targets = [0] * len(hops)
+        self.pools = [0] * len(hops)
+        for hop in hops:
+            c = coin_ids[hop.coin_in]
+            k = position[c]
+            position[c] += 1
+            self.hops[k] = hop
+            self.targets[k] = coin_ids[hop.coin_out]
+            self.pools[k] = pool_ids[hop.pool]
+
+        # the same structure by `coin_out`, holding the number of each hop's `coin_in`
+        reverse_offsets = [0] * (len(coin_ids) + 1)
+        for c in self.targets:
+            reverse_offsets[c + 1] += 1
+        for c in range(len(coin_ids)):
+            reverse_offsets[c + 1] += reverse_offsets[c]
+        position = reverse_offsets[:-1]
+        self.sources = [0] * len(hops)
+        for c in range(len(coin_ids)):
+            for k in range(offsets[c], offsets[c + 1]):
+                target = self.targets[k]
+                self.sources[position[target]] = c
+                position[target] += 1
+
+        self.coins = list(coin_ids)
+        self.coin_ids = coin_ids
+        self.offsets = offsets
+        self.reverse_offsets = reverse_offsets
+
+    def __len__(self) -> int:
+        return len(self.hops)
+
+    def get_distances(self, coin: str, max_hops: int = MAX_HOPS) -> List[int]:
+        """
+        Get the least number of hops from each coin to `coin`, by coin number.
+        Coins that need more than `max_hops` hops are given `max_hops + 1`.
+        """
+        distances = [max_hops + 1] * len(self.coins)
+        distances[self.coin_ids[coin]] = 0
+        level = [self.coin_ids[coin]]
+        for distance in range(1, max_hops + 1):
+            next_level = []
+            for c in level:
+                for k in range(self.reverse_offsets[c], self.reverse_offsets[c + 1]):
+                    source = self.sources[k]
+                    if distances[source] > distance:
+                        distances[source] = distance
+                        next_level.append(source)
+            level = next_level
+        return distances
+
+    def get_hops(self, coin: str) -> List[Hop]:
+        """
+        Get the hops out of a coin.
+        """
+        c = self.coin_ids.get(coin)
+        if c is None:
+            return []
+        return self.hops[self.offsets[c] : self.offsets[c + 1]]
+
+
+class RegistryQuoter:
+    """
+    Quote stableswap hops with `stableswap_math`.
+
+    Pool parameters are read from the registry as in
+    `Swaps._get_calculator_params`, once per pool and side, so quotes match
+    `Swaps.get_exchange_amounts` for pools using the default calculator.
+    Metapool underlying hops are quoted as a single pool of the underlying
+    coins, as that method does. Other swap types, and empty pools, raise
+    `ValueError`.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        self._params: Dict[Tuple[str, bool], tuple] = {}
+
+    def get_params(self, pool: str, is_underlying: bool) -> tuple:
+        """
+        Get the `stableswap_math.get_dy` arguments for a pool, excluding the
+        coin indices and amounts.
+        """
+        key = (pool, is_underlying)
+        if key not in self._params:
+            registry = self.registry
+            n_coins = registry.get_n_coins(pool)[int(is_underlying)]
+            if is_underlying:
+                balances = registry.get_underlying_balances(pool)
+                decimals = registry.get_underlying_decimals(pool)
+                rates = [10**18] * n_coins
+            else:
+                balances = registry.get_balances(pool)
+                decimals = registry.get_decimals(pool)
+                rates = registry.get_rates(pool)
+            precisions = [10 ** (18 - i) for i in decimals[:n_coins]]
+            self._params[key] = (
+                n_coins,
+                list(balances[:n_coins]),
+                registry.get_A(pool),
+                registry.get_fees(pool)[0],
+                list(rates[:n_coins]),
+                precisions,
+            )
+        return self._params[key]
+
+    def __call__(self, hop: Hop, amount: int) -> int:
+        if hop.swap_type not in (STABLESWAP, STABLESWAP_UNDERLYING):
+            raise ValueError(f"Cannot quote swap type {hop.swap_type}")
+        params = self.get_params(hop.pool, hop.swap_type == STABLESWAP_UNDERLYING)
+        try:
+            return stableswap_math.get_dy(*params, hop.i, hop.j, [amount])[0]
+        except ZeroDivisionError:
+            # the calculator reverts on an empty pool
+            raise ValueError(f"Cannot quote empty pool {hop.pool}")
+
+
+def find_routes(
+    hops: Union[SwapGraph, Iterable[Hop]],
+    quote: Callable[[Hop, int], int],
+    coin_in: str,
+    coin_out: str,
+    amount: int,
+    k: int = 3,
+    max_hops: int = MAX_HOPS,
+) -> List[Route]:
+    """
+    Find the best routes for an exchange.
+
+    The search extends routes one hop at a time. After each hop only the `k`
+    routes giving the largest amount of each coin are kept, so the result is
+    exact for a single hop and a beam search beyond that. Routes never visit
+    a coin or a pool twice.
+
+    Arguments
+    ---------
+    hops : SwapGraph | Iterable[Hop]
+        Hops to route through, such as from `load_hops`. Build a `SwapGraph`
+        once when searching the same hops many times.
+    quote : Callable[[Hop, int], int]
+        Amount received from a hop for a given amount sent. Hops for which
+        this raises `ValueError` are skipped.
+    coin_in : str
+        Address of the coin to be sent
+    coin_out : str
+        Address of the coin to be received
+    amount : int
+        Amount of `coin_in` to be sent
+    k : int
+        Number of routes to return
+    max_hops : int
+        Maximum number of hops in a route, at most `MAX_HOPS`
+
+    Returns
+    -------
+    List[Route]
+        Up to `k` routes, by descending amount received. Ties are broken in
+        favour of fewer hops.
+    """
+    if not 1 <= max_hops <= MAX_HOPS:
+        raise ValueError(f"max_hops must be between 1 and {MAX_HOPS}")
+
+    graph = hops if isinstance(hops, SwapGraph) else SwapGraph(hops)
+    if coin_in not in graph.coin_ids or coin_out not in graph.coin_ids:
+        return []
+    source = graph.coin_ids[coin_in]
+    target = graph.coin_ids[coin_out]
+    offsets, targets, pools = graph.offsets, graph.targets, graph.pools
+    # routes into a coin too far from `coin_out` to finish within `max_hops` are dropped
+    distances = graph.get_distances(coin_out, max_hops)
+
+    quotes: Dict[Tuple[int, int], int] = {}
+
+    def _quote(edge, value):
+        key = (edge, value)
+        if key not in quotes:
+            try:
+                quotes[key] = quote(graph.hops[edge], value)
+            except ValueError:
+                quotes[key] = 0
+        return quotes[key]
+
+    routes: List[Route] = []
+    # (hop positions, coins visited, pools used, amount received)
+    frontier: List[Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...], int]] = [
+        ((), (source,), (), amount)
+    ]
+    for depth in range(max_hops):
+        remaining = max_hops - depth - 1
+        candidates: Dict[int, list] = defaultdict(list)
+        for edges, coins, used_pools, value in frontier:
+            coin = coins[-1]
+            for edge in range(offsets[coin], offsets[coin + 1]):
+                if distances[targets[edge]] > remaining:
+                    continue
+                if targets[edge] in coins or pools[edge] in used_pools:
+                    continue
+                received = _quote(edge, value)
+                if received > 0:
+                    candidates[targets[edge]].append(
+                        (
+                            received,
+                            edges + (edge,),
+                            coins + (targets[edge],),
+                            used_pools + (pools[edge],),
+                        )
+                    )
+
+        frontier = []
+        for coin, items in candidates.items():
+            items.sort(key=lambda item: -item[0])
+            if coin == target:
+                for value, edges, _, _ in items[:k]:
+                    routes.append(Route(tuple(graph.hops[e] for e in edges), amount, value))
+            else:
+                frontier += [(edges, coins, used, value) for value, edges, coins, used in items[:k]]
+        if not frontier:
+            break
+
+    routes.sort(key=lambda route: (-route.amount_out, len(route.hops)))
+    return routes[:k]
+
+
+def find_best_route(
+    hops: Union[SwapGraph, Iterable[Hop]],
+    quote: Callable[[Hop, int], int],
+    coin_in: str,
+    coin_out: str,
+    amount: int,
+    max_hops: int = MAX_HOPS,
+) -> Route:
+    """
+    Find the route giving the largest amount of `coin_out`.
+
+    Arguments are the same as `find_routes`. Raises `ValueError` if there is
+    no route.
+    """
+    routes = find_routes(hops, quote, coin_in, coin_out, amount, k=1, max_hops=max_hops)
+    if not routes:
+        raise ValueError("No available route")
+    return routes[0]
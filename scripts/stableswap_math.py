@@ -0,0 +1,271 @@
+"""
+Integer-exact port of the StableSwap math in `contracts/CurveCalc.vy`.
+
+Each function mirrors the contract line by line: all arithmetic is on Python
+integers with floor division, so results are identical to the EVM. Where the
+contract would revert on an integer underflow or invalid coin index, a
+`ValueError` is raised. Integer overflow is not checked, as it requires inputs
+far beyond any realistic pool balance.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+MAX_COINS = 8
+INPUT_SIZE = 100
+FEE_DENOMINATOR = 10**10
+
+
+def _sub(a: int, b: int) -> int:
+    if b > a:
+        raise ValueError("Integer underflow")
+    return a - b
+
+
+def _pad(values: Sequence[int]) -> List[int]:
+    values = list(values)
+    if len(values) > MAX_COINS:
+        raise ValueError(f"Cannot exceed {MAX_COINS} coins")
+    return values + [0] * (MAX_COINS - len(values))
+
+
+def get_D(n_coins: int, xp: Sequence[int], amp: int, D0: Optional[int] = None) -> int:
+    """
+    Calculate the invariant (D).
+
+    Arguments
+    ---------
+    n_coins : int
+        Number of coins in the pool
+    xp : Sequence[int]
+        Coin balances made into the same (1e18) digits. Iteration stops at the
+        first zero balance.
+    amp : int
+        Amplification coefficient
+    D0 : int, optional
+        Initial guess for the invariant, such as the invariant before a small
+        change in balances. Defaults to the sum of the balances, as in the
+        contract. The result may differ by 1 from a cold start.
+
+    Returns
+    -------
+    int
+        The value of the invariant
+    """
+    return _get_D(n_coins, xp, amp, D0)[0]
+
+
+def _get_D(n_coins, xp, amp, D0):
+    # returns the invariant and the number of Newton iterations
+    S = 0
+    for _x in xp:
+        if _x == 0:
+            break
+        S += _x
+    if S == 0:
+        return 0, 0
+
+    D = S if D0 is None else D0
+    Ann = amp * n_coins
+    for _i in range(255):
+        D_P = D
+        for _x in xp:
+            if _x == 0:
+                break
+            D_P = D_P * D // (_x * n_coins)
+        Dprev = D
+        D = (Ann * S + D_P * n_coins) * D // (_sub(Ann, 1) * D + (n_coins + 1) * D_P)
+        # Equality with the precision of 1
+        if abs(D - Dprev) <= 1:
+            break
+    return D, _i + 1
+
+
+def get_y(
+    D: int,
+    n_coins: int,
+    xp: Sequence[int],
+    amp: int,
+    i: int,
+    j: int,
+    x: int,
+    y0: Optional[int] = None,
+) -> int:
+    """
+    Calculate the new balance of coin `j` given a new balance `x` of coin `i`.
+
+    Arguments
+    ---------
+    D : int
+        The invariant
+    n_coins : int
+        Number of coins in the pool
+    xp : Sequence[int]
+        Coin balances made into the same (1e18) digits
+    amp : int
+        Amplification coefficient
+    i : int
+        Index of the changed coin (trade in)
+    j : int
+        Index of the other changed coin (trade out)
+    x : int
+        New balance of coin `i`
+    y0 : int, optional
+        Initial guess for the new balance of coin `j`. Defaults to `D`, as in
+        `CurveCalc`. Newton's method converges monotonically when started above
+        the solution, such as from the solution for a smaller trade.
+
+    Returns
+    -------
+    int
+        New balance of coin `j`
+    """
+    return _get_y(D, n_coins, xp, amp, i, j, x, y0)[0]
+
+
+def _get_y(D, n_coins, xp, amp, i, j, x, y0):
+    # returns the new balance of coin j and the number of Newton iterations
+    if not (i != j and 0 <= i < n_coins and 0 <= j < n_coins):
+        raise ValueError("Invalid coin index")
+
+    Ann = amp * n_coins
+
+    S_ = 0
+    c = D
+    for _i in range(min(n_coins, MAX_COINS)):
+        if _i == i:
+            _x = x
+        elif _i != j:
+            _x = xp[_i]
+        else:
+            continue
+        S_ += _x
+        c = c * D // (_x * n_coins)
+    c = c * D // (Ann * n_coins)
+    b = S_ + D // Ann  # - D
+
+    y = D if y0 is None else y0
+    for _i in range(255):
+        y_prev = y
+        y = (y * y + c) // _sub(2 * y + b, D)
+        # Equality with the precision of 1
+        if abs(y - y_prev) <= 1:
+            break
+    return y, _i + 1
+
+
+def get_xp(
+    balances: Sequence[int], rates: Sequence[int], precisions: Sequence[int]
+) -> Tuple[List[int], List[int]]:
+    """
+    Normalise coin balances to 1e18 digits.
+
+    Returns
+    -------
+    List[int]
+        Balances made into the same (1e18) digits
+    List[int]
+        Combined rate and precision multiplier for each coin
+    """
+    balances, rates, precisions = _pad(balances), _pad(rates), _pad(precisions)
+    xp = [balances[k] * rates[k] * precisions[k] // 10**18 for k in range(MAX_COINS)]
+    ratesp = [precisions[k] * rates[k] for k in range(MAX_COINS)]
+    return xp, ratesp
+
+
+def get_dy(
+    n_coins: int,
+    balances: Sequence[int],
+    amp: int,
+    fee: int,
+    rates: Sequence[int],
+    precisions: Sequence[int],
+    i: int,
+    j: int,
+    dx: Sequence[int],
+    warm_start: bool = False,
+) -> List[int]:
+    """
+    Bulk-calculate the amount of coin `j` given in exchange for coin `i`.
+
+    Arguments
+    ---------
+    n_coins : int
+        Number of coins in the pool
+    balances : Sequence[int]
+        Coin balances
+    amp : int
+        Amplification coefficient
+    fee : int
+        Pool's fee at 1e10 basis
+    rates : Sequence[int]
+        Rates for "lent out" tokens
+    precisions : Sequence[int]
+        Precision multipliers to get the coin to 1e18 basis
+    i : int
+        Index of the changed coin (trade in)
+    j : int
+        Index of the other changed coin (trade out)
+    dx : Sequence[int]
+        Amounts of coin `i` (trade in). Unlike the contract, this may be of any
+        length. As in the contract, calculation stops at the first zero amount
+        and the remaining values are returned unchanged.
+    warm_start : bool
+        If True, mirror `CurveCalcV2`: while amounts are increasing, each
+        `get_y` iteration starts from the previous solution. Results may differ
+        by 1 from `CurveCalc`.
+
+    Returns
+    -------
+    List[int]
+        Amounts of coin `j` (trade out)
+    """
+    xp, ratesp = get_xp(balances, rates, precisions)
+    D = get_D(n_coins, xp, amp)
+
+    dy = list(dx)
+    y = D
+    prev_dx = 0
+    for k in range(len(dx)):
+        if dx[k] == 0:
+            break
+        if not warm_start or dx[k] < prev_dx:
+            y = D
+        prev_dx = dx[k]
+        x_after_trade = dx[k] * ratesp[i] // 10**18 + xp[i]
+        y = get_y(D, n_coins, xp, amp, i, j, x_after_trade, y)
+        dy[k] = _sub(_sub(xp[j], y), 1) * 10**18 // ratesp[j]
+        dy[k] -= dy[k] * fee // FEE_DENOMINATOR
+
+    return dy
+
+
+def get_dx(
+    n_coins: int,
+    balances: Sequence[int],
+    amp: int,
+    fee: int,
+    rates: Sequence[int],
+    precisions: Sequence[int],
+    i: int,
+    j: int,
+    dy: int,
+) -> int:
+    """
+    Calculate the amount of coin `i` taken when exchanging for coin `j`.
+
+    Arguments are the same as `get_dy`, except `dy` is a single amount of
+    coin `j` (trade out).
+
+    Returns
+    -------
+    int
+        Amount of coin `i` (trade in)
+    """
+    xp, ratesp = get_xp(balances, rates, precisions)
+    D = get_D(n_coins, xp, amp)
+
+    y_after_trade = _sub(
+        xp[j], dy * ratesp[j] // 10**18 * FEE_DENOMINATOR // _sub(FEE_DENOMINATOR, fee)
+    )
+    x = get_y(D, n_coins, xp, amp, j, i, y_after_trade)
+    return _sub(x, xp[i]) * 10**18 // ratesp[i]
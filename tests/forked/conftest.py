@@ -4,10 +4,10 @@ from brownie import Contract
 from brownie_tokens import MintableForkToken
 
 from scripts.add_pools import add_pool
-from scripts.get_pool_data import get_pool_data
+from scripts.pool_index import PoolDataIndex
 
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
-_pooldata = get_pool_data()
+_pooldata = PoolDataIndex()
 
 
 def pytest_addoption(parser):
@@ -16,6 +16,11 @@ def pytest_addoption(parser):
 
 
 def pytest_configure(config):
+    # only load the data for targeted pools
+    global _pooldata
+    if config.getoption("pool"):
+        _pooldata = PoolDataIndex(config.getoption("pool").split(","))
+
     # add custom markers
     config.addinivalue_line("markers", "once: only run this test once (no parametrization)")
     config.addinivalue_line("markers", "params: test parametrization filters")
@@ -29,6 +34,9 @@ def pytest_configure(config):
 
 
 def pytest_generate_tests(metafunc):
+    if "pool_name" in metafunc.fixturenames:
+        metafunc.parametrize("pool_name", list(_pooldata), indirect=True, scope="session")
+
     # apply initial parametrization of `itercoins`
     for marker in metafunc.definition.iter_markers(name="itercoins"):
         for item in marker.args:
@@ -106,7 +114,7 @@ def pytest_collection_finish(session):
         brownie.network.connect("mainnet-fork")
 
 
-@pytest.fixture(scope="session", params=_pooldata.keys())
+@pytest.fixture(scope="session")
 def pool_name(request):
     return request.param
 
@@ -203,9 +211,7 @@ class _MintableTestToken(MintableForkToken):
             self._rate_fn = next(getattr(self, i) for i in self._rate_methods if hasattr(self, i))
         else:
             if "base_pool_token" in coin_data:
-                base_pool = next(
-                    i for i in _pooldata.values() if i.get("lp_token_address") == self.address
-                )
+                base_pool = _pooldata[_pooldata.get_by_lp_token(self.address)]
                 self._rate_fn = Contract(base_pool["swap_address"]).get_virtual_price
             else:
                 self._rate_fn = None
@@ -111,6 +111,11 @@ def calculator(CurveCalc, alice):
     yield CurveCalc.deploy({"from": alice})
 
 
+@pytest.fixture(scope="module")
+def calculator_v2(CurveCalcV2, alice):
+    yield CurveCalcV2.deploy({"from": alice})
+
+
 @pytest.fixture(scope="module")
 def provider(AddressProvider, alice):
     yield AddressProvider.deploy(alice, {"from": alice})
@@ -123,6 +128,21 @@ def registry(Registry, alice, provider, gauge_controller):
     yield contract
 
 
+@pytest.fixture(scope="module")
+def crypto_registry(CryptoRegistry, alice, provider):
+    # the base pool registry is only used for metapools
+    yield CryptoRegistry.deploy(provider, ZERO_ADDRESS, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def swaps_provider(alice, provider, crypto_registry):
+    # `Swaps` queries the crypto registry at id 5 before the main registry
+    for i in range(4):
+        provider.add_new_id(provider, "Filler", {"from": alice})
+    provider.add_new_id(crypto_registry, "Crypto Registry", {"from": alice})
+    yield provider
+
+
 @pytest.fixture(scope="module")
 def registry_pool_info(PoolInfo, alice, provider):
     yield PoolInfo.deploy(provider, {"from": alice})
@@ -131,7 +151,7 @@ def registry_pool_info(PoolInfo, alice, provider):
 @pytest.fixture(scope="module")
 def registry_swap(Swaps, alice, provider, registry, calculator):
     provider.set_address(0, registry, {"from": alice})
-    yield Swaps.deploy(provider, calculator, {"from": alice})
+    yield Swaps.deploy(provider, calculator, ZERO_ADDRESS, {"from": alice})
 
 
 @pytest.fixture(scope="module")
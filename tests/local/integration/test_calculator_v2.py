@@ -0,0 +1,76 @@
+import pytest
+from brownie.test import given, strategy
+from hypothesis import Phase, settings
+from synthetic_data import CALC_POOL, LADDERS
+
+from scripts import stableswap_math
+
+
+@given(
+    st_precision=strategy("uint[8]", min_value=6, max_value=18),
+    st_balance=strategy("uint[8]", min_value=10**20, max_value=10**26),
+    st_rates=strategy("uint[8]", min_value=10**18, max_value=10**19),
+    st_idx=strategy("uint[2]", max_value=7, unique=True),
+    st_dx=strategy("uint[]", min_value=10**15, max_value=10**25, min_length=1, max_length=100),
+    n_coins=strategy("uint", min_value=2, max_value=8),
+    is_sorted=strategy("bool"),
+)
+@settings(phases=[Phase.reuse, Phase.generate])
+def test_get_dy(
+    calculator, calculator_v2, st_precision, st_balance, st_rates, st_idx, st_dx, n_coins, is_sorted
+):
+    i, j = [k % n_coins for k in st_idx]
+    if i == j:
+        j = (i + 1) % n_coins
+    zeros = [0] * (8 - n_coins)
+    precision = [10 ** (18 - k) for k in st_precision[:n_coins]] + zeros
+    balances = [st_balance[k] // precision[k] for k in range(n_coins)] + zeros
+    rates = st_rates[:n_coins] + zeros
+    dx = [k // precision[i] + 1 for k in (sorted(st_dx) if is_sorted else st_dx)]
+    dx += [0] * (100 - len(dx))
+
+    args = (n_coins, balances, 200, 4000000, rates, precision, i, j, dx)
+    dy = calculator_v2.get_dy(*args)
+    assert dy == stableswap_math.get_dy(*args, warm_start=True)
+    assert all(abs(a - b) <= 1 for a, b in zip(dy, calculator.get_dy(*args)))
+
+
+def test_get_dx(calculator, calculator_v2):
+    for dy in (10**18, 10**21, 10**23):
+        assert calculator_v2.get_dx(*CALC_POOL, 0, 1, dy) == calculator.get_dx(*CALC_POOL, 0, 1, dy)
+
+
+def test_decreasing_amounts(calculator, calculator_v2):
+    dx = [10**23, 10**22, 10**21, 10**22, 10**20] + [0] * 95
+    assert calculator_v2.get_dy(*CALC_POOL, 0, 1, dx) == calculator.get_dy(*CALC_POOL, 0, 1, dx)
+
+
+@pytest.mark.parametrize("ladder", LADDERS.keys())
+def test_gas_saving(calculator, calculator_v2, ladder):
+    dx = LADDERS[ladder]
+    gas = calculator.get_dy.estimate_gas(*CALC_POOL, 0, 1, dx)
+    gas_v2 = calculator_v2.get_dy.estimate_gas(*CALC_POOL, 0, 1, dx)
+    assert gas_v2 < gas
+
+
+@pytest.mark.parametrize("ladder", LADDERS.keys())
+def test_get_dy_bulk(calculator_v2, ladder):
+    dx = LADDERS[ladder]
+    assert calculator_v2.get_dy_bulk(*CALC_POOL, 0, 1, dx) == calculator_v2.get_dy(
+        *CALC_POOL, 0, 1, dx
+    )
+
+
+def test_get_dy_bulk_zero_amount(calculator_v2):
+    dx = [10**18, 0, 2 * 10**18]
+    expected = calculator_v2.get_dy(*CALC_POOL, 0, 1, [10**18, 2 * 10**18] + [0] * 98)
+
+    assert calculator_v2.get_dy_bulk(*CALC_POOL, 0, 1, dx) == [expected[0], 0, expected[1]]
+    assert calculator_v2.get_dy_bulk(*CALC_POOL, 0, 1, []) == []
+
+
+@pytest.mark.parametrize("size", [1, 10])
+def test_get_dy_bulk_gas(calculator, calculator_v2, size):
+    dx = LADDERS["geometric"][:size]
+    gas = calculator.get_dy.estimate_gas(*CALC_POOL, 0, 1, dx + [0] * (100 - size))
+    assert calculator_v2.get_dy_bulk.estimate_gas(*CALC_POOL, 0, 1, dx) < gas
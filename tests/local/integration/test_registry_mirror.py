@@ -0,0 +1,158 @@
+import itertools
+
+import pytest
+from brownie import ERC20, chain
+
+from scripts.registry_mirror import RegistryMirror
+
+pytestmark = pytest.mark.params(n_coins=3, n_metacoins=3)
+
+
+@pytest.fixture(scope="module")
+def coins(underlying_coins, wrapped_coins, meta_coins):
+    return list(dict.fromkeys(underlying_coins + wrapped_coins + meta_coins))
+
+
+@pytest.fixture(scope="module")
+def pools(swap, lending_swap, meta_swap):
+    return [swap, lending_swap, meta_swap]
+
+
+@pytest.fixture
+def mirror(registry):
+    return RegistryMirror(registry, start_block=chain.height)
+
+
+def _assert_mirrored(mirror, registry, pools, coins, block_identifier=None):
+    for pool in pools:
+        assert mirror.get_n_coins(pool) == registry.get_n_coins(
+            pool, block_identifier=block_identifier
+        )
+        assert mirror.get_coins(pool) == registry.get_coins(pool, block_identifier=block_identifier)
+        assert mirror.get_underlying_coins(pool) == registry.get_underlying_coins(
+            pool, block_identifier=block_identifier
+        )
+    for coin_a in coins:
+        for coin_b in coins:
+            for i in range(3):
+                expected = registry.find_pool_for_coins(
+                    coin_a, coin_b, i, block_identifier=block_identifier
+                )
+                assert mirror.find_pool_for_coins(coin_a, coin_b, i) == expected
+
+
+@pytest.fixture
+def add_pools(
+    alice,
+    registry,
+    swap,
+    lending_swap,
+    meta_swap,
+    lp_token,
+    meta_lp_token,
+    n_coins,
+    n_metacoins,
+    is_v1,
+    rate_method_id,
+):
+    def _add():
+        registry.add_pool_without_underlying(
+            swap,
+            n_coins,
+            lp_token,
+            "0x00",
+            0,
+            0,
+            hasattr(swap, "initial_A"),
+            is_v1,
+            "",
+            {"from": alice},
+        )
+        registry.add_pool(
+            lending_swap,
+            n_coins,
+            ERC20.deploy("", "", 18, {"from": alice}),
+            rate_method_id,
+            0,
+            0,
+            hasattr(lending_swap, "initial_A"),
+            is_v1,
+            "",
+            {"from": alice},
+        )
+        registry.add_metapool(meta_swap, n_metacoins, meta_lp_token, 0, "", {"from": alice})
+
+    return _add
+
+
+def test_add_pools(mirror, registry, pools, coins, add_pools):
+    add_pools()
+
+    assert mirror.sync() == {i.address for i in pools}
+    assert mirror.block_number == chain.height
+    _assert_mirrored(mirror, registry, pools, coins)
+
+
+def test_remove_pools(alice, mirror, registry, pools, coins, add_pools, swap, meta_swap):
+    add_pools()
+    mirror.sync()
+    registry.remove_pool(meta_swap, {"from": alice})
+    registry.remove_pool(swap, {"from": alice})
+
+    assert mirror.sync() == {swap.address, meta_swap.address}
+    _assert_mirrored(mirror, registry, pools, coins)
+    assert mirror.get_n_coins(swap) == [0, 0]
+
+
+def test_sync_to_block(alice, mirror, registry, pools, coins, add_pools, meta_swap):
+    add_pools()
+    block = chain.height
+    registry.remove_pool(meta_swap, {"from": alice})
+
+    mirror.sync(block)
+    _assert_mirrored(mirror, registry, pools, coins, block_identifier=block)
+
+    mirror.sync()
+    _assert_mirrored(mirror, registry, pools, coins)
+
+
+def test_no_new_events(mirror, add_pools):
+    add_pools()
+    mirror.sync()
+    chain.mine()
+
+    assert mirror.sync() == set()
+    assert mirror.block_number == chain.height
+
+
+def test_save_and_load(tmp_path, registry, mirror, pools, coins, add_pools):
+    add_pools()
+    mirror.sync()
+    mirror.save(tmp_path.joinpath("mirror.json"))
+
+    loaded = RegistryMirror(registry)
+    assert loaded.load(tmp_path.joinpath("mirror.json"))
+    assert loaded.block_number == mirror.block_number
+    _assert_mirrored(loaded, registry, pools, coins)
+
+    assert not loaded.load(tmp_path.joinpath("missing.json"))
+
+
+def test_markets_read_per_pool(mirror, add_pools):
+    add_pools()
+    calls = []
+    read_market = mirror._read_market
+
+    def _read_market(coin_a, coin_b, block):
+        calls.append((coin_a, coin_b))
+        read_market(coin_a, coin_b, block)
+
+    mirror._read_market = _read_market
+    mirror.sync()
+
+    # only pairs of coins that share a pool are read, each of them once
+    expected = set()
+    for state in mirror.pools.values():
+        coins = sorted(i.lower() for i in state.get_market_coins())
+        expected.update(itertools.combinations(coins, 2))
+    assert sorted(calls) == sorted(expected)
@@ -0,0 +1,94 @@
+import pytest
+from brownie import Contract
+
+from scripts.router import STABLESWAP, RegistryQuoter, find_best_route, find_routes, load_hops
+
+pytestmark = pytest.mark.params(n_coins=4, n_metacoins=4)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, registry, swap, meta_swap, lp_token, meta_lp_token, n_coins, n_metacoins, is_v1):
+    registry.add_pool_without_underlying(
+        swap,
+        n_coins,
+        lp_token,
+        "0x00",
+        0,
+        0,
+        hasattr(swap, "initial_A"),
+        is_v1,
+        "",
+        {"from": alice},
+    )
+    registry.add_metapool(meta_swap, n_metacoins, meta_lp_token, 0, "", {"from": alice})
+
+
+@pytest.fixture(scope="module", autouse=True)
+def balances(alice, swap, meta_swap, lp_token, underlying_decimals, meta_decimals):
+    for pool, decimals in [(swap, underlying_decimals), (meta_swap, meta_decimals)]:
+        balances = [10 ** (i + 6) for i in decimals]
+        pool._set_balances(balances + [0] * (4 - len(balances)), {"from": alice})
+    lp_token._mint_for_testing(alice, 10**25, {"from": alice})
+
+
+@pytest.fixture(scope="module")
+def hops(registry):
+    return load_hops(registry)
+
+
+def _pool_quote(hop, amount):
+    # the mock pools do not use stableswap math, so quotes come from the pools
+    pool = Contract(hop.pool)
+    if hop.swap_type == STABLESWAP:
+        return pool.get_dy(hop.i, hop.j, amount)
+    return pool.get_dy_underlying(hop.i, hop.j, amount)
+
+
+def test_load_hops(registry, hops, swap, meta_swap, n_coins, n_metacoins):
+    pools = [swap, meta_swap]
+    for pool, n in [(swap, n_coins), (meta_swap, n_metacoins)]:
+        assert len([i for i in hops if i.pool == pool and i.swap_type == STABLESWAP]) == n * (n - 1)
+
+    for hop in hops:
+        assert hop.pool in pools
+        assert registry.get_coin_indices(hop.pool, hop.coin_in, hop.coin_out)[:2] == (hop.i, hop.j)
+
+
+@pytest.mark.itercoins("idx")
+def test_route_matches_swaps(alice, registry_swap, hops, meta_coins, underlying_coins, idx):
+    send = meta_coins[0]
+    recv = underlying_coins[idx]
+    if recv == "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE":
+        pytest.skip()
+    amount = 10 ** send.decimals()
+
+    route = find_best_route(hops, _pool_quote, send, recv, amount)
+    args = route.exchange_multiple_args()
+
+    assert registry_swap.get_exchange_multiple_amount(*args[:2], amount) == route.amount_out
+
+    send._mint_for_testing(alice, amount, {"from": alice})
+    send.approve(registry_swap, amount, {"from": alice})
+    balance = recv.balanceOf(alice)
+    registry_swap.exchange_multiple(args[0], args[1], amount, route.amount_out, {"from": alice})
+
+    assert recv.balanceOf(alice) == balance + route.amount_out
+
+
+def test_routes_are_sorted(hops, meta_coins, underlying_coins):
+    routes = find_routes(hops, _pool_quote, meta_coins[0], underlying_coins[1], 10**18, k=5)
+
+    assert len(routes) > 1
+    assert sorted(routes, key=lambda r: -r.amount_out) == routes
+
+
+def test_registry_quoter(registry, registry_swap, hops):
+    quote = RegistryQuoter(registry)
+    for hop in hops:
+        amount = 10 ** (
+            registry.get_decimals(hop.pool)[hop.i] if hop.swap_type == STABLESWAP else 18
+        )
+        expected = registry_swap.get_exchange_amounts(
+            hop.pool, hop.coin_in, hop.coin_out, [amount] + [0] * 99
+        )[0]
+        assert quote(hop, amount) == expected
@@ -0,0 +1,100 @@
+import brownie
+import pytest
+from brownie.test import given, strategy
+from hypothesis import Phase, settings
+
+from scripts import stableswap_math
+
+
+@given(
+    st_precision=strategy("uint[8]", min_value=6, max_value=18),
+    st_balance=strategy("uint[8]", min_value=10**20, max_value=10**26),
+    st_rates=strategy("uint[8]", min_value=10**18, max_value=10**19),
+    st_idx=strategy("uint[2]", max_value=7, unique=True),
+    st_dx=strategy("uint[]", min_value=10**15, max_value=10**25, min_length=1, max_length=100),
+    n_coins=strategy("uint", min_value=2, max_value=8),
+    amp=strategy("uint", min_value=1, max_value=5000),
+    fee=strategy("uint", max_value=10**8),
+)
+@settings(phases=[Phase.reuse, Phase.generate])
+def test_get_dy(calculator, st_precision, st_balance, st_rates, st_idx, st_dx, n_coins, amp, fee):
+    i, j = [k % n_coins for k in st_idx]
+    if i == j:
+        j = (i + 1) % n_coins
+    zeros = [0] * (8 - n_coins)
+    precision = [10 ** (18 - k) for k in st_precision[:n_coins]] + zeros
+    balances = [st_balance[k] // precision[k] for k in range(n_coins)] + zeros
+    rates = st_rates[:n_coins] + zeros
+    dx = [k // precision[i] + 1 for k in sorted(st_dx)]
+    dx += [0] * (100 - len(dx))
+
+    args = (n_coins, balances, amp, fee, rates, precision, i, j, dx)
+    assert calculator.get_dy(*args) == stableswap_math.get_dy(*args)
+
+
+@given(
+    st_precision=strategy("uint[8]", min_value=6, max_value=18),
+    st_balance=strategy("uint[8]", min_value=10**20, max_value=10**26),
+    st_rates=strategy("uint[8]", min_value=10**18, max_value=10**19),
+    st_idx=strategy("uint[2]", max_value=7, unique=True),
+    dy=strategy("uint", min_value=10**15, max_value=10**19),
+    n_coins=strategy("uint", min_value=2, max_value=8),
+    amp=strategy("uint", min_value=1, max_value=5000),
+    fee=strategy("uint", max_value=10**8),
+)
+@settings(phases=[Phase.reuse, Phase.generate])
+def test_get_dx(calculator, st_precision, st_balance, st_rates, st_idx, dy, n_coins, amp, fee):
+    i, j = [k % n_coins for k in st_idx]
+    if i == j:
+        j = (i + 1) % n_coins
+    zeros = [0] * (8 - n_coins)
+    precision = [10 ** (18 - k) for k in st_precision[:n_coins]] + zeros
+    balances = [st_balance[k] // precision[k] for k in range(n_coins)] + zeros
+    rates = st_rates[:n_coins] + zeros
+    dy = dy // precision[j] + 1
+
+    args = (n_coins, balances, amp, fee, rates, precision, i, j, dy)
+    assert calculator.get_dx(*args) == stableswap_math.get_dx(*args)
+
+
+def test_dx_stops_at_zero(calculator):
+    args = (2, [10**24, 10**12] + [0] * 6, 200, 4000000, [10**18] * 2 + [0] * 6)
+    precision = [1, 10**12] + [0] * 6
+    dx = [10**18, 2 * 10**18, 0, 10**18] + [0] * 96
+
+    expected = calculator.get_dy(*args, precision, 0, 1, dx)
+    assert stableswap_math.get_dy(*args, precision, 0, 1, dx) == expected
+    assert expected[2:4] == [0, 10**18]
+
+
+@pytest.mark.parametrize("idx", [(0, 0), (0, 2), (2, 0)])
+def test_invalid_index(calculator, idx):
+    args = (
+        2,
+        [10**24, 10**24] + [0] * 6,
+        200,
+        4000000,
+        [10**18] * 2 + [0] * 6,
+        [1, 1] + [0] * 6,
+    )
+
+    with brownie.reverts():
+        calculator.get_dy(*args, *idx, [10**18] + [0] * 99)
+    with pytest.raises(ValueError):
+        stableswap_math.get_dy(*args, *idx, [10**18] + [0] * 99)
+
+
+def test_insufficient_balance(calculator):
+    args = (
+        2,
+        [10**20, 10**20] + [0] * 6,
+        200,
+        4000000,
+        [10**18] * 2 + [0] * 6,
+        [1, 1] + [0] * 6,
+    )
+
+    with brownie.reverts():
+        calculator.get_dx(*args, 0, 1, 10**21)
+    with pytest.raises(ValueError):
+        stableswap_math.get_dx(*args, 0, 1, 10**21)
@@ -0,0 +1,60 @@
+import random
+
+# ladders of trade sizes for bulk quotes, in 1e18 units
+LADDERS = {
+    "linear": [10**20 * (k + 1) for k in range(100)],
+    "geometric": [int(10**18 * 1.15**k) for k in range(100)],
+    "log": [int(10 ** (18 + k * 6 / 99)) for k in range(100)],
+}
+# 3 coin pool with 4M in balances, arguments for `get_dy` excluding indices and amounts
+CALC_POOL = (
+    3,
+    [10**24, 2 * 10**24, 10**24] + [0] * 5,
+    200,
+    4000000,
+    [10**18] * 3 + [0] * 5,
+    [1, 1, 1] + [0] * 5,
+)
+
+
+def synthetic_pooldata(n_pools: int) -> dict:
+    # one base pool for every nine metapools
+    pool_data = {}
+    for idx in range(n_pools):
+        coins = [
+            {"name": f"TST{idx}", "decimals": 18, "underlying_address": f"0x{idx + 2**32:040x}"},
+            {"name": f"TST{idx + 1}", "decimals": 6, "underlying_address": f"0x{idx + 2**33:040x}"},
+        ]
+        data = {
+            "swap_address": f"0x{idx + 1:040x}",
+            "lp_token_address": f"0x{idx + 2**31:040x}",
+            "lp_contract": "CurveTokenV3",
+            "coins": coins,
+        }
+        if idx % 10:
+            base_idx = idx - idx % 10
+            data["base_pool"] = f"pool{base_idx}"
+            coins[1] = {
+                "name": f"LP{base_idx}",
+                "decimals": 18,
+                "base_pool_token": True,
+                "underlying_address": f"0x{base_idx + 2**31:040x}",
+            }
+        pool_data[f"pool{idx}"] = data
+    return pool_data
+
+
+def synthetic_pools(n_pools: int, seed: int = 0) -> list:
+    # arguments for `stableswap_math.get_dy`, excluding the coin indices and amounts
+    rng = random.Random(seed)
+    pools = []
+    for _ in range(n_pools):
+        n_coins = rng.randint(2, 8)
+        zeros = [0] * (8 - n_coins)
+        precisions = [10 ** (18 - rng.choice([6, 8, 18])) for _ in range(n_coins)] + zeros
+        balances = [rng.randint(10**22, 10**27) // precisions[k] for k in range(n_coins)]
+        rates = [rng.randint(10**18, 2 * 10**18) for _ in range(n_coins)] + zeros
+        amp = rng.choice([10, 100, 200, 2000, 5000])
+        fee = rng.randint(0, 10**8)
+        pools.append((n_coins, balances + zeros, amp, fee, rates, precisions))
+    return pools
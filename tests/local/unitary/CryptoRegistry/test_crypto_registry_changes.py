@@ -0,0 +1,92 @@
+import brownie
+import pytest
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+POOL_ADDED = 1
+POOL_REMOVED = 2
+GAUGES = 3
+
+pytestmark = pytest.mark.params(n_coins=4, is_v1=False)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, crypto_registry, swap, lp_token, n_coins):
+    crypto_registry.add_pool(
+        swap, lp_token, ZERO_ADDRESS, ZERO_ADDRESS, n_coins, "", {"from": alice}
+    )
+
+
+def _set_gauges(alice, crypto_registry, swap, liquidity_gauge, count):
+    # `count` gauge changes, in batches of 10
+    for i in range(0, count, 10):
+        n_pools = min(count - i, 10)
+        crypto_registry.batch_set_liquidity_gauges(
+            [swap] * n_pools + [ZERO_ADDRESS] * (10 - n_pools),
+            [liquidity_gauge] * n_pools + [ZERO_ADDRESS] * (10 - n_pools),
+            {"from": alice},
+        )
+
+
+def test_pool_added(crypto_registry, swap):
+    assert crypto_registry.change_count() == 1
+    assert crypto_registry.get_changes_since(0) == [(1, swap, POOL_ADDED)]
+
+
+def test_changes(alice, crypto_registry, swap, liquidity_gauge):
+    gauges = [liquidity_gauge] + [ZERO_ADDRESS] * 9
+    crypto_registry.set_liquidity_gauges(swap, gauges, {"from": alice})
+    crypto_registry.batch_set_liquidity_gauges([swap] + [ZERO_ADDRESS] * 9, gauges, {"from": alice})
+    crypto_registry.remove_pool(swap, {"from": alice})
+
+    assert crypto_registry.change_count() == 4
+    assert crypto_registry.get_changes_since(1) == [
+        (2, swap, GAUGES),
+        (3, swap, GAUGES),
+        (4, swap, POOL_REMOVED),
+    ]
+    assert crypto_registry.get_changes_since(3) == [(4, swap, POOL_REMOVED)]
+
+
+def test_readded(alice, crypto_registry, swap, lp_token, n_coins):
+    crypto_registry.remove_pool(swap, {"from": alice})
+    crypto_registry.add_pool(
+        swap, lp_token, ZERO_ADDRESS, ZERO_ADDRESS, n_coins, "", {"from": alice}
+    )
+
+    assert crypto_registry.get_changes_since(1) == [(2, swap, POOL_REMOVED), (3, swap, POOL_ADDED)]
+
+
+def test_up_to_date(crypto_registry):
+    assert crypto_registry.get_changes_since(1) == []
+    assert crypto_registry.get_changes_since(2**256 - 1) == []
+
+
+@pytest.mark.once
+def test_paged(alice, crypto_registry, swap, liquidity_gauge):
+    _set_gauges(alice, crypto_registry, swap, liquidity_gauge, 130)
+
+    changes = crypto_registry.get_changes_since(0)
+    assert len(changes) == 100
+    assert [i[0] for i in changes] == list(range(1, 101))
+
+    changes = crypto_registry.get_changes_since(changes[-1][0])
+    assert [i[0] for i in changes] == list(range(101, 132))
+    assert changes[-1] == (131, swap, GAUGES)
+
+
+@pytest.mark.once
+def test_overwritten(alice, crypto_registry, swap, liquidity_gauge):
+    _set_gauges(alice, crypto_registry, swap, liquidity_gauge, 1029)
+    crypto_registry.remove_pool(swap, {"from": alice})
+    assert crypto_registry.change_count() == 1031
+
+    # entries 1024 and up have wrapped around to the start of the buffer
+    changes = crypto_registry.get_changes_since(1020)
+    assert [i[0] for i in changes] == list(range(1021, 1032))
+    assert changes[-1] == (1031, swap, POOL_REMOVED)
+    assert changes[-2] == (1030, swap, GAUGES)
+
+    assert crypto_registry.get_changes_since(7)[0][0] == 8
+    with brownie.reverts():
+        crypto_registry.get_changes_since(6)
@@ -0,0 +1,83 @@
+import pytest
+
+from scripts.utils import pack_values
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+pytestmark = pytest.mark.params(is_v1=False)
+
+
+def test_pool_registered(
+    alice, crypto_registry, swap, lp_token, underlying_coins, underlying_decimals, n_coins
+):
+    tx = crypto_registry.add_pool(
+        swap, lp_token, ZERO_ADDRESS, ZERO_ADDRESS, n_coins, "Crypto Swap", {"from": alice}
+    )
+    event = tx.events["PoolRegistered"]
+
+    coins = underlying_coins + [ZERO_ADDRESS] * (8 - n_coins)
+    assert event["pool"] == swap
+    assert event["lp_token"] == lp_token
+    assert event["base_pool"] == ZERO_ADDRESS
+    assert event["zap"] == ZERO_ADDRESS
+    assert event["coins"] == coins
+    assert event["underlying_coins"] == coins
+    assert event["decimals"] == pack_values(underlying_decimals)
+    assert event["underlying_decimals"] == event["decimals"]
+    assert event["flags"] == n_coins
+    assert event["name"] == "Crypto Swap"
+
+    assert "LiquidityGaugesUpdated" not in tx.events
+
+
+@pytest.mark.once
+def test_pool_registered_gauge(
+    alice, bob, crypto_registry, swap, lp_token, liquidity_gauge, n_coins
+):
+    tx = crypto_registry.add_pool(
+        swap, lp_token, liquidity_gauge, bob, n_coins, "", ZERO_ADDRESS, True, {"from": alice}
+    )
+    event = tx.events["PoolRegistered"]
+    assert event["zap"] == bob
+    assert event["flags"] == n_coins + 256
+
+    event = tx.events["LiquidityGaugesUpdated"]
+    assert event["pool"] == swap
+    assert event["gauges"] == [liquidity_gauge] + [ZERO_ADDRESS] * 9
+
+
+@pytest.mark.once
+def test_set_liquidity_gauges(alice, crypto_registry, swap, lp_token, liquidity_gauge, n_coins):
+    crypto_registry.add_pool(
+        swap, lp_token, ZERO_ADDRESS, ZERO_ADDRESS, n_coins, "", {"from": alice}
+    )
+
+    gauges = [liquidity_gauge] * 2 + [ZERO_ADDRESS] * 8
+    tx = crypto_registry.set_liquidity_gauges(swap, gauges, {"from": alice})
+    assert tx.events["LiquidityGaugesUpdated"] == {"pool": swap, "gauges": gauges}
+
+    tx = crypto_registry.set_liquidity_gauges(swap, [ZERO_ADDRESS] * 10, {"from": alice})
+    assert tx.events["LiquidityGaugesUpdated"] == {"pool": swap, "gauges": [ZERO_ADDRESS] * 10}
+
+
+@pytest.mark.once
+def test_batch_set_liquidity_gauges(
+    alice, crypto_registry, PoolMockV2, ERC20, LiquidityGaugeMock, underlying_coins
+):
+    pools = []
+    gauges = []
+    for i in range(2):
+        coins = underlying_coins[i : i + 2] + [ZERO_ADDRESS] * 2
+        swap = PoolMockV2.deploy(2, coins, [ZERO_ADDRESS] * 4, 70, 0, {"from": alice})
+        token = ERC20.deploy("", "", 18, {"from": alice})
+        crypto_registry.add_pool(swap, token, ZERO_ADDRESS, ZERO_ADDRESS, 2, "", {"from": alice})
+        pools.append(swap)
+        gauges.append(LiquidityGaugeMock.deploy(token, {"from": alice}))
+
+    tx = crypto_registry.batch_set_liquidity_gauges(
+        pools + [ZERO_ADDRESS] * 8, gauges + [ZERO_ADDRESS] * 8, {"from": alice}
+    )
+    events = tx.events["LiquidityGaugesUpdated"]
+    assert len(events) == 2
+    for event, pool, gauge in zip(events, pools, gauges):
+        assert event == {"pool": pool, "gauges": [gauge] + [ZERO_ADDRESS] * 9}
@@ -0,0 +1,82 @@
+import pytest
+from brownie import ZERO_ADDRESS
+
+from scripts.registry_pages import get_all_coins, get_all_pools
+
+pytestmark = pytest.mark.params(n_coins=4, is_v1=False)
+
+N_POOLS = 6
+
+
+@pytest.fixture(scope="module", autouse=True)
+def swaps(ERC20, PoolMockV2, crypto_registry, underlying_coins, alice):
+    swaps = []
+    for i in range(N_POOLS):
+        coins = [underlying_coins[i % 4], underlying_coins[(i + 1) % 4]]
+        swap = PoolMockV2.deploy(
+            2, coins + [ZERO_ADDRESS] * 2, [ZERO_ADDRESS] * 4, 70, 0, {"from": alice}
+        )
+        token = ERC20.deploy("", "", 18, {"from": alice})
+        crypto_registry.add_pool(
+            swap, token, ZERO_ADDRESS, ZERO_ADDRESS, 2, f"Pool {i}", {"from": alice}
+        )
+        swaps.append(swap)
+    yield swaps
+
+
+@pytest.mark.parametrize("limit", [1, 4, N_POOLS, 1000])
+def test_get_pools(crypto_registry, limit):
+    pools = []
+    for offset in range(0, N_POOLS + 1, limit):
+        page = crypto_registry.get_pools(offset, limit)
+        assert len(page) == min(limit, N_POOLS - offset)
+        pools += page
+
+    assert pools == [crypto_registry.pool_list(i) for i in range(N_POOLS)]
+
+
+@pytest.mark.parametrize("limit", [1, 3, 1000])
+def test_get_coins_page(crypto_registry, limit):
+    coin_count = crypto_registry.coin_count()
+    coins = []
+    for offset in range(0, coin_count + 1, limit):
+        page = crypto_registry.get_coins_page(offset, limit)
+        assert len(page) == min(limit, coin_count - offset)
+        coins += page
+
+    assert coins == [crypto_registry.get_coin(i) for i in range(coin_count)]
+
+
+def test_limit(crypto_registry):
+    coin_count = crypto_registry.coin_count()
+    assert len(crypto_registry.get_pools(0, 2**256 - 1)) == N_POOLS
+    assert len(crypto_registry.get_coins_page(0, 2**256 - 1)) == coin_count
+    assert crypto_registry.get_pools(0, 0) == []
+    assert crypto_registry.get_coins_page(0, 0) == []
+
+
+def test_past_the_end(crypto_registry):
+    coin_count = crypto_registry.coin_count()
+    assert crypto_registry.get_pools(N_POOLS - 1, 4) == [crypto_registry.pool_list(N_POOLS - 1)]
+    assert crypto_registry.get_pools(N_POOLS, 1) == []
+    assert crypto_registry.get_pools(2**256 - 1, 1) == []
+    assert crypto_registry.get_coins_page(coin_count, 1) == []
+    assert crypto_registry.get_coins_page(2**256 - 1, 1) == []
+
+
+def test_removed_pool(alice, crypto_registry, swaps):
+    crypto_registry.remove_pool(swaps[0], {"from": alice})
+
+    assert crypto_registry.get_pools(0, 1000) == [
+        crypto_registry.pool_list(i) for i in range(N_POOLS - 1)
+    ]
+    assert swaps[0] not in crypto_registry.get_pools(0, 1000)
+
+
+@pytest.mark.parametrize("page_size", [1, 4, 1000])
+def test_get_all(crypto_registry, page_size):
+    pools = get_all_pools(crypto_registry, page_size=page_size)
+    assert pools == [crypto_registry.pool_list(i) for i in range(N_POOLS)]
+
+    coins = get_all_coins(crypto_registry, page_size=page_size)
+    assert coins == [crypto_registry.get_coin(i) for i in range(crypto_registry.coin_count())]
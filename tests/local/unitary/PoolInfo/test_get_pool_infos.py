@@ -0,0 +1,58 @@
+import pytest
+from brownie import ZERO_ADDRESS
+
+pytestmark = pytest.mark.params(n_coins=4)
+
+N_POOLS = 6
+
+
+@pytest.fixture(scope="module")
+def swaps(PoolMockV2, underlying_coins, alice):
+    swaps = []
+    for i in range(N_POOLS):
+        swap = PoolMockV2.deploy(
+            2, underlying_coins[:2] + [ZERO_ADDRESS] * 2, [ZERO_ADDRESS] * 4, 70, 0, {"from": alice}
+        )
+        swap._set_balances([10**18 * (i + 1), 10**8 * (i + 1), 0, 0], {"from": alice})
+        swaps.append(swap)
+    yield swaps
+
+
+@pytest.fixture(scope="module", autouse=True)
+def registry(ERC20, Registry, provider, gauge_controller, alice, swaps):
+    registry = Registry.deploy(provider, gauge_controller, {"from": alice})
+    provider.set_address(0, registry, {"from": alice})
+    for i, swap in enumerate(swaps):
+        token = ERC20.deploy("", "", 18, {"from": alice})
+        registry.add_pool_without_underlying(
+            swap, 2, token, "0x00", 0, 0, True, False, f"Pool {i}", {"from": alice}
+        )
+
+    yield registry
+
+
+def test_get_pool_infos(registry_pool_info, swaps):
+    expected = [registry_pool_info.get_pool_info(i) for i in swaps[::-1]]
+    assert registry_pool_info.get_pool_infos(swaps[::-1]) == expected
+
+
+def test_get_pool_infos_empty(registry_pool_info):
+    assert registry_pool_info.get_pool_infos([]) == []
+
+
+@pytest.mark.parametrize("limit", [1, 4, N_POOLS, 50])
+def test_get_all_pool_infos(registry, registry_pool_info, limit):
+    pool_infos = []
+    for offset in range(0, N_POOLS + 1, limit):
+        page = registry_pool_info.get_all_pool_infos(offset, limit)
+        assert len(page) == min(limit, N_POOLS - offset)
+        pool_infos += page
+
+    pools = [registry.pool_list(i) for i in range(N_POOLS)]
+    assert pool_infos == [registry_pool_info.get_pool_info(i) for i in pools]
+
+
+def test_get_all_pool_infos_limit(registry_pool_info):
+    assert len(registry_pool_info.get_all_pool_infos(0, 2**256 - 1)) == N_POOLS
+    assert registry_pool_info.get_all_pool_infos(0, 0) == []
+    assert registry_pool_info.get_all_pool_infos(N_POOLS, 1) == []
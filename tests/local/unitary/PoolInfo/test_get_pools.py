@@ -0,0 +1,78 @@
+import pytest
+from brownie import ZERO_ADDRESS
+
+from scripts.registry_pages import get_all_coins, get_all_pools
+
+pytestmark = pytest.mark.params(n_coins=4)
+
+N_POOLS = 6
+
+
+@pytest.fixture(scope="module")
+def swaps(PoolMockV2, underlying_coins, alice):
+    swaps = []
+    for i in range(N_POOLS):
+        coins = [underlying_coins[i % 4], underlying_coins[(i + 1) % 4]]
+        swap = PoolMockV2.deploy(
+            2, coins + [ZERO_ADDRESS] * 2, [ZERO_ADDRESS] * 4, 70, 0, {"from": alice}
+        )
+        swaps.append(swap)
+    yield swaps
+
+
+@pytest.fixture(scope="module", autouse=True)
+def registry(ERC20, Registry, provider, gauge_controller, alice, swaps):
+    registry = Registry.deploy(provider, gauge_controller, {"from": alice})
+    provider.set_address(0, registry, {"from": alice})
+    for i, swap in enumerate(swaps):
+        token = ERC20.deploy("", "", 18, {"from": alice})
+        registry.add_pool_without_underlying(
+            swap, 2, token, "0x00", 0, 0, True, False, f"Pool {i}", {"from": alice}
+        )
+
+    yield registry
+
+
+@pytest.mark.parametrize("limit", [1, 4, N_POOLS, 1000])
+def test_get_pools(registry, registry_pool_info, limit):
+    pools = []
+    for offset in range(0, N_POOLS + 1, limit):
+        page = registry_pool_info.get_pools(offset, limit)
+        assert len(page) == min(limit, N_POOLS - offset)
+        pools += page
+
+    assert pools == [registry.pool_list(i) for i in range(N_POOLS)]
+
+
+@pytest.mark.parametrize("limit", [1, 3, 1000])
+def test_get_coins_page(registry, registry_pool_info, limit):
+    coin_count = registry.coin_count()
+    coins = []
+    for offset in range(0, coin_count + 1, limit):
+        coins += registry_pool_info.get_coins_page(offset, limit)
+
+    assert coins == [registry.get_coin(i) for i in range(coin_count)]
+
+
+def test_limit(registry, registry_pool_info):
+    assert len(registry_pool_info.get_pools(0, 2**256 - 1)) == N_POOLS
+    assert registry_pool_info.get_pools(0, 0) == []
+    assert registry_pool_info.get_pools(N_POOLS, 1) == []
+    assert registry_pool_info.get_coins_page(registry.coin_count(), 1) == []
+
+
+@pytest.mark.parametrize("page_size", [1, 4, 1000])
+def test_get_all(registry, registry_pool_info, page_size):
+    pools = get_all_pools(registry, registry_pool_info, page_size=page_size)
+    assert pools == [registry.pool_list(i) for i in range(N_POOLS)]
+
+    coins = get_all_coins(registry, registry_pool_info, page_size=page_size)
+    assert coins == [registry.get_coin(i) for i in range(registry.coin_count())]
+
+
+def test_get_all_at_block(alice, chain, registry, registry_pool_info, swaps):
+    block = chain.height
+    registry.remove_pool(swaps[0], {"from": alice})
+
+    assert len(get_all_pools(registry, registry_pool_info, block, page_size=4)) == N_POOLS
+    assert len(get_all_pools(registry, registry_pool_info, page_size=4)) == N_POOLS - 1
@@ -0,0 +1,81 @@
+import pytest
+from brownie import ZERO_ADDRESS
+
+from scripts.router import fetch_hops, load_hops
+
+pytestmark = pytest.mark.params(n_coins=4)
+
+N_POOLS = 3
+
+
+@pytest.fixture(scope="module", autouse=True)
+def registry(ERC20, PoolMockV2, Registry, provider, gauge_controller, alice, underlying_coins):
+    registry = Registry.deploy(provider, gauge_controller, {"from": alice})
+    provider.set_address(0, registry, {"from": alice})
+    # several pools for one market, and pools with a mix of shared coins
+    coin_sets = [underlying_coins[:2]] * N_POOLS + [underlying_coins[1:], underlying_coins[2:]]
+    for coins in coin_sets:
+        swap = PoolMockV2.deploy(
+            len(coins),
+            coins + [ZERO_ADDRESS] * (4 - len(coins)),
+            [ZERO_ADDRESS] * 4,
+            70,
+            0,
+            {"from": alice},
+        )
+        token = ERC20.deploy("", "", 18, {"from": alice})
+        registry.add_pool_without_underlying(
+            swap, len(coins), token, "0x00", 0, 0, True, False, "", {"from": alice}
+        )
+
+    yield registry
+
+
+def _edges(registry, registry_pool_info, cursor):
+    edges = []
+    while cursor[0] < registry.coin_count():
+        page, cursor = registry_pool_info.get_swap_edges(cursor)
+        edges += page
+    return edges
+
+
+def test_get_swap_edges(registry, registry_pool_info):
+    edges, cursor = registry_pool_info.get_swap_edges([0, 0, 0])
+
+    assert cursor == [registry.coin_count(), 0, 0]
+    # each market is returned once, with one edge for each pool
+    assert len(edges) == N_POOLS + 3 + 1
+    for coin, complement, pool, i, j, is_underlying in edges:
+        assert int(coin, 16) < int(complement, 16)
+        assert registry.get_coin_indices(pool, coin, complement) == (i, j, is_underlying)
+
+
+def test_resume_from_cursor(registry, registry_pool_info, underlying_coins):
+    edges = _edges(registry, registry_pool_info, [0, 0, 0])
+
+    coin = registry.get_coin(0)
+    assert _edges(registry, registry_pool_info, [1, 0, 0]) == [i for i in edges if i[0] != coin]
+
+    # resume part way through the market with several pools
+    coin, complement = sorted(underlying_coins[:2], key=lambda i: int(i.address, 16))
+    coin_idx = next(i for i in range(registry.coin_count()) if registry.get_coin(i) == coin)
+    swap_idx = next(
+        i
+        for i in range(registry.get_coin_swap_count(coin))
+        if registry.get_coin_swap_complement(coin, i) == complement
+    )
+    start = next(k for k, i in enumerate(edges) if i[:2] == (coin, complement))
+
+    resumed = _edges(registry, registry_pool_info, [coin_idx, swap_idx, 1])
+    assert resumed == edges[start + 1 :]
+
+
+def test_fetch_hops(registry, registry_pool_info):
+    assert sorted(fetch_hops(registry, registry_pool_info)) == sorted(load_hops(registry))
+
+
+def test_empty_registry(Registry, alice, provider, gauge_controller, registry_pool_info):
+    registry = Registry.deploy(provider, gauge_controller, {"from": alice})
+    provider.set_address(0, registry, {"from": alice})
+
+    assert registry_pool_info.get_swap_edges([0, 0, 0]) == ([], [0, 0, 0])
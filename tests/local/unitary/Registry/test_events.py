@@ -0,0 +1,110 @@
+import pytest
+
+from scripts.utils import pack_values
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def _assert_registered(event, registry, pool):
+    assert event["pool"] == pool
+    assert event["lp_token"] == registry.get_lp_token(pool)
+    assert event["coins"] == registry.get_coins(pool)
+    assert event["underlying_coins"] == registry.get_underlying_coins(pool)
+    assert event["decimals"] == pack_values(registry.get_decimals(pool))
+    assert event["underlying_decimals"] == pack_values(registry.get_underlying_decimals(pool))
+    assert event["name"] == registry.get_pool_name(pool)
+
+    n_coins = registry.get_n_coins(pool)
+    assert event["flags"] % 2**16 == n_coins[0] + n_coins[1] * 256
+
+
+def test_pool_registered(alice, registry, swap, lp_token, n_coins, is_v1, underlying_decimals):
+    tx = registry.add_pool_without_underlying(
+        swap,
+        n_coins,
+        lp_token,
+        "0x00",
+        pack_values(underlying_decimals),
+        0,
+        True,
+        is_v1,
+        "Base Swap",
+        {"from": alice},
+    )
+    event = tx.events["PoolRegistered"]
+
+    _assert_registered(event, registry, swap)
+    assert event["base_pool"] == ZERO_ADDRESS
+    assert event["flags"] // 2**16 == 1 + 2 * is_v1
+
+
+def test_pool_registered_lending(
+    alice,
+    registry,
+    lending_swap,
+    lp_token,
+    n_coins,
+    is_v1,
+    rate_method_id,
+    underlying_coins,
+    wrapped_coins,
+):
+    tx = registry.add_pool(
+        lending_swap, n_coins, lp_token, rate_method_id, 0, 0, False, is_v1, "", {"from": alice}
+    )
+    event = tx.events["PoolRegistered"]
+
+    _assert_registered(event, registry, lending_swap)
+    rate_info = bytes(event["rate_info"])
+    assert rate_info[-4:] == bytes.fromhex(rate_method_id[2:])
+    # the first byte flags which coins are wrapped
+    wrapped = [i != x for i, x in zip(underlying_coins[:n_coins], wrapped_coins)]
+    assert rate_info[0] == sum(2**i for i, x in enumerate(wrapped) if x)
+
+
+@pytest.mark.params(n_metacoins=2)
+def test_pool_registered_meta(
+    alice, registry, swap, meta_swap, lp_token, meta_lp_token, n_coins, n_metacoins, is_v1
+):
+    registry.add_pool_without_underlying(
+        swap, n_coins, lp_token, "0x00", 0, 0, True, is_v1, "", {"from": alice}
+    )
+    tx = registry.add_metapool(meta_swap, n_metacoins, meta_lp_token, 0, "Meta", {"from": alice})
+    event = tx.events["PoolRegistered"]
+
+    _assert_registered(event, registry, meta_swap)
+    assert event["base_pool"] == swap
+
+
+@pytest.mark.once
+def test_update_events(alice, registry, swap, lp_token, liquidity_gauge, underlying_coins):
+    registry.add_pool_without_underlying(
+        swap, 2, lp_token, "0x00", 0, 0, True, False, "", {"from": alice}
+    )
+
+    gauges = [liquidity_gauge] + [ZERO_ADDRESS] * 9
+    tx = registry.set_liquidity_gauges(swap, gauges, {"from": alice})
+    assert tx.events["LiquidityGaugesUpdated"].values() == [swap, gauges]
+
+    tx = registry.set_pool_asset_type(swap, 3, {"from": alice})
+    assert tx.events["PoolAssetTypeUpdated"].values() == [swap, 3]
+
+    tx = registry.batch_set_pool_asset_type(
+        [swap] + [ZERO_ADDRESS] * 31, [2] + [0] * 31, {"from": alice}
+    )
+    assert tx.events["PoolAssetTypeUpdated"].values() == [swap, 2]
+
+    tx = registry.set_pool_gas_estimates(
+        [swap] + [ZERO_ADDRESS] * 4, [[100, 200]] + [[0, 0]] * 4, {"from": alice}
+    )
+    assert tx.events["PoolGasEstimatesUpdated"].values() == [swap, [100, 200]]
+
+    coins = underlying_coins[:2] + [ZERO_ADDRESS] * 8
+    tx = registry.set_coin_gas_estimates(coins, [7, 8] + [0] * 8, {"from": alice})
+    assert [i.values() for i in tx.events["CoinGasEstimateUpdated"]] == [
+        [underlying_coins[0], 7],
+        [underlying_coins[1], 8],
+    ]
+
+    tx = registry.set_gas_estimate_contract(swap, alice, {"from": alice})
+    assert tx.events["GasEstimateContractUpdated"].values() == [swap, alice]
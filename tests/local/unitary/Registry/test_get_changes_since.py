@@ -0,0 +1,65 @@
+import brownie
+import pytest
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+POOL_ADDED = 1
+POOL_REMOVED = 2
+GAUGES = 3
+ASSET_TYPE = 4
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(alice, registry, swap, lp_token, n_coins, is_v1):
+    registry.add_pool_without_underlying(
+        swap, n_coins, lp_token, "0x00", 0, 0, True, is_v1, "", {"from": alice}
+    )
+
+
+def test_pool_added(registry, swap):
+    assert registry.change_count() == 1
+    assert registry.get_changes_since(0) == [(1, swap, POOL_ADDED)]
+
+
+def test_changes(alice, registry, swap, liquidity_gauge):
+    registry.set_pool_asset_type(swap, 2, {"from": alice})
+    registry.set_liquidity_gauges(swap, [liquidity_gauge] + [ZERO_ADDRESS] * 9, {"from": alice})
+    registry.remove_pool(swap, {"from": alice})
+
+    assert registry.change_count() == 4
+    assert registry.get_changes_since(1) == [
+        (2, swap, ASSET_TYPE),
+        (3, swap, GAUGES),
+        (4, swap, POOL_REMOVED),
+    ]
+    assert registry.get_changes_since(3) == [(4, swap, POOL_REMOVED)]
+
+
+def test_up_to_date(registry):
+    assert registry.get_changes_since(1) == []
+    assert registry.get_changes_since(2**256 - 1) == []
+
+
+@pytest.mark.once
+def test_paged(alice, registry, swap):
+    for i in range(4):
+        registry.batch_set_pool_asset_type([swap] * 32, list(range(32)), {"from": alice})
+
+    changes = registry.get_changes_since(0)
+    assert len(changes) == 100
+    assert [i[0] for i in changes] == list(range(1, 101))
+
+    changes = registry.get_changes_since(changes[-1][0])
+    assert [i[0] for i in changes] == list(range(101, 130))
+    assert changes[-1] == (129, swap, ASSET_TYPE)
+
+
+@pytest.mark.once
+def test_overwritten(alice, registry, swap):
+    for i in range(32):
+        registry.batch_set_pool_asset_type([swap] * 32, list(range(32)), {"from": alice})
+    assert registry.change_count() == 1025
+
+    assert registry.get_changes_since(1)[0][0] == 2
+    with brownie.reverts():
+        registry.get_changes_since(0)
@@ -32,7 +32,7 @@ def test_set_pool_asset_type(registry, alice, swap):
 
 @pytest.mark.once
 def test_get_pool_asset_type_reverts_on_fail(registry, bob):
-    with brownie.reverts("dev: admin-only function"):
+    with brownie.reverts(dev_revert_msg="dev: admin-only function"):
         registry.set_pool_asset_type(ZERO_ADDRESS, 42, {"from": bob})
 
 
@@ -53,3 +53,22 @@ def test_asset_type_removed_after_pool_removal(registry, swap, alice):
     registry.remove_pool(swap, {"from": alice})
 
     assert registry.get_pool_asset_type(swap) == 0
+
+
+@pytest.mark.once
+def test_asset_type_does_not_change_pool_data(registry, alice, swap):
+    n_coins_before = registry.get_n_coins(swap)
+    params_before = registry.get_parameters(swap)
+
+    registry.set_pool_asset_type(swap, 2**168 - 1, {"from": alice})
+
+    assert registry.get_pool_asset_type(swap) == 2**168 - 1
+    assert registry.get_n_coins(swap) == n_coins_before
+    assert registry.get_parameters(swap) == params_before
+    assert registry.pool_list(registry.pool_count() - 1) == swap
+
+
+@pytest.mark.once
+def test_asset_type_overflow(registry, alice, swap):
+    with brownie.reverts(dev_revert_msg="dev: asset type overflow"):
+        registry.set_pool_asset_type(swap, 2**168, {"from": alice})
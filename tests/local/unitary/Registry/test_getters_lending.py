@@ -121,6 +121,52 @@ def test_get_rates(registry, registry_pool_info, lending_swap, wrapped_coins):
     assert registry_pool_info.get_pool_info(lending_swap)["rates"] == rates
 
 
+def test_get_rates_without_underlying(
+    ERC20, PoolMockV2, alice, registry, wrapped_coins, underlying_coins, rate_method_id, n_coins
+):
+    # only odd positions hold a wrapped coin and use rates
+    use_rates = [
+        i % 2 == 1 and hasattr(c, "_set_exchange_rate") for i, c in enumerate(wrapped_coins)
+    ]
+    coins = [w if r else u for w, u, r in zip(wrapped_coins, underlying_coins, use_rates)]
+    swap = PoolMockV2.deploy(
+        n_coins,
+        coins + [ZERO_ADDRESS] * (4 - n_coins),
+        [ZERO_ADDRESS] * 4,
+        70,
+        4000000,
+        {"from": alice},
+    )
+    lp_token = ERC20.deploy("Mixed Token", "MIX", 18, {"from": alice})
+    registry.add_pool_without_underlying(
+        swap,
+        n_coins,
+        lp_token,
+        rate_method_id,
+        pack_values([18] * n_coins),
+        pack_values(use_rates),
+        False,
+        False,
+        "Mixed Swap",
+        {"from": alice},
+    )
+
+    rates = []
+    for i, (coin, is_wrapped) in enumerate(zip(coins, use_rates), start=1):
+        if is_wrapped:
+            rates.append(int(10**18 * ((100 + i) / 100)))
+            coin._set_exchange_rate(rates[-1])
+        else:
+            rates.append(10**18)
+    rates += [0] * (8 - len(rates))
+
+    assert registry.get_rates(swap) == rates
+
+    balances = [1234, 2345, 3456, 4567][:n_coins]
+    swap._set_balances(balances + [0] * (4 - n_coins))
+    assert registry.get_underlying_balances(swap) == balances + [0] * (8 - n_coins)
+
+
 def test_get_balances(registry, registry_pool_info, lending_swap, n_coins):
     balances = [1234, 2345, 3456, 4567]
     lending_swap._set_balances(balances)
@@ -152,6 +198,29 @@ def test_get_underlying_balances(
     assert registry_pool_info.get_pool_info(lending_swap)["underlying_balances"] == expected
 
 
+def test_get_balances_and_rates(registry, lending_swap, wrapped_coins):
+    lending_swap._set_balances([1234, 2345, 3456, 4567])
+    for i, coin in enumerate(wrapped_coins, start=1):
+        if hasattr(coin, "_set_exchange_rate"):
+            coin._set_exchange_rate(int(10**18 * ((100 + i) / 100)))
+
+    assert registry.get_balances_and_rates(lending_swap) == (
+        registry.get_balances(lending_swap),
+        registry.get_underlying_balances(lending_swap),
+        registry.get_rates(lending_swap),
+    )
+
+
+def test_get_balances_and_rates_gas(registry, lending_swap):
+    # each `estimate_gas` includes the 21000 base cost of a transaction
+    gas = registry.get_balances_and_rates.estimate_gas(lending_swap)
+    expected = sum(
+        getattr(registry, i).estimate_gas(lending_swap) - 21000
+        for i in ("get_balances", "get_underlying_balances", "get_rates")
+    )
+    assert gas - 21000 < expected
+
+
 def test_get_admin_balances(alice, registry, lending_swap, wrapped_coins, n_coins):
     assert registry.get_admin_balances(lending_swap) == [0] * 8
 
@@ -173,6 +173,32 @@ def test_get_underlying_balances(
     assert registry_pool_info.get_pool_info(meta_swap)["underlying_balances"] == expected
 
 
+def test_get_underlying_balances_subcalls(
+    alice, registry, swap, meta_swap, lp_token, n_coins, n_metacoins
+):
+    tx = registry.get_underlying_balances.transact(meta_swap, {"from": alice})
+    calls = [(i["to"], i["function"].split("(")[0]) for i in tx.subcalls]
+
+    # every balance is read once, `get_balances` is never called
+    assert calls.count((meta_swap.address, "balances")) == n_metacoins
+    assert calls.count((lp_token.address, "totalSupply")) == 1
+    assert calls.count((swap.address, "balances")) == n_coins
+    assert len(calls) == n_metacoins + n_coins + 1
+
+
+def test_get_balances_and_rates(alice, registry, swap, meta_swap, lp_token):
+    meta_swap._set_balances([1234, 2345, 3456, 4567])
+    swap._set_balances([5678, 6789, 7890, 8901])
+    swap._set_virtual_price(12345678, {"from": alice})
+    lp_token._mint_for_testing(alice, 10**4)
+
+    assert registry.get_balances_and_rates(meta_swap) == (
+        registry.get_balances(meta_swap),
+        registry.get_underlying_balances(meta_swap),
+        registry.get_rates(meta_swap),
+    )
+
+
 def test_get_admin_balances(alice, registry, meta_swap, meta_coins):
     assert registry.get_admin_balances(meta_swap) == [0] * 8
 
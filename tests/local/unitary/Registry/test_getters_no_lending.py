@@ -2,6 +2,7 @@ import itertools as it
 import math
 from collections import Counter, defaultdict
 
+import brownie
 import pytest
 
 from scripts.utils import pack_values
@@ -89,6 +90,39 @@ def test_get_balances(registry, registry_pool_info, swap, n_coins):
     assert pool_info["underlying_balances"] == expected
 
 
+def test_get_balances_unknown_pool(registry, lp_token):
+    with brownie.reverts():
+        registry.get_balances(lp_token)
+
+
+def test_get_balances_dynamic_array(
+    alice, registry, DynArrayPoolMock, ERC20, underlying_coins, underlying_decimals, n_coins
+):
+    # balances are read per coin, whatever the pool's own `get_balances` returns
+    coins = underlying_coins + [ZERO_ADDRESS] * (4 - n_coins)
+    pool = DynArrayPoolMock.deploy(n_coins, coins, {"from": alice})
+    token = ERC20.deploy("", "", 18, {"from": alice})
+    registry.add_pool_without_underlying(
+        pool,
+        n_coins,
+        token,
+        "0x00",
+        pack_values(underlying_decimals),
+        0,
+        False,
+        False,
+        "",
+        {"from": alice},
+    )
+
+    balances = [1234, 2345, 3456, 4567]
+    pool._set_balances(balances)
+
+    expected = balances[:n_coins] + [0] * (8 - n_coins)
+    assert registry.get_balances(pool) == expected
+    assert registry.get_underlying_balances(pool) == expected
+
+
 def test_get_admin_balances(alice, registry, swap, underlying_coins, n_coins):
     assert registry.get_admin_balances(swap) == [0] * 8
 
@@ -34,7 +34,7 @@ def test_set_liquidity_gauges(alice, registry, gauge_controller, liquidity_gauge
 def test_incorrect_gauge(LiquidityGaugeMock, alice, registry, gauge_controller, swap):
     gauge = LiquidityGaugeMock.deploy(swap, {"from": alice})
     gauges = [gauge] + [ZERO_ADDRESS] * 9
-    with brownie.reverts("dev: wrong token"):
+    with brownie.reverts(dev_revert_msg="dev: wrong token"):
         registry.set_liquidity_gauges(swap, gauges, {"from": alice})
 
 
@@ -43,7 +43,7 @@ def test_incorrect_gauge_multiple(
 ):
     gauge = LiquidityGaugeMock.deploy(swap, {"from": alice})
     gauges = [liquidity_gauge, gauge] + [ZERO_ADDRESS] * 8
-    with brownie.reverts("dev: wrong token"):
+    with brownie.reverts(dev_revert_msg="dev: wrong token"):
         registry.set_liquidity_gauges(swap, gauges, {"from": alice})
 
 
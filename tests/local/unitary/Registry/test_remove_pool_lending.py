@@ -77,6 +77,48 @@ def test_get_coin_indices(registry, lending_swap, underlying_coins, wrapped_coin
         registry.get_coin_indices(lending_swap, underlying_coins[send], underlying_coins[recv])
 
 
+@pytest.mark.itercoins("send", "recv")
+def test_get_coin_indices_readded(
+    alice,
+    registry,
+    lending_swap,
+    lp_token,
+    underlying_coins,
+    wrapped_coins,
+    wrapped_decimals,
+    n_coins,
+    is_v1,
+    rate_method_id,
+    send,
+    recv,
+):
+    # re-add as a pool where every coin uses rates, so there are no underlying coins
+    registry.add_pool_without_underlying(
+        lending_swap,
+        n_coins,
+        lp_token,
+        rate_method_id,
+        pack_values(wrapped_decimals),
+        pack_values([1] * n_coins),
+        hasattr(lending_swap, "initial_A"),
+        is_v1,
+        "",
+        {"from": alice},
+    )
+
+    assert registry.get_coin_indices(lending_swap, wrapped_coins[send], wrapped_coins[recv]) == (
+        send,
+        recv,
+        False,
+    )
+    if (
+        underlying_coins[send] != wrapped_coins[send]
+        or underlying_coins[recv] != wrapped_coins[recv]
+    ):
+        with brownie.reverts("No available market"):
+            registry.get_coin_indices(lending_swap, underlying_coins[send], underlying_coins[recv])
+
+
 @pytest.mark.once
 def test_get_balances(registry, lending_swap):
     with brownie.reverts():
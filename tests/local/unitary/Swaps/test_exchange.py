@@ -24,8 +24,8 @@ def registry(Registry, provider, gauge_controller, alice, swap, lp_token, n_coin
 
 
 @pytest.fixture(scope="module")
-def registry_swap(Swaps, alice, bob, registry, provider, swap, calculator, underlying_coins):
-    contract = Swaps.deploy(provider, calculator, {"from": alice})
+def registry_swap(Swaps, alice, bob, registry, swaps_provider, swap, calculator, underlying_coins):
+    contract = Swaps.deploy(swaps_provider, calculator, ZERO_ADDRESS, {"from": alice})
 
     for coin in underlying_coins:
         if coin == "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE":
@@ -35,9 +35,17 @@ def registry(
 
 @pytest.fixture(scope="module")
 def registry_swap(
-    Swaps, alice, bob, registry, provider, lending_swap, calculator, underlying_coins, wrapped_coins
+    Swaps,
+    alice,
+    bob,
+    registry,
+    swaps_provider,
+    lending_swap,
+    calculator,
+    underlying_coins,
+    wrapped_coins,
 ):
-    contract = Swaps.deploy(provider, calculator, {"from": alice})
+    contract = Swaps.deploy(swaps_provider, calculator, ZERO_ADDRESS, {"from": alice})
 
     for underlying, wrapped in zip(underlying_coins, wrapped_coins):
         if underlying == "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE":
@@ -37,9 +37,9 @@ def registry(
 
 @pytest.fixture(scope="module")
 def registry_swap(
-    Swaps, alice, bob, registry, provider, meta_swap, calculator, underlying_coins, meta_coins
+    Swaps, alice, bob, registry, swaps_provider, meta_swap, calculator, underlying_coins, meta_coins
 ):
-    contract = Swaps.deploy(provider, calculator, {"from": alice})
+    contract = Swaps.deploy(swaps_provider, calculator, ZERO_ADDRESS, {"from": alice})
 
     for coin in underlying_coins:
         if coin == "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE":
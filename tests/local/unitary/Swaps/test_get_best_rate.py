@@ -1,3 +1,4 @@
+import brownie
 import pytest
 from brownie import ETH_ADDRESS, ZERO_ADDRESS
 from brownie.exceptions import VirtualMachineError
@@ -55,11 +56,15 @@ def factory(pm, alice):
 
 
 @pytest.fixture(scope="module")
-def registry_swap(Swaps, alice, registry, provider, factory, calculator, underlying_coins):
-    contract = Swaps.deploy(provider, calculator, {"from": alice})
+def registry_swap(
+    Swaps, alice, registry, crypto_registry, provider, factory, calculator, underlying_coins
+):
+    contract = Swaps.deploy(provider, calculator, ZERO_ADDRESS, {"from": alice})
     provider.add_new_id(provider, "Filler", {"from": alice})
     provider.add_new_id(contract, "Pool Swaps", {"from": alice})
     provider.add_new_id(factory, "Factory", {"from": alice})
+    provider.add_new_id(provider, "Filler", {"from": alice})
+    provider.add_new_id(crypto_registry, "Crypto Registry", {"from": alice})
     contract.update_registry_address({"from": alice})
 
     for coin in underlying_coins:
@@ -140,3 +145,58 @@ def test_exchange_with_best_rate(
     )
 
     assert tx.events["TokenExchange"]["pool"] == best_swap
+
+
+@pytest.mark.params(n_coins=4)
+def test_get_best_rates(registry_swap, underlying_coins):
+    pairs = [(send, recv) for send in underlying_coins for recv in underlying_coins if send != recv]
+    pairs = [i for i in pairs for _ in range(2)]
+    amounts = [10**18, 10**17] * (len(pairs) // 2)
+
+    expected = [registry_swap.get_best_rate(*pair, amount) for pair, amount in zip(pairs, amounts)]
+    best_pools, max_dys = registry_swap.get_best_rates(pairs, amounts)
+
+    assert list(zip(best_pools, max_dys)) == expected
+
+
+@pytest.mark.params(n_coins=4)
+def test_get_best_rates_with_exclusion(registry_swap, swap1, underlying_coins):
+    pairs = [(send, recv) for send in underlying_coins for recv in underlying_coins if send != recv]
+    amounts = [10**18] * len(pairs)
+    exclude_list = [swap1] + [ZERO_ADDRESS] * 7
+
+    expected = [registry_swap.get_best_rate(*pair, 10**18, exclude_list) for pair in pairs]
+    best_pools, max_dys = registry_swap.get_best_rates(pairs, amounts, exclude_list)
+
+    assert list(zip(best_pools, max_dys)) == expected
+
+
+@pytest.mark.params(n_coins=4)
+def test_get_best_rates_length_mismatch(registry_swap, underlying_coins):
+    with brownie.reverts():
+        registry_swap.get_best_rates([underlying_coins[:2]] * 2, [10**18])
+
+
+@pytest.mark.params(n_coins=4)
+@pytest.mark.itercoins("send", "recv")
+def test_get_best_rate_curve(registry_swap, underlying_coins, send, recv):
+    send = underlying_coins[send]
+    recv = underlying_coins[recv]
+    amounts = [10**i for i in range(12, 21)]
+
+    expected = [registry_swap.get_best_rate(send, recv, amount) for amount in amounts]
+    best_pools, max_dys = registry_swap.get_best_rate_curve(send, recv, amounts)
+
+    assert list(zip(best_pools, max_dys)) == expected
+
+
+@pytest.mark.params(n_coins=4)
+def test_get_best_rate_curve_gas(registry_swap, underlying_coins):
+    send, recv = underlying_coins[:2]
+    amounts = [10**i for i in range(12, 22)]
+
+    get_best_rate = registry_swap.get_best_rate["address,address,uint256"]
+    get_best_rate_curve = registry_swap.get_best_rate_curve["address,address,uint256[]"]
+    gas = sum(get_best_rate.estimate_gas(send, recv, i) for i in amounts)
+
+    assert get_best_rate_curve.estimate_gas(send, recv, amounts) < gas
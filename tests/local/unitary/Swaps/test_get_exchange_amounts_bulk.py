@@ -0,0 +1,51 @@
+import pytest
+from brownie import ZERO_ADDRESS
+from synthetic_data import LADDERS
+
+pytestmark = pytest.mark.params(n_coins=4)
+
+
+@pytest.fixture(scope="module")
+def swap(PoolMockV2, underlying_coins, alice):
+    swap = PoolMockV2.deploy(
+        3, underlying_coins[:3] + [ZERO_ADDRESS], [ZERO_ADDRESS] * 4, 200, 4000000, {"from": alice}
+    )
+    swap._set_balances([10**24, 10**14, 10**12, 0], {"from": alice})
+    yield swap
+
+
+@pytest.fixture(scope="module")
+def registry(ERC20, Registry, provider, gauge_controller, alice, swap):
+    registry = Registry.deploy(provider, gauge_controller, {"from": alice})
+    provider.set_address(0, registry, {"from": alice})
+    token = ERC20.deploy("", "", 18, {"from": alice})
+    registry.add_pool_without_underlying(
+        swap, 3, token, "0x00", 0, 0, True, False, "", {"from": alice}
+    )
+
+    yield registry
+
+
+@pytest.fixture(scope="module")
+def registry_swap(Swaps, alice, registry, provider, calculator_v2):
+    yield Swaps.deploy(provider, calculator_v2, ZERO_ADDRESS, {"from": alice})
+
+
+@pytest.mark.parametrize("size", [1, 10, 100])
+def test_matches_fixed_size(registry_swap, swap, underlying_coins, size):
+    amounts = [i // 100 for i in LADDERS["geometric"][:size]]
+    send, recv = underlying_coins[:2]
+
+    expected = registry_swap.get_exchange_amounts(swap, send, recv, amounts + [0] * (100 - size))
+    assert registry_swap.get_exchange_amounts_bulk(swap, send, recv, amounts) == expected[:size]
+
+
+@pytest.mark.parametrize("size", [1, 10])
+def test_gas(registry_swap, swap, underlying_coins, size):
+    amounts = [i // 100 for i in LADDERS["geometric"][:size]]
+    send, recv = underlying_coins[:2]
+
+    gas = registry_swap.get_exchange_amounts.estimate_gas(
+        swap, send, recv, amounts + [0] * (100 - size)
+    )
+    assert registry_swap.get_exchange_amounts_bulk.estimate_gas(swap, send, recv, amounts) < gas
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scripts.pool_fetcher import PoolDataFetcher
+
+
+class _PoolDataHandler(BaseHTTPRequestHandler):
+    # keep-alive is required for the client to reuse pooled connections
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        time.sleep(server.latency)
+
+        if self.path == "/pools":
+            if not server.has_listing:
+                server.log_request_status(self.path, 404)
+                self._send(404, b"404: Not Found")
+                return
+            body = [{"name": k, "type": "dir"} for k in server.pools] + [
+                {"name": "README.md", "type": "file"}
+            ]
+        elif self.path.startswith("/pools/") and self.path.endswith("/pooldata.json"):
+            name = self.path.split("/")[2]
+            if name not in server.pools:
+                server.log_request_status(self.path, 404)
+                self._send(404, b"404: Not Found")
+                return
+            body = server.pools[name]
+        else:
+            self._send(400, b"")
+            return
+
+        body = json.dumps(body).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            server.log_request_status(self.path, 304)
+            self._send(304, b"", {"ETag": etag})
+        else:
+            server.log_request_status(self.path, 200)
+            self._send(200, body, {"ETag": etag, "Content-Type": "application/json"})
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class PoolDataServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the Github endpoints queried by `get_pool_data`.
+
+    Serves a directory listing at `/pools` (a 404 when `has_listing` is False) and
+    each entry of `pools` at `/pools/[POOL_NAME]/pooldata.json`, with `ETag` based
+    conditional requests.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _PoolDataHandler)
+        self.pools = {}
+        self.has_listing = True
+        self.latency = 0
+        self.requests = []
+        self.connections = set()
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def get_request(self):
+        request, client_address = super().get_request()
+        with self._lock:
+            self.connections.add(client_address)
+        return request, client_address
+
+    def log_request_status(self, path, status):
+        with self._lock:
+            self.requests.append((path, status))
+
+    def fetcher(self, **kwargs):
+        return PoolDataFetcher(
+            pools_url=f"{self.url}/pools",
+            pooldata_url=f"{self.url}/pools/{{}}/pooldata.json",
+            **kwargs,
+        )
+
+    def reset_stats(self):
+        with self._lock:
+            self.requests.clear()
+            self.connections.clear()
+
+
+def _pooldata(idx):
+    return {
+        "swap_address": f"0x{idx:040x}",
+        "lp_token_address": f"0x{idx + 1000:040x}",
+        "lp_contract": "CurveTokenV3",
+        "gauge_addresses": [],
+        "coins": [
+            {"name": f"TST{idx}", "decimals": 18, "underlying_address": f"0x{idx + 2000:040x}"},
+            {"name": f"TST{idx + 1}", "decimals": 6, "underlying_address": f"0x{idx + 3000:040x}"},
+        ],
+    }
+
+
+@pytest.fixture
+def pooldata_server():
+    server = PoolDataServer()
+    server.pools = {f"pool{i}": _pooldata(i) for i in range(20)}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
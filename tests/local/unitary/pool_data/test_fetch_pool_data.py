@@ -0,0 +1,151 @@
+import json
+import shutil
+import time
+
+import pytest
+
+from scripts.get_pool_data import get_pool_data
+
+
+def test_get_pools(pooldata_server):
+    with pooldata_server.fetcher() as fetcher:
+        names = fetcher.get_pool_names().data
+        results = fetcher.get_pools(names)
+
+    assert names == list(pooldata_server.pools)
+    assert {k: v.data for k, v in results.items()} == pooldata_server.pools
+    assert all(i.status == 200 for i in results.values())
+
+
+def test_conditional_request_not_modified(pooldata_server):
+    with pooldata_server.fetcher() as fetcher:
+        names = fetcher.get_pool_names().data
+        validators = {k: v.validators for k, v in fetcher.get_pools(names).items()}
+
+        pooldata_server.reset_stats()
+        results = fetcher.get_pools(names, validators)
+
+    assert all(i.not_modified and i.data is None for i in results.values())
+    assert all(status == 304 for _, status in pooldata_server.requests)
+
+
+def test_conditional_request_modified(pooldata_server):
+    with pooldata_server.fetcher() as fetcher:
+        names = fetcher.get_pool_names().data
+        validators = {k: v.validators for k, v in fetcher.get_pools(names).items()}
+
+        pooldata_server.pools["pool3"]["lp_contract"] = "CurveTokenV2"
+        results = fetcher.get_pools(names, validators)
+
+    assert results["pool3"].status == 200
+    assert results["pool3"].data["lp_contract"] == "CurveTokenV2"
+    assert results["pool3"].validators != validators["pool3"]
+    assert [k for k, v in results.items() if not v.not_modified] == ["pool3"]
+
+
+def test_missing_pool(pooldata_server):
+    with pooldata_server.fetcher() as fetcher:
+        result = fetcher.get_pools(["pool0", "unknown"])
+
+    assert result["pool0"].status == 200
+    assert result["unknown"].status == 404
+    assert result["unknown"].data is None
+
+
+def test_connections_are_reused(pooldata_server):
+    with pooldata_server.fetcher(max_workers=4) as fetcher:
+        fetcher.get_pools(list(pooldata_server.pools) * 3)
+
+    assert len(pooldata_server.requests) == 60
+    assert len(pooldata_server.connections) <= 4
+
+
+def test_concurrent_speedup(pooldata_server):
+    pooldata_server.latency = 0.05
+    names = list(pooldata_server.pools)
+
+    with pooldata_server.fetcher(max_workers=1) as fetcher:
+        start = time.perf_counter()
+        fetcher.get_pools(names)
+        sequential = time.perf_counter() - start
+
+    with pooldata_server.fetcher(max_workers=10) as fetcher:
+        start = time.perf_counter()
+        fetcher.get_pools(names)
+        concurrent = time.perf_counter() - start
+
+    assert sequential >= 0.05 * len(names)
+    assert concurrent < sequential / 4
+
+
+def test_get_pool_data(pooldata_server, tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    del pooldata_server.pools["pool7"]["swap_address"]
+
+    with pooldata_server.fetcher() as fetcher:
+        pool_data = get_pool_data(True, fetcher, path)
+
+    expected = {k: v for k, v in pooldata_server.pools.items() if k != "pool7"}
+    assert pool_data == expected
+    with path.open() as fp:
+        assert json.load(fp) == expected
+
+    # without `force_fetch` the local copy is used
+    pooldata_server.reset_stats()
+    with pooldata_server.fetcher() as fetcher:
+        assert get_pool_data(False, fetcher, path) == expected
+    assert pooldata_server.requests == []
+
+
+def test_refresh_only_downloads_changes(pooldata_server, tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    with pooldata_server.fetcher() as fetcher:
+        get_pool_data(True, fetcher, path)
+
+        pooldata_server.reset_stats()
+        pooldata_server.pools["pool11"]["gauge_addresses"] = [f"0x{1:040x}"]
+        pool_data = get_pool_data(True, fetcher, path)
+
+    assert pool_data["pool11"]["gauge_addresses"] == [f"0x{1:040x}"]
+    assert pool_data == pooldata_server.pools
+    assert sorted(i for i in pooldata_server.requests if i[1] == 200) == [
+        ("/pools/pool11/pooldata.json", 200)
+    ]
+
+
+def test_refresh_without_local_copy(pooldata_server, tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    with pooldata_server.fetcher() as fetcher:
+        get_pool_data(True, fetcher, path)
+        path.unlink()
+        shutil.rmtree(tmp_path.joinpath(".pooldata"))
+
+        pooldata_server.reset_stats()
+        assert get_pool_data(False, fetcher, path) == pooldata_server.pools
+
+    # validators are ignored when there is no previous data to fall back on
+    assert all(status == 200 for _, status in pooldata_server.requests)
+
+
+def test_missing_listing_uses_cache(pooldata_server, tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    with pooldata_server.fetcher() as fetcher:
+        get_pool_data(True, fetcher, path)
+
+        pooldata_server.has_listing = False
+        assert get_pool_data(True, fetcher, path) == pooldata_server.pools
+        assert ("/pools", 404) in pooldata_server.requests
+
+        # the cached listing is kept for the next refresh
+        pooldata_server.has_listing = True
+        pooldata_server.reset_stats()
+        assert get_pool_data(True, fetcher, path) == pooldata_server.pools
+        assert ("/pools", 304) in pooldata_server.requests
+
+
+def test_missing_listing_without_cache(pooldata_server, tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    pooldata_server.has_listing = False
+    with pooldata_server.fetcher() as fetcher:
+        with pytest.raises(ValueError, match="pool listing"):
+            get_pool_data(True, fetcher, path)
@@ -0,0 +1,140 @@
+import json
+
+from scripts.get_pool_data import get_pool_data
+from scripts.pool_cache import PoolDataCache
+
+
+def _cache(tmp_path):
+    return PoolDataCache(tmp_path.joinpath(".pooldata"))
+
+
+def test_cache_round_trip(tmp_path):
+    cache = _cache(tmp_path)
+    data_hash = cache.put("3pool", {"swap_address": "0x01"}, {"etag": '"abc"'})
+    cache.save()
+
+    cache = _cache(tmp_path)
+    assert cache.names() == ["3pool"]
+    assert cache.get("3pool") == {"swap_address": "0x01"}
+    assert cache.get_validators("3pool") == {"etag": '"abc"'}
+    assert cache.manifest["pools"]["3pool"]["hash"] == data_hash
+    assert tmp_path.joinpath(f".pooldata/objects/{data_hash}.json").exists()
+
+
+def test_identical_data_shares_object(tmp_path):
+    cache = _cache(tmp_path)
+    assert cache.put("a", {"x": 1, "y": 2}, {}) == cache.put("b", {"y": 2, "x": 1}, {})
+    assert len(list(tmp_path.joinpath(".pooldata/objects").iterdir())) == 1
+
+
+def test_corrupt_object(tmp_path):
+    cache = _cache(tmp_path)
+    data_hash = cache.put("3pool", {"swap_address": "0x01"}, {"etag": '"abc"'})
+    tmp_path.joinpath(f".pooldata/objects/{data_hash}.json").write_text("{")
+
+    assert cache.get("3pool") is None
+    assert cache.get_validators("3pool") == {}
+    assert cache.is_stale("3pool", max_age=3600)
+
+
+def test_refresh_populates_manifest(pooldata_server, tmp_path):
+    with pooldata_server.fetcher() as fetcher:
+        get_pool_data(True, fetcher, tmp_path.joinpath("pooldata.json"))
+
+    cache = _cache(tmp_path)
+    assert cache.names() == sorted(pooldata_server.pools)
+    assert cache.get_listing() == list(pooldata_server.pools)
+    for name, data in pooldata_server.pools.items():
+        entry = cache.manifest["pools"][name]
+        assert {"hash", "fetched_at", "etag"} <= set(entry)
+        assert cache.get(name) == data
+
+
+def test_refresh_prunes_replaced_objects(pooldata_server, tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    with pooldata_server.fetcher() as fetcher:
+        get_pool_data(True, fetcher, path)
+        old_hash = _cache(tmp_path).manifest["pools"]["pool4"]["hash"]
+
+        pooldata_server.pools["pool4"]["lp_contract"] = "CurveTokenV2"
+        del pooldata_server.pools["pool5"]
+        get_pool_data(True, fetcher, path)
+
+    cache = _cache(tmp_path)
+    assert "pool5" not in cache.names()
+    assert cache.get("pool4")["lp_contract"] == "CurveTokenV2"
+    assert not tmp_path.joinpath(f".pooldata/objects/{old_hash}.json").exists()
+    assert len(list(tmp_path.joinpath(".pooldata/objects").iterdir())) == 19
+
+
+def test_max_age_skips_fresh_entries(pooldata_server, tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    with pooldata_server.fetcher() as fetcher:
+        get_pool_data(True, fetcher, path)
+
+        pooldata_server.reset_stats()
+        assert get_pool_data(True, fetcher, path, max_age=3600) == pooldata_server.pools
+
+    # only the directory listing is requested
+    assert pooldata_server.requests == [("/pools", 304)]
+
+
+def test_load_selected_pools(pooldata_server, tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    with pooldata_server.fetcher() as fetcher:
+        get_pool_data(True, fetcher, path)
+
+    # objects for other pools are never read
+    cache = _cache(tmp_path)
+    for name in ("pool0", "pool1", "pool2"):
+        data_hash = cache.manifest["pools"][name]["hash"]
+        tmp_path.joinpath(f".pooldata/objects/{data_hash}.json").write_text("{")
+    path.write_text("{")
+
+    pooldata_server.reset_stats()
+    with pooldata_server.fetcher() as fetcher:
+        pool_data = get_pool_data(False, fetcher, path, pools=["pool8", "pool9"])
+
+    assert pool_data == {k: pooldata_server.pools[k] for k in ("pool8", "pool9")}
+    assert pooldata_server.requests == []
+
+
+def test_load_selected_pools_fetches_missing(pooldata_server, tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    with pooldata_server.fetcher() as fetcher:
+        pool_data = get_pool_data(False, fetcher, path, pools=["pool3", "unknown"])
+
+    assert pool_data == {"pool3": pooldata_server.pools["pool3"]}
+    assert sorted(pooldata_server.requests) == [
+        ("/pools/pool3/pooldata.json", 200),
+        ("/pools/unknown/pooldata.json", 404),
+    ]
+    assert not path.exists()
+
+
+def test_corrupt_pooldata_rebuilt_from_cache(pooldata_server, tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    with pooldata_server.fetcher() as fetcher:
+        get_pool_data(True, fetcher, path)
+        path.write_text('{"pool0": ')
+
+        pooldata_server.reset_stats()
+        assert get_pool_data(False, fetcher, path) == pooldata_server.pools
+
+    assert pooldata_server.requests == []
+    with path.open() as fp:
+        assert json.load(fp) == pooldata_server.pools
+
+
+def test_corrupt_entry_refetched_alone(pooldata_server, tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    with pooldata_server.fetcher() as fetcher:
+        get_pool_data(True, fetcher, path)
+        data_hash = _cache(tmp_path).manifest["pools"]["pool6"]["hash"]
+        tmp_path.joinpath(f".pooldata/objects/{data_hash}.json").write_text("{")
+        path.unlink()
+
+        pooldata_server.reset_stats()
+        assert get_pool_data(False, fetcher, path) == pooldata_server.pools
+
+    assert pooldata_server.requests == [("/pools/pool6/pooldata.json", 200)]
@@ -0,0 +1,77 @@
+import pytest
+from synthetic_data import synthetic_pooldata
+
+from scripts.pool_index import PoolDataIndex
+
+
+@pytest.fixture
+def pool_data():
+    return synthetic_pooldata(30)
+
+
+@pytest.fixture
+def loader(pool_data):
+    calls = []
+
+    def _loader(pools):
+        calls.append(pools)
+        if pools is None:
+            return pool_data
+        return {k: pool_data[k] for k in pools if k in pool_data}
+
+    _loader.calls = calls
+    return _loader
+
+
+def test_lazy_load(loader, pool_data):
+    index = PoolDataIndex(loader=loader)
+    assert not index.is_loaded
+    assert loader.calls == []
+
+    assert index["pool3"] == pool_data["pool3"]
+    assert index.is_loaded
+    assert len(index) == 30
+    assert list(index) == list(pool_data)
+    assert loader.calls == [None]
+
+
+def test_get_by_swap(loader, pool_data):
+    index = PoolDataIndex(loader=loader)
+    for name, data in pool_data.items():
+        assert index.get_by_swap(data["swap_address"]) == name
+        assert index.get_by_swap(data["swap_address"].upper()) == name
+    assert index.get_by_swap(f"0x{0:040x}") is None
+
+
+def test_get_by_lp_token(loader, pool_data):
+    index = PoolDataIndex(loader=loader)
+    for name, data in pool_data.items():
+        assert index.get_by_lp_token(data["lp_token_address"]) == name
+    assert index.get_by_lp_token(pool_data["pool0"]["swap_address"]) is None
+
+
+def test_get_metapools(loader):
+    index = PoolDataIndex(loader=loader)
+    assert index.get_metapools("pool10") == [f"pool{i}" for i in range(11, 20)]
+    assert index.get_metapools("pool11") == []
+
+
+def test_get_pools_for_coin(loader, pool_data):
+    index = PoolDataIndex(loader=loader)
+    lp_token = pool_data["pool20"]["lp_token_address"]
+    assert index.get_pools_for_coin(lp_token) == [f"pool{i}" for i in range(21, 30)]
+
+    coin = pool_data["pool5"]["coins"][0]["underlying_address"]
+    assert index.get_pools_for_coin(coin) == ["pool5"]
+
+
+def test_selected_pools_include_base_pool(loader):
+    index = PoolDataIndex(["pool13", "pool4"], loader=loader)
+    assert sorted(index) == ["pool0", "pool10", "pool13", "pool4"]
+    assert loader.calls == [["pool13", "pool4"], ["pool0", "pool10"]]
+
+
+def test_selected_pools_no_base_pool(loader):
+    index = PoolDataIndex(["pool0", "pool10"], loader=loader)
+    assert sorted(index) == ["pool0", "pool10"]
+    assert loader.calls == [["pool0", "pool10"]]
@@ -0,0 +1,94 @@
+import json
+import os
+
+import pytest
+from synthetic_data import synthetic_pooldata
+
+from scripts import get_pool_data as get_pool_data_module
+from scripts import pool_snapshot
+from scripts.get_pool_data import get_pool_data
+from scripts.pool_snapshot import read_snapshot, write_snapshot
+
+pytest.importorskip("msgpack")
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    with path.open("w") as fp:
+        json.dump(synthetic_pooldata(50), fp, sort_keys=True, indent=2)
+    return path
+
+
+@pytest.fixture
+def snapshot(tmp_path, source):
+    path = tmp_path.joinpath("pooldata.msgpack")
+    assert write_snapshot(synthetic_pooldata(50), path, source)
+    return path
+
+
+def test_round_trip(snapshot, source):
+    assert read_snapshot(snapshot, source) == synthetic_pooldata(50)
+
+
+def test_smaller_than_json(snapshot, source):
+    assert snapshot.stat().st_size < source.stat().st_size
+
+
+def test_missing(tmp_path, source):
+    assert read_snapshot(tmp_path.joinpath("missing.msgpack"), source) is None
+
+
+def test_stale_after_source_modified(snapshot, source):
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert read_snapshot(snapshot, source) is None
+
+
+@pytest.mark.parametrize("offset", [0, 4, 30, -1])
+def test_corrupt(snapshot, source, offset):
+    content = bytearray(snapshot.read_bytes())
+    content[offset] ^= 0xFF
+    snapshot.write_bytes(bytes(content))
+    assert read_snapshot(snapshot, source) is None
+
+
+def test_truncated(snapshot, source):
+    snapshot.write_bytes(snapshot.read_bytes()[:10])
+    assert read_snapshot(snapshot, source) is None
+
+
+def test_get_pool_data_prefers_snapshot(snapshot, source, monkeypatch):
+    def _load_json(path):
+        raise AssertionError("JSON should not be parsed")
+
+    monkeypatch.setattr(get_pool_data_module, "_load_json", _load_json)
+    assert get_pool_data(path=source) == synthetic_pooldata(50)
+
+
+def test_get_pool_data_writes_snapshot(pooldata_server, tmp_path):
+    path = tmp_path.joinpath("pooldata.json")
+    with pooldata_server.fetcher() as fetcher:
+        pool_data = get_pool_data(True, fetcher, path)
+
+    assert read_snapshot(tmp_path.joinpath("pooldata.msgpack"), path) == pool_data
+
+
+def test_get_pool_data_stale_snapshot(snapshot, source):
+    # an edited JSON takes precedence, and the snapshot is rewritten
+    pool_data = {"3pool": {"swap_address": "0x01", "coins": []}}
+    with source.open("w") as fp:
+        json.dump(pool_data, fp)
+
+    assert get_pool_data(path=source) == pool_data
+    assert read_snapshot(snapshot, source) == pool_data
+
+
+def test_without_msgpack(tmp_path, source, monkeypatch):
+    monkeypatch.setattr(pool_snapshot, "msgpack", None)
+    path = tmp_path.joinpath("pooldata.msgpack")
+
+    assert not write_snapshot({}, path, source)
+    assert not path.exists()
+    assert get_pool_data(path=source) == synthetic_pooldata(50)
+    assert not path.exists()
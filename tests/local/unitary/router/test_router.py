@@ -0,0 +1,130 @@
+import pytest
+
+from scripts.router import ZERO_ADDRESS, Hop, SwapGraph, find_best_route, find_routes
+
+COINS = ["A", "B", "C", "D", "E", "F"]
+
+
+def _hops(markets):
+    # markets are (pool, coin, coin, rate), quoted at a fixed rate in both directions
+    hops = []
+    rates = {}
+    for pool, coin_a, coin_b, rate in markets:
+        i, j = COINS.index(coin_a), COINS.index(coin_b)
+        hops += [Hop(pool, coin_a, coin_b, i, j, 1), Hop(pool, coin_b, coin_a, j, i, 1)]
+        rates[(pool, coin_a)] = rate
+        rates[(pool, coin_b)] = rate
+    return hops, lambda hop, amount: amount * rates[(hop.pool, hop.coin_in)] // 100
+
+
+def test_direct_route():
+    hops, quote = _hops([("p1", "A", "B", 99)])
+    route = find_best_route(hops, quote, "A", "B", 10**18)
+
+    assert route.coins == ["A", "B"]
+    assert route.amount_out == 99 * 10**16
+
+
+def test_prefers_better_multi_hop_route():
+    hops, quote = _hops(
+        [("p1", "A", "B", 90), ("p2", "A", "C", 99), ("p3", "C", "D", 99), ("p4", "D", "B", 99)]
+    )
+    routes = find_routes(hops, quote, "A", "B", 10**6, k=3)
+
+    assert [r.coins for r in routes] == [["A", "C", "D", "B"], ["A", "B"]]
+    assert routes[0].amount_out == 10**6 * 99**3 // 100**3
+
+
+def test_max_hops():
+    hops, quote = _hops(
+        [("p1", "A", "B", 50), ("p2", "B", "C", 99), ("p3", "C", "D", 99), ("p4", "D", "E", 99)]
+        + [("p5", "E", "F", 99), ("p6", "A", "E", 10)]
+    )
+
+    assert find_best_route(hops, quote, "A", "E", 10**6).coins == ["A", "B", "C", "D", "E"]
+    assert find_best_route(hops, quote, "A", "E", 10**6, max_hops=3).coins == ["A", "E"]
+    # five hops are needed to reach F without using p6
+    assert find_best_route(hops, quote, "A", "F", 10**6).coins == ["A", "E", "F"]
+
+    with pytest.raises(ValueError):
+        find_routes(hops, quote, "A", "F", 10**6, max_hops=5)
+
+
+def test_no_cycles_or_reused_pools():
+    hops, quote = _hops(
+        [("p1", "A", "B", 200), ("p2", "B", "C", 200), ("p1", "C", "D", 200), ("p3", "B", "D", 50)]
+    )
+    # p1 also trades C/D, so A -> B -> C -> D is not allowed
+    routes = find_routes(hops, quote, "A", "D", 10**6, k=5)
+
+    assert [r.coins for r in routes] == [["A", "B", "D"]]
+    for route in routes:
+        assert len(set(route.coins)) == len(route.coins)
+
+
+def test_unquotable_hops_are_skipped():
+    hops, quote = _hops([("p1", "A", "B", 99), ("p2", "A", "C", 99), ("p3", "C", "B", 99)])
+
+    def _quote(hop, amount):
+        if hop.pool == "p1":
+            raise ValueError
+        return quote(hop, amount)
+
+    assert find_best_route(hops, _quote, "A", "B", 10**6).coins == ["A", "C", "B"]
+
+
+def test_no_route():
+    hops, quote = _hops([("p1", "A", "B", 99), ("p2", "C", "D", 99)])
+
+    assert find_routes(hops, quote, "A", "D", 10**6) == []
+    with pytest.raises(ValueError, match="No available route"):
+        find_best_route(hops, quote, "A", "D", 10**6)
+
+
+def test_exchange_multiple_args():
+    hops, quote = _hops([("p1", "A", "B", 90), ("p2", "B", "C", 90)])
+    route = find_best_route(hops, quote, "C", "A", 10**6)
+
+    assert route.exchange_multiple_args() == (
+        ["C", "p2", "B", "p1", "A"] + [ZERO_ADDRESS] * 4,
+        [[2, 1, 1], [1, 0, 1], [0, 0, 0], [0, 0, 0]],
+        [ZERO_ADDRESS] * 4,
+    )
+
+
+def test_swap_graph():
+    hops, _ = _hops([("p1", "A", "B", 99), ("p2", "B", "C", 99), ("p3", "A", "C", 99)])
+    graph = SwapGraph(hops)
+
+    assert len(graph) == 6
+    assert graph.coins == ["A", "B", "C"]
+    assert graph.offsets == [0, 2, 4, 6]
+    for coin in COINS[:3]:
+        assert graph.get_hops(coin) == [i for i in hops if i.coin_in == coin]
+    for k, hop in enumerate(graph.hops):
+        assert graph.coins[graph.targets[k]] == hop.coin_out
+    assert graph.get_hops("D") == []
+
+
+def test_find_routes_with_swap_graph():
+    hops, quote = _hops(
+        [("p1", "A", "B", 90), ("p2", "A", "C", 99), ("p3", "C", "D", 99), ("p4", "D", "B", 99)]
+    )
+    graph = SwapGraph(hops)
+
+    for coin_in, coin_out in [("A", "B"), ("B", "C"), ("D", "A")]:
+        expected = find_routes(hops, quote, coin_in, coin_out, 10**6, k=3)
+        assert find_routes(graph, quote, coin_in, coin_out, 10**6, k=3) == expected
+    assert find_routes(graph, quote, "A", "F", 10**6) == []
+
+
+def test_get_distances():
+    hops, _ = _hops([("p1", "A", "B", 99), ("p2", "B", "C", 99), ("p3", "C", "D", 99)])
+    # one-way hop from E into A
+    hops.append(Hop("p4", "E", "A", 0, 1, 1))
+    graph = SwapGraph(hops)
+
+    distances = dict(zip(graph.coins, graph.get_distances("A")))
+    assert distances == {"A": 0, "B": 1, "C": 2, "D": 3, "E": 1}
+    distances = dict(zip(graph.coins, graph.get_distances("D", max_hops=2)))
+    assert distances == {"A": 3, "B": 2, "C": 1, "D": 0, "E": 3}
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+from synthetic_data import synthetic_pools
+
+from scripts import stableswap_math
+
+np = pytest.importorskip("numpy")
+from scripts.batch_quote import get_dy_batch  # noqa: E402
+
+
+def _args(pools):
+    return [list(i) for i in zip(*pools)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("rtol", [1e-6, 1e-9])
+def test_matches_scalar(seed, rtol):
+    pools = synthetic_pools(20, seed)
+    rng = random.Random(seed)
+    dx = sorted(int(10 ** rng.uniform(9, 25)) for _ in range(50))
+
+    result = get_dy_batch(*_args(pools), [0, 1], [1, 0], dx, rtol=rtol)
+    assert result.dy.shape == result.exact.shape == (20, 2, 50)
+
+    for p, pool in enumerate(pools):
+        for q, (i, j) in enumerate([(0, 1), (1, 0)]):
+            expected = np.array(stableswap_math.get_dy(*pool, i, j, dx), dtype=float)
+            assert np.allclose(result.dy[p, q], expected, rtol=rtol, atol=0)
+            for a in np.nonzero(result.exact[p, q])[0]:
+                assert result.dy[p, q, a] == expected[a]
+
+
+def test_pool_specific_pairs_and_amounts():
+    pools = synthetic_pools(3, 42)
+    i = [[0, 1], [1, 0], [1, 0]]
+    j = [[1, 0], [0, 1], [0, 1]]
+    dx = [[[10**18 * (p + q + a + 1) for a in range(4)] for q in range(2)] for p in range(3)]
+
+    result = get_dy_batch(*_args(pools), i, j, dx)
+    for p, pool in enumerate(pools):
+        for q in range(2):
+            expected = stableswap_math.get_dy(*pool, i[p][q], j[p][q], dx[p][q])
+            expected = np.array(expected, dtype=float)
+            assert np.allclose(result.dy[p, q], expected, rtol=1e-9, atol=0)
+
+
+def test_zero_amount():
+    result = get_dy_batch(*_args(synthetic_pools(2, 1)), [0], [1], [0, 10**18, 0])
+    assert (result.dy[..., 0] == 0).all()
+    assert (result.dy[..., 2] == 0).all()
+    assert not result.exact[..., 0].any()
+    assert (result.dy[..., 1] > 0).all()
+
+
+def test_small_trades_exact():
+    pools = [
+        (
+            2,
+            [10**24, 10**24] + [0] * 6,
+            200,
+            4000000,
+            [10**18] * 2 + [0] * 6,
+            [1, 1] + [0] * 6,
+        ),
+        (3, [10**24] * 3 + [0] * 5, 2000, 0, [10**18] * 3 + [0] * 5, [1, 1, 1] + [0] * 5),
+    ]
+    dx = [1, 10, 1000]
+    result = get_dy_batch(*_args(pools), [1], [0], dx)
+
+    assert result.exact.all()
+    for p, pool in enumerate(pools):
+        assert result.dy[p, 0].tolist() == stableswap_math.get_dy(*pool, 1, 0, dx)
+
+
+def test_not_converged_fallback():
+    pools = synthetic_pools(4, 3)
+    dx = [10**18, 10**21, 10**24]
+    result = get_dy_batch(*_args(pools), [0], [1], dx, max_iter=0)
+
+    assert result.exact.all()
+    for p, pool in enumerate(pools):
+        expected = stableswap_math.get_dy(*pool, 0, 1, dx)
+        assert result.dy[p, 0].tolist() == [float(i) for i in expected]
+
+
+@pytest.mark.parametrize("idx", [(0, 0), (0, 8), (-1, 0)])
+def test_invalid_index(idx):
+    with pytest.raises(ValueError):
+        get_dy_batch(*_args(synthetic_pools(2, 1)), [idx[0]], [idx[1]], [10**18])